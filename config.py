@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +12,30 @@ class Settings(BaseSettings):
     db_port: str
     db_name: str
 
+    # optional, sizes the connection pool held by each process
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # optional, selects the backend and worker count of each stage
+    import_executor: Literal["thread", "process", "asyncio"] = "process"
+    import_workers: int | None = None
+    script_workers: int = 4
+
+    # optional, tunes the indexing and analyzing of staging tables after the imports
+    maintenance_work_mem: str = "512MB"
+    index_workers: int = 4
+
+    # optional, loads every period file matching the BHCF prefix instead of the first one
+    bhcf_backfill: bool = False
+
+    # optional, paces the workers pulling tasks from the task queue
+    queue_poll_interval: float = 5.0
+    queue_task_timeout: int = 4 * 60 * 60
+    queue_heartbeat_interval: float = 60.0
+
     class Config:
         env_file = ".env"
 
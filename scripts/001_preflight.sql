@@ -1,21 +1,14 @@
 drop table if exists transformations.tmp_addresses;
-drop table if exists transformations.tmp_attributes;
-drop table if exists transformations.tmp_bhcf;
 drop table if exists transformations.tmp_cds;
 drop table if exists transformations.tmp_codes;
-drop table if exists transformations.tmp_country_codes;
-drop table if exists transformations.tmp_county_codes;
 drop table if exists transformations.tmp_dates;
 drop table if exists transformations.tmp_ids;
 drop table if exists transformations.tmp_inds;
 drop table if exists transformations.tmp_inst;
 drop table if exists transformations.tmp_inst_relationships;
 drop table if exists transformations.tmp_inst_transformations;
-drop table if exists transformations.tmp_naics;
 drop table if exists transformations.tmp_place_codes;
-drop table if exists transformations.tmp_relationships;
-drop table if exists transformations.tmp_state_codes;
-drop table if exists transformations.tmp_transformations;
 
-drop function if exists col_w_whitespace;
-drop function if exists rm_col_whitespace;
\ No newline at end of file
+drop function if exists transformations.call_report_partition;
+drop function if exists transformations.profile_columns;
+drop function if exists transformations.rm_col_whitespace;
\ No newline at end of file
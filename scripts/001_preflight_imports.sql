@@ -0,0 +1,18 @@
+/*
+ * Drops the imported staging tables
+ *
+ * DESCRIPTION:
+ * Imported staging tables persist between runs so that incremental runs can skip files
+ * whose fingerprint matches transformations.import_manifest. A full run drops them
+ * before importing, an incremental run leaves them for the import handler to replace.
+ *
+ * */
+
+drop table if exists transformations.tmp_attributes cascade;
+drop table if exists transformations.tmp_bhcf cascade;
+drop table if exists transformations.tmp_country_codes;
+drop table if exists transformations.tmp_county_codes;
+drop table if exists transformations.tmp_naics;
+drop table if exists transformations.tmp_relationships;
+drop table if exists transformations.tmp_state_codes;
+drop table if exists transformations.tmp_transformations;
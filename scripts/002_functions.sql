@@ -14,11 +14,15 @@ set search_path = 'transformations';
 
 /*
  * DESCRIPTION:
- * Dynamic sql function returning a list of column in a specified table that contains whitespace where it is not expected.
+ * Dynamic sql function profiling every column of a specified table in a single scan.
  * 
  * INTENT:
- * - Output == columns that contain whitespace where we do not expect given a specified table.
- * - Limited to data type varchar
+ * - Output == one row per column with its row, null, whitespace padded and zero counts,
+ *   a distinct estimate and the min and max length of its values.
+ * - One aggregate query is generated for all columns, so a wide table is read once rather than once per column.
+ * - Whitespace counts are limited to text columns and zero counts to text and numeric columns.
+ * - The distinct estimate is read from pg_stats after the table is analyzed.
+ * - Every row is also inserted into transformations.column_profiles.
  * 
  * INPUT:
  * - [input_schema_table_name] == [table_schema].[table_name]
@@ -28,52 +32,124 @@ set search_path = 'transformations';
  * */
 
 
-create or replace function col_w_whitespace(input_schema_table_name text)
-returns table(column_name text,record_count int) as $$
-declare 
-	input_table_name text;
+create or replace function profile_columns(input_schema_table_name text)
+returns table(
+	column_name text,
+	data_type text,
+	row_count bigint,
+	null_count bigint,
+	whitespace_count bigint,
+	zero_count bigint,
+	distinct_estimate bigint,
+	min_length int,
+	max_length int
+) as $$
+declare
 	input_schema text;
 	input_table text;
-	input_data_type text;	
-	sql_query text;	
 	rec record;
-	result_count int;	
-	
+	col_index int := 0;
+	aggregates text[] := array[]::text[];
+	col_rows text[] := array[]::text[];
+	sql_query text;
+
 begin
 	input_schema := split_part(input_schema_table_name,'.',1);
 	input_table := split_part(input_schema_table_name,'.',2);
-	input_data_type := 'character varying';	
 
 	raise notice 'table_schema: %',input_schema;
 	raise notice 'table: %',input_table;
-	raise notice 'data_type: %', input_data_type;
 
-	for rec in 
-		select cols.column_name
+	execute format('analyze %I.%I', input_schema, input_table);
+
+	for rec in
+		select cols.column_name, cols.data_type
 		from information_schema.columns cols
-		where 
+		where
 			cols.table_schema = input_schema
-		and 
+		and
 			cols.table_name = input_table
-		and 
-			cols.data_type = input_data_type
+		order by cols.ordinal_position
 	loop
-		raise notice  'Column name: %', rec.column_name;
-		sql_query := format(
-			'select count(*) from %I where length(%I) <> length(trim(%I))',
-			input_table,
+		col_index := col_index + 1;
+		aggregates := aggregates || format(
+			'count(*) filter (where %1$I is null) as n%2$s, %3$s as w%2$s, %4$s as z%2$s, '
+			|| 'min(length(%1$I::text)) as lo%2$s, max(length(%1$I::text)) as hi%2$s',
 			rec.column_name,
-			rec.column_name
+			col_index,
+			case
+				when rec.data_type in ('character varying', 'character', 'text')
+				then format('count(*) filter (where %1$I <> trim(%1$I))', rec.column_name)
+				else 'null::bigint'
+			end,
+			case
+				when rec.data_type in ('character varying', 'character', 'text')
+				then format('count(*) filter (where %1$I = ''0'')', rec.column_name)
+				when rec.data_type in ('smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision')
+				then format('count(*) filter (where %1$I = 0)', rec.column_name)
+				else 'null::bigint'
+			end
+		);
+		col_rows := col_rows || format(
+			'(%1$L, %2$L, s.n%3$s, s.w%3$s, s.z%3$s, s.lo%3$s, s.hi%3$s)',
+			rec.column_name,
+			rec.data_type,
+			col_index
 		);
-		execute sql_query into result_count;
-		if result_count > 0 then
-			raise notice 'column: %s',rec.column_name;
-			raise notice 'record_count: %s', result_count;
-			return query select rec.column_name::text, result_count;
-		end if;
 	end loop;
-	return;
-end; 
+
+	if col_index = 0 then
+		raise notice 'no columns found';
+		return;
+	end if;
+
+	sql_query := format(
+		'insert into transformations.column_profiles
+			(table_schema, table_name, column_name, data_type, row_count, null_count,
+			whitespace_count, zero_count, distinct_estimate, min_length, max_length)
+		select %1$L, %2$L, v.column_name, v.data_type, s.row_count, v.null_count,
+			v.whitespace_count, v.zero_count,
+			(
+				select case
+					when st.n_distinct < 0 then round((-st.n_distinct * s.row_count)::numeric)::bigint
+					else st.n_distinct::bigint
+				end
+				from pg_stats st
+				where st.schemaname = %1$L and st.tablename = %2$L and st.attname = v.column_name
+				order by st.inherited desc
+				limit 1
+			),
+			v.min_length, v.max_length
+		from (select count(*) as row_count, %3$s from %1$I.%2$I) s
+		cross join lateral (values %4$s)
+			v(column_name, data_type, null_count, whitespace_count, zero_count, min_length, max_length)',
+		input_schema,
+		input_table,
+		array_to_string(aggregates, ', '),
+		array_to_string(col_rows, ', ')
+	);
+	execute sql_query;
+
+	return query
+	select
+		cp.column_name::text,
+		cp.data_type::text,
+		cp.row_count,
+		cp.null_count,
+		cp.whitespace_count,
+		cp.zero_count,
+		cp.distinct_estimate,
+		cp.min_length,
+		cp.max_length
+	from transformations.column_profiles cp
+	where
+		cp.table_schema = input_schema
+	and
+		cp.table_name = input_table
+	and
+		cp.profiled_at = now()
+	order by cp.id;
+end;
 $$ language plpgsql;
 
 
@@ -125,4 +201,41 @@ begin
 		
 	return;
 end; $$
-language plpgsql;
\ No newline at end of file
+language plpgsql;
+
+
+/*
+ * DESCRIPTION:
+ * Creates the call_reports partition of the quarter a reporting period falls in.
+ * 
+ * INTENT:
+ * - Output == name of the partition, call_reports_[year]q[quarter].
+ * - Partitions span a calendar quarter, [first day of the quarter, first day of the next quarter).
+ * - Existing partitions are left as they are, so the function can be called for every staged period.
+ * 
+ * INPUT:
+ * - reporting_pd == any date of the quarter
+ * - example == '2024-06-30'
+ * 
+ * */
+
+
+create or replace function call_report_partition(reporting_pd date)
+returns text as $$
+declare
+	period_start date := date_trunc('quarter', reporting_pd)::date;
+	partition_name text := format(
+		'call_reports_%sq%s',
+		extract(year from period_start),
+		extract(quarter from period_start)
+	);
+begin
+	execute format(
+		'create table if not exists transformations.%I partition of transformations.call_reports for values from (%L) to (%L)',
+		partition_name,
+		period_start,
+		(period_start + interval '3 months')::date
+	);
+	return partition_name;
+end; $$
+language plpgsql;
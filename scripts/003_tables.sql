@@ -189,10 +189,184 @@ title varchar(255)
 ) ;
 
 
+/*
+ * call reports
+ *
+ * partitioned by quarter on reporting_pd, see call_report_partition in functions.sql, so a
+ * quarter is reloaded by truncating its partition and period filters only read their quarters
+ *
+ * a call_reports heap table left by an earlier version is renamed, its rows are moved into the
+ * partitions of their quarters and it is dropped
+ *
+*/
+do $$
+begin
+	if exists (
+		select 1
+		from pg_class c
+		join pg_namespace n on n.oid = c.relnamespace
+		where n.nspname = 'transformations' and c.relname = 'call_reports' and c.relkind = 'r'
+	) then
+		alter table transformations.call_reports rename to call_reports_unpartitioned;
+		alter table transformations.call_reports_unpartitioned rename constraint call_reports_pkey to call_reports_unpartitioned_pkey;
+		alter sequence if exists transformations.call_reports_id_seq rename to call_reports_unpartitioned_id_seq;
+		drop index if exists transformations.call_reports_rssd_id_reporting_pd_key;
+	end if;
+end $$;
+
+-- natural key of a filing, the partition key has to be part of it
 create table if not exists transformations.call_reports(
+id serial,
+rssd_id int not null,
+reporting_pd date not null,
+tot_assets decimal (20,4),
+primary key (rssd_id, reporting_pd)
+) partition by range (reporting_pd);
+
+do $$
+begin
+	if to_regclass('transformations.call_reports_unpartitioned') is not null then
+		perform transformations.call_report_partition(pd)
+		from (
+			select distinct date_trunc('quarter', reporting_pd)::date pd
+			from transformations.call_reports_unpartitioned
+			where reporting_pd is not null
+		) periods;
+
+		insert into transformations.call_reports (rssd_id, reporting_pd, tot_assets)
+		select distinct on (rssd_id, reporting_pd) rssd_id, reporting_pd, tot_assets
+		from transformations.call_reports_unpartitioned
+		where rssd_id is not null and reporting_pd is not null
+		order by rssd_id, reporting_pd, id desc;
+
+		drop table transformations.call_reports_unpartitioned;
+	end if;
+end $$;
+
+
+
+/*
+ * import manifest
+ *
+ * one row per successful file load, the latest row for a file and table is compared against
+ * the file's fingerprint to skip unchanged files on incremental runs
+ *
+ * elapsed_ms is the file's share of the wall time of its table's load, by file size, and
+ * predicts the cost of later loads for the import scheduler
+ *
+*/
+create table if not exists transformations.import_manifest(
+id serial primary key,
+file_path text not null,
+file_size bigint not null,
+file_mtime timestamptz not null,
+content_hash varchar(64) not null,
+table_schema varchar(63) not null,
+table_name varchar(63) not null,
+row_count bigint not null,
+elapsed_ms numeric(14,3) null,
+loaded_at timestamptz not null default now()
+);
+
+alter table transformations.import_manifest add column if not exists elapsed_ms numeric(14,3) null;
+
+create index if not exists import_manifest_file_table_idx
+on transformations.import_manifest (file_path, table_schema, table_name, loaded_at desc);
+
+
+/*
+ * script metrics
+ *
+ * one row per executed statement, rows sharing a run_id belong to one execution of the pipeline
+ *
+*/
+create table if not exists transformations.script_metrics(
+id serial primary key,
+run_id varchar(32) not null,
+script varchar(255) not null,
+statement_index int not null,
+statement_hash varchar(64) not null,
+"statement" text not null,
+started_at timestamptz not null,
+elapsed_ms numeric(14,3) not null,
+row_count bigint null,
+error text null
+);
+
+create index if not exists script_metrics_hash_idx
+on transformations.script_metrics (statement_hash, started_at);
+
+
+/*
+ * run ledger
+ *
+ * one row per stage or script completed by a run, a resumed run skips the scripts recorded
+ * under its run_id whose fingerprint still matches
+ *
+*/
+create table if not exists transformations.run_ledger(
+id serial primary key,
+run_id varchar(32) not null,
+stage varchar(63) not null,
+item varchar(255) not null,
+fingerprint varchar(64) null,
+finished_at timestamptz not null default now()
+);
+
+create index if not exists run_ledger_run_stage_idx
+on transformations.run_ledger (run_id, stage);
+
+
+/*
+ * task queue
+ *
+ * one row per import, index or script task of a queued run, workers claim pending tasks whose
+ * dependencies are done with for update skip locked, so any number of them can share the queue
+ *
+*/
+create table if not exists transformations.task_queue(
+id serial primary key,
+run_id varchar(32) not null,
+stage varchar(63) not null,
+task varchar(255) not null,
+depends_on text[] not null default '{}',
+options jsonb not null default '{}',
+status varchar(10) not null default 'pending',
+worker varchar(255) null,
+attempts int not null default 0,
+enqueued_at timestamptz not null default now(),
+claimed_at timestamptz null,
+finished_at timestamptz null,
+error text null,
+unique (run_id, task)
+);
+
+create index if not exists task_queue_status_idx
+on transformations.task_queue (status, id);
+
+
+/*
+ * column profiles
+ *
+ * one row per column each time a staging table is profiled with profile_columns, rows sharing
+ * a table and profiled_at belong to one profile
+ *
+*/
+create table if not exists transformations.column_profiles(
 id serial primary key,
-rssd_id int null,
-reporting_pd date null,
-tot_assets decimal (20,4)
+table_schema varchar(63) not null,
+table_name varchar(63) not null,
+column_name varchar(63) not null,
+data_type varchar(63) not null,
+row_count bigint not null,
+null_count bigint not null,
+whitespace_count bigint null,
+zero_count bigint null,
+distinct_estimate bigint null,
+min_length int null,
+max_length int null,
+profiled_at timestamptz not null default now()
 );
 
+create index if not exists column_profiles_table_idx
+on transformations.column_profiles (table_schema, table_name, profiled_at desc);
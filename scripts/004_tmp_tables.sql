@@ -133,3 +133,11 @@ transformation_cd int null,
 acct_method varchar(100) null,
 acct_method_cd int null
 ) ;
+
+
+create table if not exists transformations.tmp_codes(
+code_set varchar(50) not null,
+cd varchar(10) not null,
+description varchar(255) not null,
+primary key (code_set, cd)
+);
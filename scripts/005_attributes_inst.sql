@@ -18,21 +18,12 @@ set search_path = 'transformations';
 
 
 /* 
- * Removing whitespace that is most likely the result of forced with columns with the char in the data source.
+ * Surrounding whitespace, the 0 reported for unknown values and short fiscal year ends are
+ * cleansed while the attributes are imported, see ATTRIBUTE_CLEANSING in src/constants/imports.py.
  * 
- * Since there are several column in this state, a reusable function that will dynamicall do this on loop was implemented.
- * 
- * Address fields were intentionally excluded from the rm_col_whitespace cleaning to ensure no dependencies exists between this file and the loading of addresses
- *  
  * */
 
 
-select	*
-from
-	rm_col_whitespace('tmp_attributes',
-	array['nm_short','nm_lgl','act_prim_cd']);
-
-
 /* inserting into a tmp table that mirrors the production table */
 
 
@@ -58,25 +49,6 @@ select
 from tmp_attributes att;
 
 
-/*
- * In applicable values or when a value is not known is reported as 0.
- * These values are being set to null for exclusion in lookups and indexing if indexes are planed to be added later.
- * Only applicable conlumns to this script file was handled here.
- * 
- * */
-
-
-update tmp_inst set website_url = null where website_url = '0';
-update tmp_inst set primary_naics = null where primary_naics = '0';
-update tmp_inst set rssd_id_hd_off = null where rssd_id_hd_off = 0;
-update tmp_inst set fiscal_year_end = null where fiscal_year_end = '0';
-
-
-update tmp_inst
-set fiscal_year_end = lpad(fiscal_year_end,4,'0')
-where length(fiscal_year_end) <4;
-
-
 update tmp_inst 
 set entity_type =
 case 
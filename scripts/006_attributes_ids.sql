@@ -10,6 +10,9 @@
  * - execution of tmp_tables.sql
  * - setting search_path = 'transformations'
  *
+ * The 0 reported for unknown identifiers is set to null while the attributes are imported,
+ * see ATTRIBUTE_CLEANSING in src/constants/imports.py.
+ *
  * */
 set
 	search_path = 'transformations';
@@ -40,71 +43,3 @@ select
 	id_occ
 from
 	tmp_attributes att;
-
-/*
- * In applicable values or when a value is not known is reported as 0.
- * These values are being set to null for exclusion in lookups and indexing if indexes are planed to be added later.
- * 
- * */
-update
-	tmp_ids
-set
-	tin = null
-where
-	tin = '0';
-
-update
-	tmp_ids
-set
-	prim_aba_num = null
-where
-	prim_aba_num = '0';
-
-update
-	tmp_ids
-set
-	lei = null
-where
-	lei = '0';
-
-update
-	tmp_ids
-set
-	fdic_cert_id = null
-where
-	fdic_cert_id = 0;
-
-update
-	tmp_ids
-set
-	ncua_id = null
-where
-	ncua_id = 0;
-
-update
-	tmp_ids
-set
-	thrift_hc_id = null
-where
-	thrift_hc_id = '0';
-
-update
-	tmp_ids
-set
-	thrift_id = null
-where
-	thrift_id = 0;
-
-update
-	tmp_ids
-set
-	cusip_id = null
-where
-	cusip_id = '0';
-
-update
-	tmp_ids
-set
-	occ_id = null
-where
-	occ_id = '0';
\ No newline at end of file
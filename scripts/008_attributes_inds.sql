@@ -8,6 +8,7 @@
  * - loading of FFIEC attributes
  * - execution of tables.sql
  * - execution of tmp_tables.sql
+ * - loading of the code dictionary into tmp_codes
  * - setting search_path = 'transformations'
  *
  * */
@@ -19,95 +20,72 @@ set search_path = 'transformations';
 /* inserting data into a tmp table that mirrors the production target table */
 
 
-insert
-	into
-	tmp_inds (rssd_id,
+/*
+ * Indicators are reported in integer values.
+ * Column to store the descriptive values for the codes were created for analytical and reporting purposes.
+ * Descriptions are translated with the code dictionary in tmp_codes, see src/constants/codes.py,
+ * in a single join pass so the tmp table is written once.
+ * 
+ * Note: 0 is defined as inapplicable and has no entry in the dictionary, so it is translated to a null value
+ * */
+
+
+insert into tmp_inds (
+	rssd_id,
 	bnk_holding_co_ind_cd,
+	bnk_holding_co_ind,
 	domestic_ind_cd,
 	financial_sub_ind_cd,
+	financial_sub_ind,
 	fhc_ind_cd,
+	fhc_ind,
 	fhlbs_mbr_ind_cd,
+	fhlbs_mbr_ind,
 	int_hc_ind_cd,
+	int_hc_ind,
 	intl_bnk_fac_ind_cd,
+	intl_bnk_fac_ind,
 	sav_loan_hc_ind_cd,
-	fbo_4c9_ind)
-select
-	id_rssd,
-	bhc_ind,
-	domestic_ind,
-	fncl_sub_holder,
-	fhc_ind,
-	mbr_fhlbs_ind,
-	ihc_ind,
-	ibf_ind,
-	slhc_ind,
+	sav_loan_hc_ind,
 	fbo_4c9_ind
-from tmp_attributes;
-
-
-/*
- * Indicators are reported in integer values.
- * Column to store the descriptive values for the codes were created for analytical and reporting purposes.
- * The following section includes the update statements for this translation.
- * 
- * Note: 0 is defined as inapplicable and this was translated to a null value
- * */
-
-
-update tmp_inds
-set bnk_holding_co_ind =  
-case 
-	when bnk_holding_co_ind_cd = 1 then 'Entity is a BHC'
-	when bnk_holding_co_ind_cd = 2 then 'Entity is not a BHC but it directly or indirectly controls a grandfathered non-bank bank'
-end
-where bnk_holding_co_ind_cd <> 0 ;
-
-
-update tmp_inds
-set financial_sub_ind =
-case 
-when financial_sub_ind_cd = 1 then 'Holds one or more financial subsidiaries'
-	when financial_sub_ind_cd = 2 then 'Other'
-end
-where financial_sub_ind_cd <> 0;
-
-
-update tmp_inds
-set fhc_ind =
-case 
-	when fhc_ind_cd = 1 then 'Entity is an FHC'
-	when fhc_ind_cd = 2 then 'Entity is an SLHC which has been designated an FHC'
-end
-where fhc_ind_cd <> 0;
-
-
-update tmp_inds
-set fhlbs_mbr_ind =
-case 
-	when fhlbs_mbr_ind_cd = 1 then 'Member'
-end
-where fhlbs_mbr_ind_cd <> 0;
-
-
-update tmp_inds
-set int_hc_ind =
-case 
-	when int_hc_ind_cd = 1 then 'Entity is an IHC'
-end
-where int_hc_ind_cd <> 0;
-
-
-update tmp_inds
-set intl_bnk_fac_ind =
-case 
-	when intl_bnk_fac_ind_cd = 1 then 'Entity operates an IBF'
-end
-where intl_bnk_fac_ind_cd <> 0;
-
-
-update tmp_inds
-set sav_loan_hc_ind =
-case 
-	when sav_loan_hc_ind_cd = 1 then 'Entity is a savings and loan holding company'
-end
-where sav_loan_hc_ind_cd <> 0;
+)
+select
+	att.id_rssd,
+	att.bhc_ind,
+	bnk_holding_co_ind.description,
+	att.domestic_ind,
+	att.fncl_sub_holder,
+	financial_sub_ind.description,
+	att.fhc_ind,
+	fhc_ind.description,
+	att.mbr_fhlbs_ind,
+	fhlbs_mbr_ind.description,
+	att.ihc_ind,
+	int_hc_ind.description,
+	att.ibf_ind,
+	intl_bnk_fac_ind.description,
+	att.slhc_ind,
+	sav_loan_hc_ind.description,
+	att.fbo_4c9_ind
+from tmp_attributes att
+left join tmp_codes bnk_holding_co_ind
+	on bnk_holding_co_ind.code_set = 'bnk_holding_co_ind'
+	and bnk_holding_co_ind.cd = att.bhc_ind::int::varchar
+left join tmp_codes financial_sub_ind
+	on financial_sub_ind.code_set = 'financial_sub_ind'
+	and financial_sub_ind.cd = att.fncl_sub_holder::int::varchar
+left join tmp_codes fhc_ind
+	on fhc_ind.code_set = 'fhc_ind'
+	and fhc_ind.cd = att.fhc_ind::int::varchar
+left join tmp_codes fhlbs_mbr_ind
+	on fhlbs_mbr_ind.code_set = 'fhlbs_mbr_ind'
+	and fhlbs_mbr_ind.cd = att.mbr_fhlbs_ind::int::varchar
+left join tmp_codes int_hc_ind
+	on int_hc_ind.code_set = 'int_hc_ind'
+	and int_hc_ind.cd = att.ihc_ind::int::varchar
+left join tmp_codes intl_bnk_fac_ind
+	on intl_bnk_fac_ind.code_set = 'intl_bnk_fac_ind'
+	and intl_bnk_fac_ind.cd = att.ibf_ind::int::varchar
+left join tmp_codes sav_loan_hc_ind
+	on sav_loan_hc_ind.code_set = 'sav_loan_hc_ind'
+	and sav_loan_hc_ind.cd = att.slhc_ind::int::varchar;
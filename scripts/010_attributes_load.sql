@@ -18,6 +18,13 @@
  * */
 
 
+/*
+ * the tmp tables were filled by the attribute scripts after the staging tables were analyzed,
+ * fresh statistics keep the planner from choosing nested loops over them
+ * */
+analyze transformations.tmp_inst, transformations.tmp_ids, transformations.tmp_dates, transformations.tmp_inds, transformations.tmp_cds;
+
+
 /* 
  * insert / update on conflict institution data
  * 
@@ -8,6 +8,7 @@
  * - loading of FFIEC transformations
  * - execution of tables.sql
  * - execution of tmp_tables.sql
+ * - loading of the code dictionary into tmp_codes
  * - setting search_path = 'transformations'
  *
  * */
@@ -16,40 +17,34 @@
 set search_path = 'transformations';
 
 
+/*
+ * Transformation and accounting method codes are translated with the code dictionary in tmp_codes,
+ * see src/constants/codes.py, in a single join pass so the tmp table is written once.
+ * */
 insert into tmp_inst_transformations(
 rssd_id_predecessor,
 rssd_id_successor,
 transformation_date,
 transformation_cd,
-acct_method_cd
+transformation,
+acct_method_cd,
+acct_method
 )
 select 
-id_rssd_predecessor,
-id_rssd_successor,
-cast(d_dt_trans as date),
-trnsfm_cd,
-acct_method
-from tmp_transformations;
-
-
-update tmp_inst_transformations
-set transformation = 
-case 
-	when transformation_cd = 1 then 'Charter Discontinued'
-	when transformation_cd = 2 then 'Split'
-	when transformation_cd = 3 then 'Sale of Assets'
-	when transformation_cd = 9 then 'Charter Retained'
-	when transformation_cd = 50 then 'Failure'
-end;
-
-
-update tmp_inst_transformations
-set acct_method = 
-case 
-	when acct_method_cd = 1 then 'Pooling of interests or entities under common control.'
-	when acct_method_cd = 2 then 'Purchase/Acquisition'
-end
-where acct_method_cd <> 0;
+trn.id_rssd_predecessor,
+trn.id_rssd_successor,
+trn.d_dt_trans,
+trn.trnsfm_cd,
+transformation.description,
+trn.acct_method,
+acct_method.description
+from tmp_transformations trn
+left join tmp_codes transformation
+	on transformation.code_set = 'transformation'
+	and transformation.cd = trn.trnsfm_cd::int::varchar
+left join tmp_codes acct_method
+	on acct_method.code_set = 'acct_method'
+	and acct_method.cd = trn.acct_method::int::varchar;
 
 insert into inst_transformations(
 rssd_id_predecessor,
@@ -17,14 +17,11 @@
 set search_path = 'transformations';
 
 
-select	*
-from
-	rm_col_whitespace('tmp_attributes',
-	array[
-	'street_line1',
-	'street_line2',
-	'zip_cd'
-	]);
+/*
+ * Street and zip whitespace and the 0 reported for unknown values are cleansed while the
+ * attributes are imported, see ATTRIBUTE_CLEANSING in src/constants/imports.py.
+ * 
+ * */
 
 delete from inst_addresses;
 
@@ -37,14 +34,6 @@ select
 	county_cd,
 	cntry_cd,
 	trim(substring(zip_cd from 0 for 6)),
-	trim(substring(zip_cd from 6 for 9))
+	nullif(trim(substring(zip_cd from 6 for 9)), '')
 from
-	tmp_attributes; 
-
-
-update inst_addresses set county_cd = null where county_cd = '0';
-update inst_addresses set country_cd = null where country_cd = '0';
-update inst_addresses set zip_cd = null where zip_cd = '0';
-update inst_addresses set zip_plus4 = null where zip_plus4 = '';
-update inst_addresses set address_line1 = null where address_line1 = '0';
-
+	tmp_attributes;
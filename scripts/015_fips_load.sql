@@ -36,23 +36,16 @@ ns = excluded.ns
 /*
  * County Codes
  * 
- * data provided was by place code, to normalize we had to assign a unique key and remove duplicates for nomalization
+ * data provided was by place code, to normalize we keep one row per county code
+ * tmp_county_codes is an imported staging table, it is kept for incremental runs so it is only read
  * 
  * */
 
 
-alter table tmp_county_codes add column "uuid" uuid default gen_random_uuid();
-
-
-with duplicates as (
-select uuid, row_number() over (partition by countyfp order by countyfp) rw from tmp_county_codes)
-delete from tmp_county_codes
-where uuid in (select uuid from duplicates where rw >1);
-
-
 insert into county_cds (state_fp, fips, "name")
-select lpad(cast(statefp as varchar),2,'0'), lpad(cast(countyfp as varchar),3,'0'), countyname 
+select distinct on (countyfp) lpad(cast(statefp as varchar),2,'0'), lpad(cast(countyfp as varchar),3,'0'), countyname 
 from tmp_county_codes 
+order by countyfp
 on conflict (fips)
 do update 
 set
@@ -60,17 +53,13 @@ state_fp = excluded.state_fp,
 "name" = excluded."name";
 
  
--- dirty data
-delete from tmp_country_codes where country = 'Curacao 36188';
-update tmp_country_codes set country = trim(country);
-
-
+-- dirty data, cleaned as it is read so tmp_country_codes is left as imported
 insert into country_cds ("name", cd)
-select country, code
+select trim(country), code
 from tmp_country_codes
+where country is distinct from 'Curacao 36188'
 on conflict (cd)
 do update 
 set
 "name" = excluded."name"
 ;
-
@@ -16,11 +16,15 @@ set search_path = 'transformations';
 
 
 -- the sequence is designed to order list, strings do not follow sequential ordering rules
-alter table tmp_naics alter column sequence type int;
-
 -- data set included an empty row
-delete from tmp_naics where sequence is null;
-
-
-insert into naics 
-select * from tmp_naics;
+-- tmp_naics is kept for incremental runs, it is cast and filtered as it is read rather than altered
+-- sequence is the key of a classification, reloading a published list updates it in place
+insert into naics ("sequence", cd, title)
+select cast("sequence" as int), code, title
+from tmp_naics
+where "sequence" is not null
+on conflict ("sequence")
+do update
+set
+cd = excluded.cd,
+title = excluded.title;
@@ -15,18 +15,38 @@
 set search_path = 'transformations';
 
 
--- where statement will not allow for duplication of data since do not have any good validation
-insert into call_reports(rssd_id, reporting_pd, tot_assets)
-select 
-"RSSD9001",
-cast(cast("RSSD9999" as varchar(20))as date),
-"BHCA2170"
-from tmp_bhcf b
-where not exists (
-select
-	1
-from
-	call_reports c
-where
-	b."RSSD9001" = c.rssd_id
-	and cast(cast(b."RSSD9999"as varchar(20))as date) = c.reporting_pd);
+/*
+ * Backfilled quarters are staged in child tables of tmp_bhcf, one per period, so reading
+ * tmp_bhcf loads every staged quarter in this single block.
+ *
+ * call_reports is partitioned by quarter. Each staged quarter gets its partition created when
+ * missing, truncated and reloaded, so refiled reports replace the quarter they belong to and
+ * the rest of the loaded history is never read. Rows go straight into their partition, without
+ * routing, and a filing listed twice in a file keeps one row.
+ *
+ * Filings without a reporting period or rssd_id cannot be identified and are not loaded.
+ * */
+do $$
+declare
+	period_start date;
+	partition_name text;
+begin
+	for period_start in
+		select distinct date_trunc('quarter', rssd9999)::date
+		from tmp_bhcf
+		where rssd9999 is not null
+		order by 1
+	loop
+		partition_name := call_report_partition(period_start);
+		execute format('truncate table transformations.%I', partition_name);
+		execute format(
+			'insert into transformations.%I (rssd_id, reporting_pd, tot_assets)
+			select distinct on (rssd9001, rssd9999) rssd9001, rssd9999, bhca2170
+			from transformations.tmp_bhcf
+			where rssd9001 is not null and rssd9999 >= $1 and rssd9999 < $1 + interval ''3 months''
+			order by rssd9001, rssd9999',
+			partition_name
+		) using period_start;
+		raise notice 'call_reports  |  partition: %', partition_name;
+	end loop;
+end $$;
@@ -1,21 +1,34 @@
 drop table if exists transformations.tmp_addresses;
-drop table if exists transformations.tmp_attributes;
 drop table if exists transformations.tmp_cds;
 drop table if exists transformations.tmp_codes;
-drop table if exists transformations.tmp_country_codes;
-drop table if exists transformations.tmp_county_codes;
 drop table if exists transformations.tmp_dates;
 drop table if exists transformations.tmp_ids;
 drop table if exists transformations.tmp_inds;
 drop table if exists transformations.tmp_inst;
 drop table if exists transformations.tmp_inst_relationships;
 drop table if exists transformations.tmp_inst_transformations;
-drop table if exists transformations.tmp_naics;
 drop table if exists transformations.tmp_place_codes;
-drop table if exists transformations.tmp_relationships;
-drop table if exists transformations.tmp_state_codes;
-drop table if exists transformations.tmp_transformations;
 
-drop function if exists col_w_whitespace;
-drop function if exists rm_col_whitespace;
+drop function if exists transformations.rm_col_whitespace;
 
+
+/*
+ * Indexes built on the imported staging tables after the imports are named with the stg_idx_ prefix,
+ * see index_handler in src/handlers/importer.py. They are dropped so the next load does not maintain them.
+ * */
+do $$
+declare
+	rec record;
+begin
+	for rec in
+		select idx.schemaname, idx.indexname
+		from pg_indexes idx
+		where
+			idx.schemaname = 'transformations'
+		and
+			idx.indexname like 'stg\_idx\_%'
+	loop
+		execute format('drop index if exists %I.%I', rec.schemaname, rec.indexname);
+	end loop;
+end;
+$$;
@@ -1,5 +1,8 @@
+drop table if exists transformations.call_reports cascade;
+drop table if exists transformations.column_profiles;
 drop table if exists transformations.country_cds;
 drop table if exists transformations.county_cds;
+drop table if exists transformations.import_manifest;
 drop table if exists transformations.inst_addresses;
 drop table if exists transformations.inst_attr_cds;
 drop table if exists transformations.inst_attr_dates;
@@ -9,10 +12,13 @@ drop table if exists transformations.inst_relationships;
 drop table if exists transformations.inst_transformations;
 drop table if exists transformations.institutions cascade;
 drop table if exists transformations.naics;
+drop table if exists transformations.run_ledger;
+drop table if exists transformations.script_metrics;
 drop table if exists transformations.place_cds;
 drop table if exists transformations.state_cds;
+drop table if exists transformations.task_queue;
 drop table if exists transformations.tmp_addresses;
-drop table if exists transformations.tmp_attributes;
+drop table if exists transformations.tmp_attributes cascade;
 drop table if exists transformations.tmp_cds;
 drop table if exists transformations.tmp_codes;
 drop table if exists transformations.tmp_country_codes;
@@ -23,10 +29,12 @@ drop table if exists transformations.tmp_inds;
 drop table if exists transformations.tmp_inst;
 drop table if exists transformations.tmp_inst_relationships;
 drop table if exists transformations.tmp_inst_transformations;
-drop table if exists transformations.tmp_bhcf;
+drop table if exists transformations.tmp_bhcf cascade;
 drop table if exists transformations.tmp_naics;
 drop table if exists transformations.tmp_place_codes;
 drop table if exists transformations.tmp_relationships;
 drop table if exists transformations.tmp_state_codes;
 drop table if exists transformations.tmp_transformations;
+drop function if exists transformations.call_report_partition;
+drop function if exists transformations.profile_columns;
 commit;
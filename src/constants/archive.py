@@ -0,0 +1,20 @@
+"""
+archive
+
+Defines the compressed input formats accepted in the import directory. Compressed files are
+streamed through decompression into the parser and are never extracted to disk.
+
+- ZIP: Archives whose members are matched against import configurations individually.
+- GZIP: Single compressed files, matched by the name before the first extension.
+- ZSTD: Single Zstandard compressed files, matched by the name before the first extension.
+- COMPRESSED: Every extension above.
+- MEMBER_SEP: Seperates an archive path from a member name in a configured file path,
+  e.g., "/imports/NIC.zip::CSV_ATTRIBUTES_ACTIVE.CSV".
+"""
+
+ZIP = ".zip"
+GZIP = ".gz"
+ZSTD = ".zst"
+COMPRESSED = (ZIP, GZIP, ZSTD)
+
+MEMBER_SEP = "::"
@@ -0,0 +1,252 @@
+"""
+codes
+
+Defines the code dictionary used to translate integer and abbreviated codes reported by the
+FFIEC into descriptive values. The dictionary is loaded into `transformations.tmp_codes` before
+the transformation scripts run, and each script translates all of its codes in a single join
+pass while inserting into its tmp table.
+
+Each key is a code set named after the descriptive column it populates, each value maps a
+reported code to its description. Codes without an entry, including 0 which is defined as
+inapplicable, translate to null.
+
+Sources:
+- tmp_inds: FFIEC attribute indicators.
+- tmp_cds: FFIEC attribute codes.
+- tmp_inst_relationships: FFIEC relationship codes, prefixed with "relationship_" where the
+  name is shared with an attribute code set.
+- tmp_inst_transformations: FFIEC transformation codes.
+"""
+
+from typing import Dict
+
+CODES: Dict[str, Dict[int | str, str]] = {
+    "bnk_holding_co_ind": {
+        1: "Entity is a BHC",
+        2: "Entity is not a BHC but it directly or indirectly controls a grandfathered non-bank bank",
+    },
+    "financial_sub_ind": {
+        1: "Holds one or more financial subsidiaries",
+        2: "Other",
+    },
+    "fhc_ind": {
+        1: "Entity is an FHC",
+        2: "Entity is an SLHC which has been designated an FHC",
+    },
+    "fhlbs_mbr_ind": {
+        1: "Member",
+    },
+    "int_hc_ind": {
+        1: "Entity is an IHC",
+    },
+    "intl_bnk_fac_ind": {
+        1: "Entity operates an IBF",
+    },
+    "sav_loan_hc_ind": {
+        1: "Entity is a savings and loan holding company",
+    },
+    "auth_charter": {
+        1: "Federal",
+        2: "State",
+    },
+    "bank_type_analysis": {
+        1: "A bankers bank that is subject to reserve requirements",
+        2: "A bankers bank that is not subject to reserve requirements",
+        3: "Grandfathered non-bank bank",
+        4: "Entity is primarily conducting credit card activities",
+        5: "Wholesale bank (with commercial bank charter)",
+        6: "Standalone Internet Bank (SAIB)",
+        7: "Workout entity",
+        8: "Depository Institution National Bank",
+        9: "Depository trust company",
+        10: "Bridge entity",
+        11: "Banking Edge or Agreement Corporation",
+        12: "Investment Edge or Agreement Corporation",
+        13: "Data processing services",
+        14: "Trust preferred securities subsidiary",
+        15: "Cash management banks",
+        16: "Farm credit system institution",
+        17: "10L Election",
+        18: "Grandfathered SLHC",
+        19: "Securities Holding Company",
+        20: "Designated Financial Market Utility",
+    },
+    "conservatorship": {
+        1: "RTC",
+        2: "OCC",
+        3: "FDIC",
+        4: "STATE",
+        5: "NCUA",
+    },
+    "broad_reg": {
+        1: "Denotes entities that are defined as banks in the Bank Holding Company Act, as \namended and implemented in the Federal Reserve's Regulation Y",
+        2: "Other depository institution",
+        3: "Non-depository institution",
+        4: "Inactive institution",
+    },
+    "charter_type": {
+        110: "Government Agency",
+        200: "Commercial Bank",
+        250: "Non-deposit Trust Company",
+        300: "Savings Bank",
+        310: "Savings & Loan Association",
+        320: "Cooperative Bank",
+        330: "Credit Union",
+        340: "Industrial Bank",
+        400: "Edge or Agreement Corporation",
+        500: "Holding Company only, not itself any other charter type",
+        550: "Insurance Broker or Agent and/or Insurance Company",
+        610: "Employee Stock Ownership Plan/Trust",
+        700: "Securities Broker and/or Dealer",
+        710: "Utility Company or Electric Power Co-generator",
+        720: "Other Non-Depository Institution",
+    },
+    "financial_sub_holder": {
+        1: "Holds one or more financial subsidiaries",
+        2: "Other",
+    },
+    "est_type": {
+        1: "Headquarters",
+        2: "Full service branch or regional office of regulatory agency",
+        3: "Limited service branch",
+        5: "Agency",
+        6: "Back office money operation",
+        7: "Military facility",
+        8: "Super agency",
+        9: "Limited super agency",
+        11: "Check processing center, regional or otherwise",
+        12: "Other branch or non-independent facility",
+        13: "Loan production office",
+        14: "Representative office of a foreign bank",
+        15: "Non-U.S. branch that is managed or controlled by a U.S. branch or agency of a foreign bank",
+        16: "Non-U.S. branch that is managed or controlled by more than one U.S. branch or agency of a foreign bank",
+        17: "Office, division or branch of a non-bank entity",
+        18: "Trust",
+        19: "Electronic Banking",
+    },
+    "func_reg": {
+        1: "SEC/CFTC",
+        2: "SEC",
+        3: "State Securities Department",
+        4: "State Insurance Regulator",
+        5: "CFTC",
+        6: "Other",
+    },
+    "mjr_mnrty_owned": {
+        1: "African American",
+        5: "Caucasian Women",
+        10: "Hispanic",
+        20: "Asian American",
+        30: "Native American",
+        35: "Eskimo",
+        37: "Aleuts",
+        39: "Low Income Credit Union",
+        99: "Other Minorities",
+    },
+    "org_type": {
+        1: "Corporation",
+        2: "General Partnership",
+        3: "Limited Partnership",
+        4: "Business Trust",
+        5: "Sole Proprietorship",
+        6: "Mutual",
+        9: "Cooperative",
+        10: "LLP",
+        11: "LLC/C",
+        12: "Estate Trust",
+        13: "Limited Liability Limited Partnership",
+        99: "Other",
+    },
+    "primary_insurer": {
+        1: "FDIC/BIF",
+        2: "FDIC/SAIF",
+        3: "NCUSIF",
+        4: "State",
+        5: "Other",
+        6: "FDIC/BIF and FDIC/SAIF",
+        7: "DIF",
+    },
+    "primary_reg": {
+        "FCA": "Farm Credit Administration",
+        "FDIC": "Federal Deposit Insurance Corporation",
+        "FHFA": "Federal Housing Finance Agency",
+        "FRS": "Federal Reserve System",
+        "NCUA": "National Credit Union Administration",
+        "OCC": "Office of the Comptroller of the Currency",
+        "OTS": "Office of Thrift Supervision",
+    },
+    "sec_reporting_status": {
+        1: "Registered with the SEC",
+        2: "Not registered with the SEC",
+        3: "Subject to section 13(a) or 15(d) of the Securities Exchange Act of 1934 and section 404 of the Sarbanes-Oxley Act of 2002",
+        4: "Subject to section 13(a) or 15(d) of the Securities Exchange Act of 1934 and NOT section 404 of the Sarbanes-Oxley Act of 2002",
+        5: "Terminated or suspended its reporting requirements under section 13(a) or 15(d) of the Securities Exchange Act of 1934",
+    },
+    "termination_reason": {
+        1: "Voluntary liquidation",
+        2: "Closure",
+        3: "Entity is either inactive or no longer regulated by the Federal Reserve.",
+        4: "Failure, entity continues to exist",
+        5: "Failure, entity ceases to exist",
+    },
+    "sav_loan_hc_type": {
+        1: "Entity is a Home Owners Loan Act Mutual Holding Company that holds a savings bank that has made a 10L election to be treated as a thrift",
+        2: "Entity is a Home Owners Loan Act Stock Holding Company that holds a savings bank that has made a 10L election to be treated as a thrift",
+        3: "Entity is a Mutual Holding Company (non- Home Owners Loan Act) that holds a savings association",
+        4: "Entity is a Stock Holding Company (non- Home Owners Loan Act) that holds a savings association",
+        5: "Entity is a Trust (family or estate) Holding Company. These entities are registered savings and loan holding companies.",
+    },
+    "equity_ind": {
+        1: "Ownership / control is in a BHC, SLHC, bank or FBO",
+        2: "Ownership / control is in a non-banking company",
+    },
+    "other_basis_ind": {
+        1: "Other basis of ownership/control",
+        2: "Non-voting equity",
+        3: "Voting securities in a merchant banking or insurance company investment",
+        4: "Subordinated debt",
+        5: "Limited partnership",
+        6: "Subordinated debt and non-voting equity",
+        7: "Subordinated debt and limited partnership",
+        8: "Assets",
+        9: "Total equity in a merchant banking or insurance company investment",
+    },
+    "creation_reason": {
+        1: "Initial relationship record",
+        2: "Increase/Decrease in voting rights including non-participation in capital increase",
+        3: "Reestablishment of a relationship",
+        4: "Change in basis for relationship or change in relationship",
+        5: "Change in Control Indicator",
+        6: "Change in Regulatory Indicator",
+        7: "Change in Regulatory Indicator along with reasons 2 and/or 4 above",
+        8: "Other",
+    },
+    "relationship_termination_reason": {
+        1: "Termination of relationship between Parent and Offspring for reasons other than 2 through 6 with no remaining basis for a relationship",
+        2: "Parent terminates relationship with Offspring by selling or transferring all the control it (Parent) has over Offspring",
+        3: "Relationship between Parent and Offspring is terminated because Offspring is liquidated or merged.",
+        4: "Termination of regulation of relationship between Parent and Offspring because control criteria of Offspring fell below regulatory reportable level.",
+        5: "Termination of regulation of relationship between Parent and Offspring because Parent ceased to be controlled or reportable.",
+        6: "Termination of regulation of relationship between Parent and Offspring because of change to regulatory reporting criteria.",
+    },
+    "financial_consol_ind": {
+        1: "Yes",
+        2: "No",
+    },
+    "reg_k_inv": {
+        1: "Portfolio Investment",
+        2: "Joint Venture",
+        3: "Subsidiary",
+    },
+    "transformation": {
+        1: "Charter Discontinued",
+        2: "Split",
+        3: "Sale of Assets",
+        9: "Charter Retained",
+        50: "Failure",
+    },
+    "acct_method": {
+        1: "Pooling of interests or entities under common control.",
+        2: "Purchase/Acquisition",
+    },
+}
@@ -2,6 +2,15 @@
 connection 
 
 Defines connection strings for database access, using configuration settings.
+
+Pool settings apply to the engine each process holds, so a run opens at most
+processes * (POOL_SIZE + MAX_OVERFLOW) connections, keep it below `max_connections`.
+
+- POOL_SIZE: Connections kept open by a process once they have been created.
+- MAX_OVERFLOW: Connections opened beyond POOL_SIZE under load, closed when returned.
+- POOL_TIMEOUT: Seconds a checkout waits for a free connection before failing.
+- POOL_RECYCLE: Seconds after which a connection is replaced on its next checkout.
+- POOL_PRE_PING: Tests each connection on checkout, replacing connections the server closed.
 """
 
 from config import settings
@@ -10,3 +19,9 @@ POSTGRES_CONNECTION = (
     f"{settings.db_driver}://{settings.db_usrnm}:{settings.db_pwd}"
     f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
 )
+
+POOL_SIZE = settings.db_pool_size
+MAX_OVERFLOW = settings.db_max_overflow
+POOL_TIMEOUT = settings.db_pool_timeout
+POOL_RECYCLE = settings.db_pool_recycle
+POOL_PRE_PING = settings.db_pool_pre_ping
@@ -5,7 +5,15 @@ Defines target directory names used for organizing configuration objects
 related to imports and scripts. These constants help standardize directory 
 references throughout the application.
 
+The cache directory holds parsed import files stored as Parquet, keyed by file 
+content and import configuration.
+
+The reports directory holds a JSON report of per-statement script metrics for
+each run.
+
 """
 
 IMPORT = "imports"
 SCRIPTS = "scripts"
+CACHE = ".cache"
+REPORTS = "reports"
@@ -0,0 +1,21 @@
+"""
+dtypes
+
+Defines the column types available to import configurations. Declared types are
+applied while the file is parsed and when the staging table is created, so pandas
+does not infer them and the scripts do not need to cast them back.
+
+- INTEGER: 32-bit integer, nullable.
+- BIGINT: 64-bit integer, nullable.
+- NUMERIC: Decimal values such as reported dollar amounts.
+- DATE: Calendar date parsed with the configured `format`, unparsable values such as 0 become null.
+- CATEGORY: Low cardinality code, held as a pandas categorical and stored as varchar.
+- STRING: Free text stored as varchar, or text when no length is given.
+"""
+
+INTEGER = "integer"
+BIGINT = "bigint"
+NUMERIC = "numeric"
+DATE = "date"
+CATEGORY = "category"
+STRING = "string"
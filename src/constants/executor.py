@@ -0,0 +1,27 @@
+"""
+executor
+
+Defines the backends available to run the tasks of a worker stage and the per-stage settings
+read from the environment, see `config.Settings`.
+
+- THREAD: Thread pool, tasks share the process and its pooled engine. Suited to I/O bound
+  loading, the database driver and the pyarrow parser release the GIL while they wait.
+- PROCESS: Process pool, each worker imports the application and holds its own engine.
+  Suited to CPU bound parsing with the C or python parser.
+- ASYNCIO: Event loop awaiting every task at once, each task runs in the loop's default
+  thread pool and a semaphore bounds how many run together.
+
+- IMPORT_EXECUTOR: Backend running the import categories.
+- IMPORT_WORKERS: Import categories running at once, None uses the backend's default.
+- SCRIPT_WORKERS: Scripts of the dependency graph running at once, each on its own session.
+"""
+
+from config import settings
+
+THREAD = "thread"
+PROCESS = "process"
+ASYNCIO = "asyncio"
+
+IMPORT_EXECUTOR = settings.import_executor
+IMPORT_WORKERS = settings.import_workers
+SCRIPT_WORKERS = settings.script_workers
@@ -17,36 +17,130 @@ Keys:
 - key_type: Specifies filename comparison method.
   - "prefix": Partial match (useful for date-based naming conventions).
   - "full": Exact match.
+- backfill (optional): Loads every file matching a "prefix" key instead of the first one. Each
+  file is staged in its own child table named after the period that follows the prefix, e.g.
+  `tmp_bhcf_20240630`, and the files are loaded concurrently, see `if_exists`. Enabled for BHCF
+  with the `BHCF_BACKFILL` setting.
 - table_schema: Target schema for the imported data.
 - table_name: Target table for storing imported data; created if it does not exist.
 - if_exists: Action to take if the target table already exists (e.g., "fail", "replace", "append").
+  Files sharing a target table are loaded concurrently into child tables, only the first
+  file's action applies to the shared table.
 - sep: Delimiter used in the CSV file (e.g., ",", "^").
 - allow_import: Boolean flag indicating whether the file should be imported.
 - cols: List of column names to import. If empty, all columns are included.
+- loader: Strategy used to write the file to the target table.
+  - "to_sql": Row inserts through `DataFrame.to_sql`.
+  - "copy": Streams rows with `COPY ... FROM STDIN`, much faster for large files.
+- chunksize (optional): Rows read and loaded at a time, bounds worker memory for large files.
+- chunk_bytes (optional): Raw file bytes read and loaded at a time, used when chunksize is not set.
+  Files without either budget are read in a single pass.
+- dtypes (optional): Declared column types keyed by normalized column name, see `dtypes`.
+  Declared columns skip type inference and are created with the matching SQL type.
+- cleansing (optional): Column cleansing keyed by normalized column name, applied to each parsed
+  chunk before it is written so the staging table arrives clean.
+  - "trim": Text columns stripped of leading and trailing whitespace, whitespace-only values
+    are kept as empty strings.
+  - "nullify": Values set to null per column, e.g. the 0 reported for unknown values.
+  - "pad": Left padding to a width with a fill character, the column is stored as text.
+  Trimming runs first, then nulls, then padding, so nulled values are never padded. Every column
+  listed must be imported, a missing column fails the load of the file.
+- parallel (optional): Number of processes that parse and load newline aligned byte ranges of
+  the file concurrently, each over its own connection. The ranges are sized by chunk_bytes
+  when given. Not suitable for files with quoted fields that contain newlines.
+- cache (optional): Stores the parsed, header-normalized and column-projected file as Parquet
+  under `.cache`, keyed by the file content and the settings above. Unchanged files are loaded
+  from the cache without being parsed again. Entries are never evicted, delete the directory
+  to reclaim space.
+- indexes (optional): Column lists of the indexes built on the target table once every import
+  has finished, for the columns the scripts join and filter on. Child tables of a shared target
+  are indexed individually. Every loaded table is analyzed at the same time, and the indexes are
+  dropped again by `099_cleanup.sql`.
+- writers (optional): Threads writing parsed chunks while the next chunk is parsed. A single
+  writer loads the file in one transaction. More writers each commit over their own
+  connection, so a failed import can leave a partial table.
 """
 
-from typing import List
+from typing import Dict, List
 
-from .objects import FFEICConfig
+from config import settings
+
+from .objects import Cleansing, ColumnType, FFEICConfig
+
+# shared by every attribute file since they are all loaded into the same table
+ATTRIBUTE_DTYPES: Dict[str, ColumnType] = {
+    "id_rssd": {"type": "integer"},
+    "dt_exist_cmnc": {"type": "date", "format": "%Y%m%d"},
+    "dt_exist_term": {"type": "date", "format": "%Y%m%d"},
+    "dt_insur": {"type": "date", "format": "%Y%m%d"},
+    "entity_type": {"type": "category", "length": 10},
+    "prim_fed_reg": {"type": "category", "length": 10},
+}
 
 BHCF: List[FFEICConfig] = [
     {
         "name": "bhcf",
         "key_type": "prefix",
+        "backfill": settings.bhcf_backfill,
         "table_schema": "transformations",
         "table_name": "tmp_bhcf",
         "if_exists": "fail",
         "sep": "^",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "chunk_bytes": 64 * 1024 * 1024,
+        "parallel": 4,
         "cols": [
             "RSSD9001",  # rssd_id
             "RSSD9999",  # reporting_date
             "BHCA2170",  # total assets
         ],
+        "dtypes": {
+            "rssd9001": {"type": "integer"},
+            "rssd9999": {"type": "date", "format": "%Y%m%d"},
+            "bhca2170": {"type": "numeric"},
+        },
+        "indexes": [["rssd9001", "rssd9999"]],
     }
 ]
 
 
+# unknown values are reported as 0, they are nulled so lookups and indexes exclude them
+ATTRIBUTE_CLEANSING: Cleansing = {
+    "trim": [
+        "nm_short",
+        "nm_lgl",
+        "act_prim_cd",
+        "street_line1",
+        "street_line2",
+        "zip_cd",
+    ],
+    "nullify": {
+        col: ["0"]
+        for col in [
+            "url",
+            "act_prim_cd",
+            "fisc_yrend_mmdd",
+            "id_rssd_hd_off",
+            "id_tax",
+            "id_aba_prim",
+            "id_lei",
+            "id_fdic_cert",
+            "id_ncua",
+            "id_thrift_hc",
+            "id_thrift",
+            "id_cusip",
+            "id_occ",
+            "street_line1",
+            "county_cd",
+            "cntry_cd",
+            "zip_cd",
+        ]
+    },
+    "pad": {"fisc_yrend_mmdd": {"width": 4, "fillchar": "0"}},
+}
+
 ATTRIBUTES: List[FFEICConfig] = [
     {
         "name": "csv_attributes_active",
@@ -56,7 +150,13 @@ ATTRIBUTES: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "chunksize": 100_000,
         "cols": [],
+        "dtypes": ATTRIBUTE_DTYPES,
+        "cleansing": ATTRIBUTE_CLEANSING,
+        "indexes": [["id_rssd"]],
     },
     {
         "name": "csv_attributes_branches",
@@ -66,7 +166,13 @@ ATTRIBUTES: List[FFEICConfig] = [
         "if_exists": "append",
         "sep": ",",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "chunksize": 100_000,
         "cols": [],
+        "dtypes": ATTRIBUTE_DTYPES,
+        "cleansing": ATTRIBUTE_CLEANSING,
+        "indexes": [["id_rssd"]],
     },
     {
         "name": "csv_attributes_closed",
@@ -76,7 +182,13 @@ ATTRIBUTES: List[FFEICConfig] = [
         "if_exists": "append",
         "sep": ",",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "chunksize": 100_000,
         "cols": [],
+        "dtypes": ATTRIBUTE_DTYPES,
+        "cleansing": ATTRIBUTE_CLEANSING,
+        "indexes": [["id_rssd"]],
     },
 ]
 
@@ -89,7 +201,11 @@ RELATIONSHIPS: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "chunksize": 100_000,
         "cols": [],
+        "indexes": [["id_rssd_parent"], ["id_rssd_offspring"]],
     },
 ]
 
@@ -102,7 +218,16 @@ TRANSFORMATIONS: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "copy",
+        "cache": True,
+        "parallel": 4,
         "cols": [],
+        "dtypes": {
+            "id_rssd_predecessor": {"type": "integer"},
+            "id_rssd_successor": {"type": "integer"},
+            "d_dt_trans": {"type": "date", "format": "%m/%d/%Y %H:%M:%S"},
+        },
+        "indexes": [["id_rssd_predecessor"], ["id_rssd_successor"]],
     },
 ]
 
@@ -115,6 +240,7 @@ GOV_IDENTIFIERS: List[FFEICConfig] = [
         "if_exists": "fail",
         "sep": ",",
         "allow_import": True,
+        "loader": "to_sql",
         "cols": [],
     },
     {
@@ -125,6 +251,7 @@ GOV_IDENTIFIERS: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "to_sql",
         "cols": [],
     },
     {
@@ -135,6 +262,7 @@ GOV_IDENTIFIERS: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "to_sql",
         "cols": [],
     },
     {
@@ -145,6 +273,7 @@ GOV_IDENTIFIERS: List[FFEICConfig] = [
         "if_exists": "replace",
         "sep": ",",
         "allow_import": True,
+        "loader": "to_sql",
         "cols": [],
     },
 ]
@@ -0,0 +1,19 @@
+"""
+ledger
+
+Defines the stages recorded in `transformations.run_ledger`. Every stage and script that
+completes is recorded under the run ID of the pipeline run, a resumed run reuses the ID of
+the latest run and skips what it already completed.
+
+- STAGE: Stage of the pipeline, the item names one of the stages below.
+- DEPENDENCY: Preflight, dependency scripts and the code dictionary.
+- IMPORTS: Import categories, resumed through the import manifest.
+- INDEX: Staging indexes and statistics.
+- SCRIPTS: Transformation scripts, each recorded with the fingerprint of its content and inputs.
+"""
+
+STAGE = "stage"
+DEPENDENCY = "dependency"
+IMPORTS = "imports"
+INDEX = "index"
+SCRIPTS = "scripts"
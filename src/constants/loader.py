@@ -0,0 +1,47 @@
+"""
+loader
+
+Defines the loader strategies available to import configurations. The loader
+determines how a parsed file is written to its target table.
+
+- TO_SQL: Row inserts issued through `DataFrame.to_sql`.
+- COPY: Rows streamed with `COPY ... FROM STDIN` over the psycopg2 connection.
+
+Chunk budgets bound the memory held by a worker while a file is streamed.
+
+- SAMPLE_BYTES: Bytes read from the head of a file to estimate its average line length.
+- SAMPLE_ROWS: Rows read from the head of a file to infer the column types every chunk or range
+  is parsed with, and to create the table before a parallel load.
+- HASH_BLOCK_BYTES: Bytes read at a time while hashing file content.
+
+Chunks are handed from the parser to the writers through a bounded queue.
+
+- PIPELINE_DEPTH: Parsed chunks held in the queue before the parser waits for a writer.
+- QUEUE_TIMEOUT: Seconds a parser or writer waits on the queue before checking whether the
+  pipeline was stopped.
+
+Indexes declared on imported staging tables are named with a common prefix.
+
+- INDEX_PREFIX: Prefix of staging index names, `099_cleanup.sql` drops every index carrying it.
+
+Import categories are scheduled longest first by the load time they are predicted to take.
+
+- COST_HISTORY: Latest timed loads of each file in the import manifest used to predict the
+  milliseconds per byte of its table.
+- DEFAULT_MS_PER_BYTE: Milliseconds per byte assumed before any load was timed, about 20 MB/s.
+"""
+
+TO_SQL = "to_sql"
+COPY = "copy"
+
+SAMPLE_BYTES = 1024 * 1024
+SAMPLE_ROWS = 10_000
+HASH_BLOCK_BYTES = 8 * 1024 * 1024
+
+PIPELINE_DEPTH = 2
+QUEUE_TIMEOUT = 1.0
+
+INDEX_PREFIX = "stg_idx_"
+
+COST_HISTORY = 5
+DEFAULT_MS_PER_BYTE = 1 / 20_000
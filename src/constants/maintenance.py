@@ -0,0 +1,14 @@
+"""
+maintenance
+
+Defines the settings applied while imported staging tables are indexed and analyzed once the
+imports have finished. Values are read from the environment, see `config.Settings`.
+
+- MAINTENANCE_WORK_MEM: Memory each index build may use for sorting, set per connection.
+- INDEX_WORKERS: Index builds and analyzes running at once, each over its own connection.
+"""
+
+from config import settings
+
+MAINTENANCE_WORK_MEM = settings.maintenance_work_mem
+INDEX_WORKERS = settings.index_workers
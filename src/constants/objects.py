@@ -4,13 +4,57 @@ objects
 Defines schema structures for configuration objects used in the application. 
 
 Classes:
+- ColumnType: Represents the declared type of an imported column.
+- Padding: Represents the left padding applied to an imported column.
+- Cleansing: Represents the cleansing applied to imported columns before they are loaded.
 - FFEICConfig: Represents the configuration schema for data imports, specifying
   file handling rules, table mappings, and allowed columns.
 - ScriptsConfig: Represents the configuration schema for script executions, 
   defining execution permissions and metadata.
 """
 
-from typing import List, TypedDict
+from typing import Dict, List, NotRequired, TypedDict
+
+
+class ColumnType(TypedDict):
+    """Schema definition for the declared type of an imported column.
+
+    Attributes:
+    - format (str, optional): strptime format of date columns (e.g., '%Y%m%d').
+    - length (int, optional): Maximum length of category and string columns.
+    - type (str): Column type (e.g., integer, bigint, numeric, date, category, string).
+    """
+
+    format: NotRequired[str]
+    length: NotRequired[int]
+    type: str
+
+
+class Padding(TypedDict):
+    """Schema definition for the left padding of an imported column.
+
+    Attributes:
+    - fillchar (str): Character prepended to values shorter than the width (e.g., '0').
+    - width (int): Minimum length of the padded values.
+    """
+
+    fillchar: str
+    width: int
+
+
+class Cleansing(TypedDict):
+    """Schema definition for the cleansing applied to imported columns, keyed by normalized column name.
+
+    Attributes:
+    - nullify (Dict[str, List[str]], optional): Values set to null per column, compared as
+      numbers on numeric columns (e.g., ['0']).
+    - pad (Dict[str, Padding], optional): Left padding applied per column, values are stored as text.
+    - trim (List[str], optional): Text columns stripped of leading and trailing whitespace.
+    """
+
+    nullify: NotRequired[Dict[str, List[str]]]
+    pad: NotRequired[Dict[str, Padding]]
+    trim: NotRequired[List[str]]
 
 
 class FFEICConfig(TypedDict):
@@ -18,25 +62,47 @@ class FFEICConfig(TypedDict):
 
     Attributes:
     - allow_import (bool): Indicates whether the file should be imported.
+    - backfill (bool, optional): Loads every file matching a prefix, each into a period slice.
+    - cache (bool, optional): Reads and writes the parsed file through the local Parquet cache.
+    - chunk_bytes (int, optional): Raw file bytes read and loaded per chunk.
+    - chunksize (int, optional): Rows read and loaded per chunk, takes precedence over chunk_bytes.
+    - cleansing (Cleansing, optional): Column cleansing applied before the data is loaded.
     - cols (List[str]): List of column names to be imported (empty means all columns).
+    - dtypes (Dict[str, ColumnType], optional): Declared types keyed by normalized column name.
     - file_path (str): Path to the source file.
     - if_exists (str): Action to take if the target table already exists.
+    - indexes (List[List[str]], optional): Columns of each index built on the table after the imports.
     - key_type (str): Defines how the filename is matched (e.g., prefix, full).
+    - loader (str): Strategy used to write the file to the table (e.g., to_sql, copy).
     - name (str): Identifier for the configuration.
+    - parallel (int, optional): Number of processes loading byte ranges of the file concurrently.
+    - partition (str, optional): Suffix of the child table the file is staged in, defaults to name.
     - sep (str): Delimiter used in the file (e.g., ',', '^').
     - table_schema (str): Target schema for the import.
     - table_name (str): Target table for storing the imported data.
+    - writers (int, optional): Threads writing parsed chunks, each over its own connection.
     """
 
     allow_import: bool
+    backfill: NotRequired[bool]
+    cache: NotRequired[bool]
+    chunk_bytes: NotRequired[int]
+    chunksize: NotRequired[int]
+    cleansing: NotRequired[Cleansing]
     cols: List[str]
+    dtypes: NotRequired[Dict[str, ColumnType]]
     file_path: str
     if_exists: str
+    indexes: NotRequired[List[List[str]]]
     key_type: str
+    loader: str
     name: str
+    parallel: NotRequired[int]
+    partition: NotRequired[str]
     sep: str
     table_schema: str
     table_name: str
+    writers: NotRequired[int]
 
 
 class ScriptsConfig(TypedDict):
@@ -46,10 +112,14 @@ class ScriptsConfig(TypedDict):
     - allow_exe (bool): Determines whether execution of the script is allowed.
     - description (str): Brief description of the script's purpose.
     - file_path (str): Path to the script file.
+    - inputs (List[str], optional): Tables and functions the script reads.
     - name (str): Identifier for the script configuration.
+    - outputs (List[str], optional): Tables and functions the script creates, modifies or drops.
     """
 
     allow_exe: bool
     description: str
     file_path: str
+    inputs: NotRequired[List[str]]
     name: str
+    outputs: NotRequired[List[str]]
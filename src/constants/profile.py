@@ -0,0 +1,22 @@
+"""
+profile
+
+Defines the thresholds used to summarize query plans captured by the profiling run mode.
+Statements are explained with `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` inside a transaction
+that is rolled back, and every plan node is checked against the thresholds below.
+
+- SEQ_SCAN_ROWS: Rows read by a sequential scan, across all loops, before it is reported.
+- MISESTIMATE_RATIO: Factor between estimated and actual rows before a node is reported.
+- MISESTIMATE_MIN_ROWS: Rows below which estimates are not compared, small nodes are noisy.
+- EXPLAIN: Prefix wrapping each explainable statement.
+- EXPLAINABLE: Leading keywords of statements that can be explained.
+- TRANSACTION_CONTROL: Leading keywords of statements skipped so the run can be rolled back.
+"""
+
+SEQ_SCAN_ROWS = 10_000
+MISESTIMATE_RATIO = 10
+MISESTIMATE_MIN_ROWS = 100
+
+EXPLAIN = "explain (analyze, buffers, format json)"
+EXPLAINABLE = ("select", "insert", "update", "delete", "with", "values", "merge")
+TRANSACTION_CONTROL = ("begin", "commit", "end", "rollback", "start")
@@ -0,0 +1,30 @@
+"""
+queue
+
+Defines the states of the tasks in `transformations.task_queue` and the settings of the
+workers pulling them, see `config.Settings`.
+
+- PENDING: Waiting for its dependencies or a free worker.
+- RUNNING: Claimed by a worker.
+- DONE: Completed, tasks depending on it can be claimed.
+- FAILED: Raised an error or reported a failure.
+- HELD: Not run because a task it depends on failed or was held.
+
+- POLL_INTERVAL: Seconds an idle worker waits before claiming again.
+- TASK_TIMEOUT: Seconds without a heartbeat after which a running task is considered lost with
+  its worker and can be claimed again.
+- HEARTBEAT_INTERVAL: Seconds between the refreshes of a running task's claim, well below
+  TASK_TIMEOUT so a task that runs long is not claimed by a second worker.
+"""
+
+from config import settings
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+HELD = "held"
+
+POLL_INTERVAL = settings.queue_poll_interval
+TASK_TIMEOUT = settings.queue_task_timeout
+HEARTBEAT_INTERVAL = settings.queue_heartbeat_interval
@@ -6,17 +6,28 @@ loading, and processing tasks. Each script is categorized based on its function
 
 Categories:
 - PREFLIGHT: Ensures no duplicate data before execution.
+- IMPORT_PREFLIGHT: Drops the imported staging tables before a full import.
 - DEPENDENCIES: Creates reusable functions and tables needed for later transformations.
 - ATTRIBUTES: Transforms and loads CSV-based attributes into the production system.
 - RELATIONSHIPS: Processes and loads relationship-based transformations.
 - TRANSFORMATIONS: Handles general data transformations before final loading.
 - GOV_IDENTIFIERS: Loads and transforms government statistical identifiers like FIPS and NAICS codes.
-- CALL_REPORTS: Processes financial call reports and handles cleanup operations.
+- CALL_REPORTS: Processes financial call reports.
+- CLEANUP: Drops tmp tables and functions once every category has run.
 
 Keys:
 - name (str): Unique script identifier for execution ordering.
 - description (str): Descriptive metadata explaining the purpose of the script.
 - allow_exe (bool): Flag indicating if execution is permitted.
+- inputs (List[str], optional): Tables and functions the script reads.
+- outputs (List[str], optional): Tables and functions the script creates, modifies or drops.
+
+Scripts from ATTRIBUTES through CLEANUP are scheduled as a dependency graph built from their
+inputs and outputs, see `ScriptHandler.execute_dag`. A script waits for every earlier script that
+writes what it reads or writes, and for every earlier script that reads what it writes. Scripts
+without declared inputs and outputs wait for every earlier script and every later script waits
+for them. SCRIPT_WORKERS in `executor` bounds the scripts running at once, each on its own
+pooled session.
 
 Each script configuration is stored in a categorized list, ensuring modular execution
 and streamlined dependency management.
@@ -35,6 +46,14 @@ PREFLIGHT: List[ScriptsConfig] = [
     }
 ]
 
+IMPORT_PREFLIGHT: List[ScriptsConfig] = [
+    {
+        "name": "001_preflight_imports",
+        "description": "drops imported staging tables, skipped on incremental runs so unchanged files are not reloaded",
+        "allow_exe": True,
+    }
+]
+
 DEPENDENCIES: List[ScriptsConfig] = [
     {
         "name": "002_functions",
@@ -57,36 +76,56 @@ ATTRIBUTES: List[ScriptsConfig] = [
         "name": "005_attributes_inst",
         "description": "transformation of csv_attributes",
         "allow_exe": True,
+        "inputs": ["tmp_attributes"],
+        "outputs": ["tmp_inst"],
     },
     {
         "name": "006_attributes_ids",
         "description": "transformation of csv_attributes",
         "allow_exe": True,
+        "inputs": ["tmp_attributes"],
+        "outputs": ["tmp_ids"],
     },
     {
         "name": "007_attributes_dates",
         "description": "transformation of csv_attributes",
         "allow_exe": True,
+        "inputs": ["tmp_attributes"],
+        "outputs": ["tmp_dates"],
     },
     {
         "name": "008_attributes_inds",
         "description": "transformation of csv_attributes",
         "allow_exe": True,
+        "inputs": ["tmp_attributes", "tmp_codes"],
+        "outputs": ["tmp_inds"],
     },
     {
         "name": "009_attributes_codes",
         "description": "transformation of csv_attributes",
         "allow_exe": True,
+        "inputs": ["tmp_attributes", "tmp_codes"],
+        "outputs": ["tmp_cds"],
     },
     {
         "name": "010_attributes_load",
         "description": "loads transformed data into production tables",
         "allow_exe": True,
+        "inputs": ["tmp_inst", "tmp_ids", "tmp_dates", "tmp_inds", "tmp_cds"],
+        "outputs": [
+            "institutions",
+            "inst_ids",
+            "inst_attr_dates",
+            "inst_attr_indicators",
+            "inst_attr_cds",
+        ],
     },
     {
         "name": "014_inst_addresses_load",
         "description": "transformation of institution physical addresses and loads to target table",
         "allow_exe": True,
+        "inputs": ["tmp_attributes"],
+        "outputs": ["inst_addresses"],
     },
 ]
 RELATIONSHIPS: List[ScriptsConfig] = [
@@ -94,11 +133,15 @@ RELATIONSHIPS: List[ScriptsConfig] = [
         "name": "011_relationships",
         "description": "transformation of csv_relationships",
         "allow_exe": True,
+        "inputs": ["tmp_relationships", "tmp_codes"],
+        "outputs": ["tmp_inst_relationships"],
     },
     {
         "name": "012_relationships_load",
         "description": "loads transformed data into target table",
         "allow_exe": True,
+        "inputs": ["tmp_inst_relationships"],
+        "outputs": ["inst_relationships"],
     },
 ]
 TRANSFORMATIONS: List[ScriptsConfig] = [
@@ -106,6 +149,8 @@ TRANSFORMATIONS: List[ScriptsConfig] = [
         "name": "013_transformations",
         "description": "transformation of csv_transformations and loading to target table",
         "allow_exe": True,
+        "inputs": ["tmp_transformations", "tmp_codes"],
+        "outputs": ["tmp_inst_transformations", "inst_transformations"],
     },
 ]
 GOV_IDENTIFIERS: List[ScriptsConfig] = [
@@ -113,11 +158,15 @@ GOV_IDENTIFIERS: List[ScriptsConfig] = [
         "name": "015_fips_load",
         "description": "transformation and load of statistical identification codes for county, state, and country",
         "allow_exe": True,
+        "inputs": ["tmp_country_codes", "tmp_county_codes", "tmp_state_codes"],
+        "outputs": ["country_cds", "county_cds", "state_cds"],
     },
     {
         "name": "016_naics",
         "description": "transformation and load of naics codes",
         "allow_exe": True,
+        "inputs": ["tmp_naics"],
+        "outputs": ["naics"],
     },
 ]
 CALL_REPORTS: List[ScriptsConfig] = [
@@ -125,10 +174,28 @@ CALL_REPORTS: List[ScriptsConfig] = [
         "name": "017_call_reports",
         "description": "loading of call report data",
         "allow_exe": True,
+        "inputs": ["tmp_bhcf"],
+        "outputs": ["call_reports"],
     },
+]
+CLEANUP: List[ScriptsConfig] = [
     {
         "name": "099_cleanup",
         "description": "post script for dropping tmp tables and functions",
         "allow_exe": True,
+        "inputs": [],
+        "outputs": [
+            "tmp_addresses",
+            "tmp_cds",
+            "tmp_codes",
+            "tmp_dates",
+            "tmp_ids",
+            "tmp_inds",
+            "tmp_inst",
+            "tmp_inst_relationships",
+            "tmp_inst_transformations",
+            "tmp_place_codes",
+            "rm_col_whitespace",
+        ],
     },
 ]
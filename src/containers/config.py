@@ -130,6 +130,18 @@ class ConfigContainer:
             file_dict=self.get_script_file_dict(),
         )
 
+    def import_preflight_scripts(self) -> List[FFEICConfig | ScriptsConfig]:
+        """
+        Retrieves the configuration for import preflight scripts.
+
+        Returns:
+            List[FFEICConfig | ScriptsConfig]: A list of configurations specific to import preflight scripts.
+        """
+        return self._config_handler.create_config(
+            configs=script.IMPORT_PREFLIGHT,
+            file_dict=self.get_script_file_dict(),
+        )
+
     def dependency_scripts(self) -> List[FFEICConfig | ScriptsConfig]:
         """
         Retrieves the configuration for dependency scripts.
@@ -201,3 +213,15 @@ class ConfigContainer:
             configs=script.CALL_REPORTS,
             file_dict=self.get_script_file_dict(),
         )
+
+    def cleanup_scripts(self) -> List[FFEICConfig | ScriptsConfig]:
+        """
+        Retrieves the configuration for cleanup scripts.
+
+        Returns:
+            List[FFEICConfig | ScriptsConfig]: A list of configurations specific to cleanup scripts.
+        """
+        return self._config_handler.create_config(
+            configs=script.CLEANUP,
+            file_dict=self.get_script_file_dict(),
+        )
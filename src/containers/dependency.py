@@ -12,9 +12,16 @@ Classes:
                          script execution, worker management, schema handling, and session management.
 """
 
-from ..handlers import ConfigHandler, ImportHandler, SchemaHandler, ScriptHandler
+from ..handlers import (
+    ConfigHandler,
+    ImportHandler,
+    QueueHandler,
+    SchemaHandler,
+    ScriptHandler,
+)
 from .config import ConfigContainer
 from .imports import ImportContainer
+from .queue import QueueContainer
 from .registry import RegistryContainer
 from .schema import SchemaContainer
 from .script import ScriptContainer
@@ -33,6 +40,7 @@ class DependencyContainer:
     Attributes:
         _config_handler (ConfigHandler): Handles application configuration settings.
         _import_handler (ImportHandler): Manages data import operations.
+        _queue_handler (QueueHandler): Manages the task queue shared by workers.
         _schema_handler (SchemaHandler): Handles schema-related operations.
         _script_handler (ScriptHandler): Manages script execution.
     """
@@ -41,6 +49,7 @@ class DependencyContainer:
         self,
         config_handler: ConfigHandler,
         import_handler: ImportHandler,
+        queue_handler: QueueHandler,
         schema_handler: SchemaHandler,
         script_handler: ScriptHandler,
     ):
@@ -50,11 +59,13 @@ class DependencyContainer:
         Parameters:
             config_handler (ConfigHandler): Handles application configurations.
             import_handler (ImportHandler): Manages data import operations.
+            queue_handler (QueueHandler): Manages the task queue shared by workers.
             schema_handler (SchemaHandler): Handles schema-related operations.
             script_handler (ScriptHandler): Manages script execution.
         """
         self._config_handler: ConfigHandler = config_handler
         self._import_handler: ImportHandler = import_handler
+        self._queue_handler: QueueHandler = queue_handler
         self._schema_handler: SchemaHandler = schema_handler
         self._script_handler: ScriptHandler = script_handler
 
@@ -89,9 +100,21 @@ class DependencyContainer:
                               allowing concurrent execution of import and script tasks.
         """
         return WorkerContainer(
-            import_=self.import_(), script=self.script(), session=self.session()
+            import_=self.import_(),
+            script=self.script(),
+            session=self.session(),
+            queue_=self.queue(),
         )
 
+    def queue(self) -> QueueContainer:
+        """
+        Creates and returns a QueueContainer instance for the task queue shared by workers.
+
+        Returns:
+            QueueContainer: An instance initialized with `_queue_handler`.
+        """
+        return QueueContainer(queue_handler=self._queue_handler)
+
     def registry(self) -> RegistryContainer:
         """
         Creates and returns a RegistryContainer instance to manage process execution.
@@ -142,11 +165,12 @@ def get_dependency_container() -> DependencyContainer:
 
     Returns:
         DependencyContainer: An instance initialized with `ConfigHandler`, `ImportHandler`,
-                             `SchemaHandler`, and `ScriptHandler`.
+                             `QueueHandler`, `SchemaHandler`, and `ScriptHandler`.
     """
     return DependencyContainer(
         config_handler=ConfigHandler(),
         import_handler=ImportHandler(),
+        queue_handler=QueueHandler(),
         schema_handler=SchemaHandler(),
         script_handler=ScriptHandler(),
     )
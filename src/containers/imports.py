@@ -13,8 +13,11 @@ Notes:
     The engine used for executing imports must be passed directly to the `ImportContainer` methods.
 """
 
+from typing import Dict
+
 from sqlalchemy import Engine
 
+from ..constants import maintenance
 from ..handlers import ImportHandler
 from .config import ConfigContainer
 
@@ -44,7 +47,7 @@ class ImportContainer:
         self._config: ConfigContainer = config
         self._import_handler: ImportHandler = import_handler
 
-    def bhcf_import(self, engine: Engine) -> None:
+    def bhcf_import(self, engine: Engine, incremental: bool = False) -> Dict[str, int | None]:
         """
         Executes the BHCF (Bank Holding Company Filings) import process.
 
@@ -53,13 +56,19 @@ class ImportContainer:
 
         Args:
             engine (Engine): The database or processing engine used for execution.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            Dict[str, int | None]: Rows loaded per file of the reloaded tables, None for
+                files that failed.
         """
         return self._import_handler.import_handler(
             configs=self._config.bhcf_imports(),
             engine=engine,
+            incremental=incremental,
         )
 
-    def attribute_import(self, engine: Engine) -> None:
+    def attribute_import(self, engine: Engine, incremental: bool = False) -> Dict[str, int | None]:
         """
         Executes the attribute import process.
 
@@ -68,13 +77,19 @@ class ImportContainer:
 
         Args:
             engine (Engine): The database or processing engine used for execution.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            Dict[str, int | None]: Rows loaded per file of the reloaded tables, None for
+                files that failed.
         """
         return self._import_handler.import_handler(
             configs=self._config.attribute_imports(),
             engine=engine,
+            incremental=incremental,
         )
 
-    def relationship_import(self, engine: Engine) -> None:
+    def relationship_import(self, engine: Engine, incremental: bool = False) -> Dict[str, int | None]:
         """
         Executes the relationship import process.
 
@@ -83,13 +98,19 @@ class ImportContainer:
 
         Args:
             engine (Engine): The database or processing engine used for execution.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            Dict[str, int | None]: Rows loaded per file of the reloaded tables, None for
+                files that failed.
         """
         return self._import_handler.import_handler(
             configs=self._config.relationship_imports(),
             engine=engine,
+            incremental=incremental,
         )
 
-    def transformation_import(self, engine: Engine) -> None:
+    def transformation_import(self, engine: Engine, incremental: bool = False) -> Dict[str, int | None]:
         """
         Executes the transformation import process.
 
@@ -98,13 +119,19 @@ class ImportContainer:
 
         Args:
             engine (Engine): The database or processing engine used for execution.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            Dict[str, int | None]: Rows loaded per file of the reloaded tables, None for
+                files that failed.
         """
         return self._import_handler.import_handler(
             configs=self._config.transformation_imports(),
             engine=engine,
+            incremental=incremental,
         )
 
-    def gov_identifier_import(self, engine: Engine) -> None:
+    def gov_identifier_import(self, engine: Engine, incremental: bool = False) -> Dict[str, int | None]:
         """
         Executes the government identifier import process.
 
@@ -113,8 +140,80 @@ class ImportContainer:
 
         Args:
             engine (Engine): The database or processing engine used for execution.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            Dict[str, int | None]: Rows loaded per file of the reloaded tables, None for
+                files that failed.
         """
         return self._import_handler.import_handler(
             configs=self._config.gov_identifier_imports(),
             engine=engine,
+            incremental=incremental,
+        )
+
+    def import_tables(self) -> Dict[str, str]:
+        """
+        Maps the configuration name of every import file to the table it is loaded into.
+
+        Returns:
+            Dict[str, str]: Table names keyed by configuration name.
+        """
+        return {
+            config["name"]: config["table_name"]
+            for config in self._config.attribute_imports()
+            + self._config.relationship_imports()
+            + self._config.transformation_imports()
+            + self._config.gov_identifier_imports()
+            + self._config.bhcf_imports()
+        }
+
+    def import_costs(self, engine: Engine) -> Dict[str, float]:
+        """
+        Predicts the seconds each import category takes to load, keyed by its method name.
+
+        Costs are estimated by the `estimate_cost` method of the `ImportHandler` from the
+        size of each file and the load times recorded in the import manifest.
+
+        Args:
+            engine (Engine): The database or processing engine used for execution.
+
+        Returns:
+            Dict[str, float]: Predicted seconds keyed by import method name.
+        """
+        categories = {
+            self.attribute_import.__name__: self._config.attribute_imports(),
+            self.relationship_import.__name__: self._config.relationship_imports(),
+            self.transformation_import.__name__: self._config.transformation_imports(),
+            self.gov_identifier_import.__name__: self._config.gov_identifier_imports(),
+            self.bhcf_import.__name__: self._config.bhcf_imports(),
+        }
+        return {
+            name: self._import_handler.estimate_cost(engine=engine, configs=configs)
+            for name, configs in categories.items()
+        }
+
+    def index_imports(self, engine: Engine) -> bool:
+        """
+        Indexes and analyzes the staging tables of every import category.
+
+        This method combines the configurations of each import category and processes them
+        using the `index_handler` method of the `ImportHandler`, with the worker count and
+        memory setting from the environment.
+
+        Args:
+            engine (Engine): The database or processing engine used for execution.
+
+        Returns:
+            bool: True when every index build and analyze succeeded.
+        """
+        return self._import_handler.index_handler(
+            engine=engine,
+            configs=self._config.attribute_imports()
+            + self._config.relationship_imports()
+            + self._config.transformation_imports()
+            + self._config.gov_identifier_imports()
+            + self._config.bhcf_imports(),
+            workers=maintenance.INDEX_WORKERS,
+            maintenance_work_mem=maintenance.MAINTENANCE_WORK_MEM,
         )
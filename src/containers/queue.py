@@ -0,0 +1,146 @@
+"""
+queue
+
+This module defines the `QueueContainer` class, which wraps the `QueueHandler` so the workers
+of a run can share their tasks through `transformations.task_queue`.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from ..handlers import QueueHandler
+
+
+class QueueContainer:
+    """
+    A container class for the Postgres backed task queue.
+
+    Attributes:
+        _queue_handler (QueueHandler): Enqueues, claims and completes tasks.
+    """
+
+    def __init__(self, queue_handler: QueueHandler):
+        """
+        Initializes the QueueContainer with a queue handler.
+
+        Args:
+            queue_handler (QueueHandler): The handler responsible for the task queue.
+        """
+        self._queue_handler: QueueHandler = queue_handler
+
+    def enqueue(self, db: Session, run_id: str, tasks: List[dict]) -> int:
+        """
+        Adds the tasks of a run to the queue.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID the tasks belong to.
+            tasks (List[dict]): Tasks with their stage, name, dependencies and options.
+
+        Returns:
+            int: Number of tasks added.
+        """
+        return self._queue_handler.enqueue(db=db, run_id=run_id, tasks=tasks)
+
+    def claim(self, db: Session, worker: str, run_id: str | None = None) -> dict | None:
+        """
+        Claims the oldest pending task whose dependencies are done.
+
+        Args:
+            db (Session): The synchronous database session.
+            worker (str): Name of the claiming worker.
+            run_id (str | None): Only claims tasks of this run.
+
+        Returns:
+            dict | None: The claimed task, None when no task can be claimed.
+        """
+        return self._queue_handler.claim(db=db, worker=worker, run_id=run_id)
+
+    def heartbeat(self, db: Session, task_id: int, worker: str, attempts: int) -> bool:
+        """
+        Refreshes the claim of a running task.
+
+        Args:
+            db (Session): The synchronous database session.
+            task_id (int): ID of the claimed task.
+            worker (str): Name of the worker holding the claim.
+            attempts (int): Number of the claim.
+
+        Returns:
+            bool: False when the claim was lost to another worker.
+        """
+        return self._queue_handler.heartbeat(
+            db=db, task_id=task_id, worker=worker, attempts=attempts
+        )
+
+    def complete(
+        self,
+        db: Session,
+        task_id: int,
+        worker: str,
+        attempts: int,
+        error: str | None = None,
+    ) -> bool:
+        """
+        Marks a claimed task done, or failed with its error, unless its claim was lost.
+
+        Args:
+            db (Session): The synchronous database session.
+            task_id (int): ID of the claimed task.
+            worker (str): Name of the worker holding the claim.
+            attempts (int): Number of the claim.
+            error (str | None): Error of a failed task.
+
+        Returns:
+            bool: False when the task was claimed again by another worker.
+        """
+        return self._queue_handler.complete(
+            db=db, task_id=task_id, worker=worker, attempts=attempts, error=error
+        )
+
+    def requeue(self, db: Session, run_id: str) -> int:
+        """
+        Returns the failed and held tasks of a run to the queue.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            int: Number of tasks requeued.
+        """
+        return self._queue_handler.requeue(db=db, run_id=run_id)
+
+    def hold_blocked(self, db: Session, run_id: str) -> int:
+        """
+        Holds the pending tasks of a run that depend on a failed task.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            int: Number of tasks held.
+        """
+        return self._queue_handler.hold_blocked(db=db, run_id=run_id)
+
+    def run_status(self, db: Session, run_id: str) -> Dict[str, int]:
+        """
+        Counts the tasks of a run per status.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID of the tasks.
+        """
+        return self._queue_handler.run_status(db=db, run_id=run_id)
+
+    def stage_status(self, db: Session, run_id: str) -> Dict[str, Dict[str, int]]:
+        """
+        Counts the tasks of a run per stage and status.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID of the tasks.
+        """
+        return self._queue_handler.stage_status(db=db, run_id=run_id)
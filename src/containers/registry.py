@@ -14,6 +14,9 @@ The module ensures proper coordination between workers, session management, and
 asynchronous PostgreSQL database connections, enabling efficient task execution.
 """
 
+from ..constants import ledger
+from ..constants import queue as queues
+from ..logger import logger
 from .schema import SchemaContainer
 from .session import SessionContainer
 from .worker import WorkerContainer
@@ -51,25 +54,110 @@ class RegistryContainer:
         self._session: SessionContainer = session
         self._schema: SchemaContainer = schema
 
-    def process(self) -> None:
+    def process(
+        self,
+        incremental: bool = False,
+        profile: bool = False,
+        resume: bool = False,
+        queue: bool = False,
+    ) -> None:
         """
         Executes the complete process pipeline.
 
         This method:
         1. Sets up dependencies using a shared PostgreSQL database connection.
         2. Triggers import tasks using a new PostgreSQL engine session.
-        3. Executes script-based worker tasks using a separate PostgreSQL database connection.
+        3. Indexes and analyzes the loaded staging tables.
+        4. Executes script-based worker tasks on pooled PostgreSQL connections.
+        5. Stores the per-statement script metrics and writes the run's JSON report.
 
         The workflow ensures that all required dependencies are initialized before
-        executing imports and scripts.
+        executing imports and scripts. On incremental runs only the scripts downstream of
+        the reloaded tables run, none when no import file changed since its last load.
+        On profiling runs the scripts are explained and rolled back instead of executed.
+
+        Every completed stage and script is recorded in the run ledger under the run ID.
+        A resumed run continues the latest run: staging and tmp tables are kept, imports
+        skip the files recorded in the import manifest, the index stage is skipped when it
+        completed and nothing was reloaded, and scripts completed under the run ID are
+        skipped while their fingerprint matches.
+
+        A queued run enqueues its import, index and script tasks in the task queue instead,
+        and works on them together with the workers started by `work`. Each stage is recorded
+        once every one of its tasks is done.
+
+        Args:
+            incremental (bool): Skips import files that are unchanged since their last load.
+            profile (bool): Captures script query plans without keeping their changes.
+            resume (bool): Continues the latest run from its checkpoints.
+            queue (bool): Shares the tasks of the run with the workers pulling the task queue.
         """
         with self._session.get_postgres_shared_db() as shared_db:
-            self._worker.dependency(db=shared_db)
+            run_id = self._worker.start_run(db=shared_db, resume=resume)
+            self._worker.dependency(
+                db=shared_db, incremental=incremental or resume, resume=resume
+            )
+            completed = (
+                self._worker.completed_stages(db=shared_db, run_id=run_id)
+                if resume
+                else set()
+            )
+            logger.info(
+                f"service: process  |  run_id: {run_id}  |  resume: {resume}  |  completed: {sorted(completed)}"
+            )
+            self._worker.complete_stage(db=shared_db, run_id=run_id, stage=ledger.DEPENDENCY)
+
+        if queue:
+            stages = self._worker.queue_workers(
+                run_id=run_id, incremental=incremental or resume, resume=resume
+            )
+            with self._session.get_postgres_shared_db() as shared_db:
+                # a stage is complete once every one of its tasks is done
+                for stage in (ledger.IMPORTS, ledger.INDEX, ledger.SCRIPTS):
+                    if set(stages.get(stage, {})) <= {queues.DONE}:
+                        self._worker.complete_stage(db=shared_db, run_id=run_id, stage=stage)
+                self._worker.script_metrics(db=shared_db, run_id=run_id)
+            logger.info(f"service: process  |  run_id: {run_id}  |  pool: {self._session.pool_stats()}")
+            return
+
+        changed, imported = self._worker.import_workers(incremental=incremental or resume)
+        if imported:
+            with self._session.get_postgres_shared_db() as shared_db:
+                self._worker.complete_stage(db=shared_db, run_id=run_id, stage=ledger.IMPORTS)
+
+        # a failed import leaves the index stage open, a resumed run indexes the reloaded tables
+        if profile or changed or not imported or not (incremental or ledger.INDEX in completed):
+            indexed = self._worker.index_workers()
+            if imported and indexed:
+                with self._session.get_postgres_shared_db() as shared_db:
+                    self._worker.complete_stage(
+                        db=shared_db, run_id=run_id, stage=ledger.INDEX
+                    )
+
+        if profile:
+            with self._session.get_postgres_db() as db:
+                self._worker.profile_workers(db=db)
+        elif incremental and not resume and not changed:
+            logger.info("service: process  |  message: No import files changed, skipping scripts")
+        elif not self._worker.script_workers(
+            run_id=run_id,
+            resume=resume,
+            # a resumed run also runs the scripts an earlier attempt left unfinished
+            tables=changed if incremental and not resume else None,
+        ):
+            with self._session.get_postgres_shared_db() as shared_db:
+                self._worker.complete_stage(db=shared_db, run_id=run_id, stage=ledger.SCRIPTS)
+
+        with self._session.get_postgres_shared_db() as shared_db:
+            self._worker.script_metrics(db=shared_db, run_id=run_id)
 
-        self._worker.import_workers()
+        logger.info(f"service: process  |  run_id: {run_id}  |  pool: {self._session.pool_stats()}")
 
-        with self._session.get_postgres_db() as db:
-            self._worker.script_workers(db=db)
+    def work(self) -> None:
+        """
+        Pulls tasks of every queued run from the task queue until the process is stopped.
+        """
+        self._worker.work()
 
     def create_schema(self) -> None:
         """
@@ -6,9 +6,15 @@ various SQL scripts for the ELT processes. It utilizes configurations provided b
 and executes scripts using `ScriptHandler`.
 """
 
-from sqlalchemy.orm import Session  # Updated to use synchronous Session
+import uuid
+from typing import Dict, List, Set
 
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..constants import codes, executor, ledger
+from ..constants.objects import ScriptsConfig
 from ..handlers import ScriptHandler
+from ..logger import logger
 from .config import ConfigContainer
 
 
@@ -51,6 +57,21 @@ class ScriptContainer:
             configs=self._config.preflight_scripts(),
         )
 
+    def import_preflight_scripts(self, db: Session) -> None:
+        """
+        Executes the import preflight script process synchronously.
+
+        These scripts drop the imported staging tables before a full import.
+        Configurations are fetched from `import_preflight_scripts` in the config container.
+
+        Args:
+            db (Session): The synchronous database session.
+        """
+        return self._script_handler.execute_scripts(
+            db=db,
+            configs=self._config.import_preflight_scripts(),
+        )
+
     def dependency_scripts(self, db: Session) -> None:
         """
         Executes the dependency script import process synchronously.
@@ -140,3 +161,229 @@ class ScriptContainer:
             db=db,
             configs=self._config.call_report_scripts(),
         )
+
+    def cleanup_scripts(self, db: Session) -> None:
+        """
+        Executes the cleanup script process synchronously.
+
+        These scripts drop tmp tables and functions once every category has run.
+        Configurations are fetched from `cleanup_scripts` in the config container.
+
+        Args:
+            db (Session): The synchronous database session.
+        """
+        return self._script_handler.execute_scripts(
+            db=db,
+            configs=self._config.cleanup_scripts(),
+        )
+
+    def load_codes(self, db: Session) -> None:
+        """
+        Loads the code dictionary the transformation scripts translate codes with.
+
+        Args:
+            db (Session): The synchronous database session.
+        """
+        return self._script_handler.load_codes(db=db, codes=codes.CODES)
+
+    def _transformation_configs(self) -> List[ScriptsConfig]:
+        """
+        Collects the attribute, relationship, transformation, government identifier, call
+        report and cleanup scripts in their reference order.
+        """
+        return [
+            *self._config.attribute_scripts(),
+            *self._config.relationship_scripts(),
+            *self._config.transformation_scripts(),
+            *self._config.gov_identifier_scripts(),
+            *self._config.call_report_scripts(),
+            *self._config.cleanup_scripts(),
+        ]
+
+    def dag_scripts(
+        self,
+        session_factory: sessionmaker,
+        workers: int = executor.SCRIPT_WORKERS,
+        run_id: str | None = None,
+        resume: bool = False,
+        tables: Set[str] | None = None,
+    ) -> Set[str]:
+        """
+        Executes the attribute, relationship, transformation, government identifier, call
+        report and cleanup scripts as a dependency graph.
+
+        Given the imported tables that changed, only the scripts reading them, the scripts
+        depending on those and the cleanup scripts run, see `ScriptHandler.downstream`.
+
+        Independent scripts run concurrently, each on its own session from the factory. With
+        a run ID every committed script is recorded in the run ledger with its fingerprint.
+        A resumed run skips the scripts recorded under its run ID. When the fingerprint of a
+        recorded script changed, its tmp tables already hold the earlier result, so the
+        preflight and dependency scripts recreate them and every script runs again.
+
+        Args:
+            session_factory (sessionmaker): Factory bound to a pooled engine.
+            workers (int): Maximum number of scripts running at once.
+            run_id (str | None): Run ID the scripts are recorded under.
+            resume (bool): Skips the scripts completed under the run ID.
+            tables (Set[str] | None): Imported tables that changed, None runs every script.
+
+        Returns:
+            Set[str]: Names of the scripts that failed or were held back.
+        """
+        configs = self._transformation_configs()
+        if tables is not None:
+            selected = self._script_handler.downstream(configs=configs, tables=tables)
+            if selected:
+                selected |= {config["name"] for config in self._config.cleanup_scripts()}
+            configs = [config for config in configs if config["name"] in selected]
+            logger.info(
+                f"service: dag_scripts  |  tables: {sorted(tables)}  |  scripts: {[config['name'] for config in configs]}"
+            )
+        if run_id is None:
+            return self._script_handler.execute_dag(
+                session_factory=session_factory, configs=configs, workers=workers
+            )
+
+        with session_factory() as db:
+            fingerprints = self._script_handler.script_fingerprints(db=db, configs=configs)
+            completed = (
+                self.checkpoints(db=db, run_id=run_id, stage=ledger.SCRIPTS)
+                if resume
+                else {}
+            )
+
+        stale = sorted(
+            name for name, fingerprint in completed.items() if fingerprints.get(name) != fingerprint
+        )
+        if stale:
+            logger.warning(
+                f"service: dag_scripts  |  run_id: {run_id}  |  stale: {stale}  |  message: Inputs changed since the checkpoint, running every script"
+            )
+            with session_factory() as db:
+                self.preflight_scripts(db=db)
+                self.dependency_scripts(db=db)
+                self.load_codes(db=db)
+            completed = {}
+
+        def on_complete(name: str) -> None:
+            with session_factory() as db:
+                self.record_checkpoint(
+                    db=db,
+                    run_id=run_id,
+                    stage=ledger.SCRIPTS,
+                    item=name,
+                    fingerprint=fingerprints[name],
+                )
+
+        return self._script_handler.execute_dag(
+            session_factory=session_factory,
+            configs=configs,
+            workers=workers,
+            completed=completed,
+            on_complete=on_complete,
+        )
+
+    def script_dag(self) -> Dict[str, Set[str]]:
+        """
+        Returns the scripts each executable transformation script depends on, keyed by name.
+        """
+        return self._script_handler.build_dag(
+            configs=[
+                config
+                for config in self._transformation_configs()
+                if config.get("allow_exe")
+            ]
+        )
+
+    def run_script(self, db: Session, name: str) -> bool:
+        """
+        Executes one transformation script by name.
+
+        Args:
+            db (Session): The synchronous database session.
+            name (str): Name of the script, see `script_dag`.
+
+        Returns:
+            bool: True when the script was committed.
+        """
+        config = next(
+            config for config in self._transformation_configs() if config["name"] == name
+        )
+        return self._script_handler.execute_script(db=db, config=config)
+
+    def start_run(self, db: Session, resume: bool = False) -> str:
+        """
+        Returns the run ID of this pipeline run.
+
+        Args:
+            db (Session): The synchronous database session.
+            resume (bool): Reuses the run ID of the latest run recorded in the run ledger.
+
+        Returns:
+            str: Run ID, a new one when not resuming or no run was recorded yet.
+        """
+        run_id = self._script_handler.latest_run(db=db) if resume else None
+        return run_id or uuid.uuid4().hex
+
+    def checkpoints(self, db: Session, run_id: str, stage: str) -> Dict[str, str | None]:
+        """
+        Returns the items of a stage completed under a run ID with their fingerprint.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID the items were recorded under.
+            stage (str): Stage of the items, see `ledger`.
+        """
+        return self._script_handler.checkpoints(db=db, run_id=run_id, stage=stage)
+
+    def record_checkpoint(
+        self,
+        db: Session,
+        run_id: str,
+        stage: str,
+        item: str,
+        fingerprint: str | None = None,
+    ) -> None:
+        """
+        Records an item of a stage as completed under a run ID in the run ledger.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID of the pipeline run.
+            stage (str): Stage of the item, see `ledger`.
+            item (str): Name of the completed stage or script.
+            fingerprint (str | None): Fingerprint the item was completed with.
+        """
+        return self._script_handler.record_checkpoint(
+            db=db, run_id=run_id, stage=stage, item=item, fingerprint=fingerprint
+        )
+
+    def profile_scripts(self, db: Session) -> str:
+        """
+        Captures query plans for the transformation scripts in a transaction that is rolled back.
+
+        Args:
+            db (Session): The synchronous database session.
+
+        Returns:
+            str: Path of the JSON report.
+        """
+        return self._script_handler.profile_scripts(
+            db=db, configs=self._transformation_configs()
+        )
+
+    def record_metrics(self, db: Session, run_id: str) -> str:
+        """
+        Persists the statement metrics of the scripts executed in this run.
+
+        Metrics are stored in `script_metrics` and written to a JSON report.
+
+        Args:
+            db (Session): The synchronous database session.
+            run_id (str): Run ID the metrics are recorded under.
+
+        Returns:
+            str: Path of the JSON report.
+        """
+        return self._script_handler.record_metrics(db=db, run_id=run_id)
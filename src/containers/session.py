@@ -5,6 +5,11 @@ This module defines the `SessionContainer` class, which provides methods for cre
 and managing PostgreSQL database sessions. It supports synchronous session management
 while implementing a singleton pattern for engine reuse.
 
+Each process holds one pooled engine. A forked worker process inherits its parent's engine
+object but not the right to use its connections, so the engine is recreated the first time
+a process other than its creator asks for it. Threads within a process share the engine,
+its pool hands each thread a connection of its own.
+
 Dependencies:
     - `Engine`, `create_engine`: Synchronous database engine utilities from SQLAlchemy.
     - `Session`, `sessionmaker`: Synchronous session management utilities.
@@ -14,8 +19,11 @@ The `SessionContainer` class supports:
     - Creating new synchronous PostgreSQL engines.
     - Caching and reusing a singleton engine for synchronous connections.
     - Generating session factories for database interactions.
+    - Reporting the pool usage of the singleton engine.
 """
 
+import os
+import threading
 from contextlib import contextmanager
 from typing import Generator
 
@@ -36,10 +44,14 @@ class SessionContainer:
 
     Attributes:
         _postgres_engine (Engine or None): Cached synchronous PostgreSQL engine.
+        _postgres_engine_pid (int or None): Process that created the cached engine.
+        _postgres_engine_lock (threading.Lock): Serializes the creation of the cached engine.
         _postgres_connection (str): Database connection URL from constants.
     """
 
     _postgres_engine: Engine = None
+    _postgres_engine_pid: int | None = None
+    _postgres_engine_lock: threading.Lock = threading.Lock()
     _postgres_connection: str = connection.POSTGRES_CONNECTION
 
     @classmethod
@@ -47,36 +59,72 @@ class SessionContainer:
         """
         Creates a new synchronous SQLAlchemy engine for PostgreSQL.
 
-        This method returns a fresh engine instance each time it is called.
+        This method returns a fresh engine instance with its own pool each time it is called,
+        prefer `get_postgres_engine` unless the engine must not be shared.
 
         Returns:
             Engine: A new synchronous SQLAlchemy engine for PostgreSQL.
         """
-        return create_engine(url=cls._postgres_connection, echo=False)
+        return create_engine(
+            url=cls._postgres_connection,
+            echo=False,
+            pool_size=connection.POOL_SIZE,
+            max_overflow=connection.MAX_OVERFLOW,
+            pool_timeout=connection.POOL_TIMEOUT,
+            pool_recycle=connection.POOL_RECYCLE,
+            pool_pre_ping=connection.POOL_PRE_PING,
+        )
 
     @classmethod
     def get_postgres_engine(cls) -> Engine:
         """
-        Retrieves or initializes the singleton synchronous PostgreSQL engine.
+        Retrieves or initializes the singleton synchronous PostgreSQL engine of the current process.
 
-        If a cached engine instance exists, it is returned. Otherwise, a new engine
-        is created and cached for reuse.
+        If a cached engine instance exists and was created by this process, it is returned.
+        Otherwise, a new engine is created and cached for reuse. An engine inherited through
+        fork is discarded without closing its connections, which still belong to the parent.
 
         Returns:
             Engine: A cached or newly created synchronous SQLAlchemy engine.
         """
-        if cls._postgres_engine is None:
-            cls._postgres_engine = create_engine(
-                url=cls._postgres_connection, echo=False
-            )
+        pid = os.getpid()
+        if cls._postgres_engine is not None and cls._postgres_engine_pid == pid:
+            return cls._postgres_engine
+
+        with cls._postgres_engine_lock:
+            if cls._postgres_engine_pid != pid:
+                if cls._postgres_engine is not None:
+                    cls._postgres_engine.dispose(close=False)
+                cls._postgres_engine = cls.create_postgres_engine()
+                cls._postgres_engine_pid = pid
         return cls._postgres_engine
 
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """
+        Reports the pool usage of the singleton engine of the current process.
+
+        Returns:
+            dict: Process id, configured size and overflow, and the connections currently
+                  checked in, checked out and opened beyond the pool size.
+        """
+        pool = cls.get_postgres_engine().pool
+        return {
+            "pid": os.getpid(),
+            "pool_size": pool.size(),
+            "max_overflow": connection.MAX_OVERFLOW,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
     @classmethod
     def create_postgres_session_factory(cls) -> sessionmaker:
         """
         Creates a new session factory bound to a fresh PostgreSQL engine.
 
-        This method provides an independent session factory that does not reuse a cached engine.
+        This method provides an independent session factory that does not reuse a cached engine,
+        the engine's connections are only closed once the factory is garbage collected.
 
         Returns:
             sessionmaker: A new session factory for PostgreSQL interactions.
@@ -109,9 +157,9 @@ class SessionContainer:
         """
         Retrieves a new database session from the session factory.
 
-        This function creates a new session factory using `SessionContainer.create_postgres_session_factory()`
-        and provides an isolated session within the `with` context. The session will be automatically closed
-        after use.
+        This function provides an isolated session within the `with` context, backed by a connection
+        from the pool of the singleton engine. The session will be automatically closed after use,
+        returning its connection to the pool.
 
         Yields:
             Session: A synchronous database session that can be used to interact with the database.
@@ -121,7 +169,7 @@ class SessionContainer:
                 # Use the db session here
                 result = db.execute(query)
         """
-        LocalSession = cls.create_postgres_session_factory()
+        LocalSession = cls.get_postgres_session_factory()
         with LocalSession() as db:
             try:
                 yield db
@@ -152,3 +200,11 @@ class SessionContainer:
                 yield db
             finally:
                 db.close()
+
+
+# a thread holding the lock while the process forks would leave it held in the child
+os.register_at_fork(
+    after_in_child=lambda: setattr(
+        SessionContainer, "_postgres_engine_lock", threading.Lock()
+    )
+)
@@ -2,30 +2,43 @@
 worker
 
 This module defines the `WorkerContainer` class, which centralizes the execution of workers
-in separate processes using process-based concurrency.
+on a configurable backend of threads, processes or an asyncio event loop, or through a
+Postgres backed task queue shared by workers on any number of hosts.
 """
 
-from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import heapq
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Set, Tuple
 
 from sqlalchemy.orm import Session
 
 
+from ..constants import executor, ledger, queue
 from .imports import ImportContainer
 from ..logger import logger
+from .queue import QueueContainer
 from .script import ScriptContainer
 from .session import SessionContainer
 
 
 class WorkerContainer:
     """
-    Manages parallel execution of import and script tasks using process-based concurrency.
+    Manages parallel execution of import and script tasks on a configurable backend.
 
     This class acts as a container for handling data imports and script execution,
-    utilizing `ProcessPoolExecutor` to execute tasks concurrently.
+    running the tasks of each stage on threads, processes or an asyncio event loop,
+    see `executor`.
 
     Attributes:
         _import (ImportContainer): Handles data import operations.
         _script (ScriptContainer): Handles script execution.
+        _queue (QueueContainer): Shares tasks between workers through the database.
     """
 
     def __init__(
@@ -33,6 +46,7 @@ class WorkerContainer:
         import_: ImportContainer,
         script: ScriptContainer,
         session: SessionContainer,
+        queue_: QueueContainer,
     ):
         """
         Initializes the WorkerContainer with import and script handling containers.
@@ -40,83 +54,497 @@ class WorkerContainer:
         Parameters:
             import_ (ImportContainer): Instance responsible for handling data imports.
             script (ScriptContainer): Instance responsible for executing scripts.
+            queue_ (QueueContainer): Instance responsible for the task queue.
         """
         self._import: ImportContainer = import_
         self._script: ScriptContainer = script
         self._session: SessionContainer = session
+        self._queue: QueueContainer = queue_
 
-    def dependency(self, db: Session):
+    def dependency(self, db: Session, incremental: bool = False, resume: bool = False):
         """
-        Executes preflight and dependency scripts sequentially.
+        Executes preflight and dependency scripts sequentially, then loads the code dictionary.
 
         This ensures that necessary scripts required for imports or other operations
-        are executed before running workers.
+        are executed before running workers. Imported staging tables are only dropped
+        on full runs, incremental runs keep them for the import manifest to compare.
+        Resumed runs also keep the tmp tables written by the scripts already completed.
 
         Parameters:
             db (Session): The database session used for script execution.
+            incremental (bool): Keeps imported staging tables for incremental imports.
+            resume (bool): Skips the preflight scripts dropping the tmp tables.
         """
-        self._script.preflight_scripts(db=db)
+        if not resume:
+            self._script.preflight_scripts(db=db)
+        if not incremental:
+            self._script.import_preflight_scripts(db=db)
         self._script.dependency_scripts(db=db)
+        self._script.load_codes(db=db)
 
-    def safe_wrapper(self, func):
-        """Creates a fresh DB engine inside each subprocess."""
+    def safe_wrapper(self, func, **kwargs):
+        """Runs a task on the pooled engine of the current process, shared by its later tasks."""
         try:
             logger.info(f"Starting {func.__name__}")
 
-            # Create a new engine inside the subprocess
-            engine = self._session.create_postgres_engine()
+            # one engine per worker process, created on its first task
+            engine = self._session.get_postgres_engine()
 
-            func(engine)  # Use the engine inside the subprocess
-            logger.info(f"Completed {func.__name__}")
+            result = func(engine, **kwargs)
+            logger.info(
+                f"Completed {func.__name__}  |  pool: {self._session.pool_stats()}"
+            )
+            return result
 
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {e}")
 
-    def import_workers(self):
+    async def _gather(self, tasks: List[Callable], workers: int | None, **kwargs) -> list:
         """
-        Executes import-related tasks concurrently using process-based concurrency.
+        Awaits every task on the running event loop, each in the loop's default thread pool.
 
         Parameters:
-            engine (Engine): The SQLAlchemy engine used for database interactions.
+            tasks (List[Callable]): Functions taking an engine as their first argument.
+            workers (int | None): Tasks running at once, None runs every task at once.
+            kwargs: Keyword arguments passed to every task.
         """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(workers or len(tasks))
 
-        with ProcessPoolExecutor() as exe:
-            futures = [
-                exe.submit(self.safe_wrapper, func)
-                for func in [
-                    self._import.attribute_import,
-                    self._import.relationship_import,
-                    self._import.transformation_import,
-                    self._import.gov_identifier_import,
-                    self._import.bhcf_import,
-                ]
-            ]
+        async def run(func: Callable):
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None, partial(self.safe_wrapper, func, **kwargs)
+                )
 
-            for future in futures:
-                future.result()
+        return await asyncio.gather(*(run(func) for func in tasks))
 
-    def script_workers(self, db: Session):
+    def execute(
+        self,
+        tasks: List[Callable],
+        backend: str,
+        workers: int | None = None,
+        **kwargs,
+    ) -> list:
+        """
+        Runs tasks concurrently on the selected backend, each through `safe_wrapper`.
+
+        Threads and the event loop share the pooled engine of this process, a process pool
+        pickles the container into each worker, which creates an engine of its own.
+
+        Parameters:
+            tasks (List[Callable]): Functions taking an engine as their first argument.
+            backend (str): "thread", "process" or "asyncio", see `executor`.
+            workers (int | None): Tasks running at once, None uses the backend's default.
+            kwargs: Keyword arguments passed to every task.
+
+        Returns:
+            list: Result of each task in the order of `tasks`, None for tasks that failed.
+        """
+        if backend == executor.ASYNCIO:
+            return asyncio.run(self._gather(tasks, workers, **kwargs))
+
+        pools = {
+            executor.THREAD: ThreadPoolExecutor,
+            executor.PROCESS: ProcessPoolExecutor,
+        }
+        if backend not in pools:
+            raise ValueError(f"Unknown executor backend: {backend}")
+
+        with pools[backend](max_workers=workers) as exe:
+            futures = [exe.submit(self.safe_wrapper, func, **kwargs) for func in tasks]
+            return [future.result() for future in futures]
+
+    def _import_tasks(self) -> List[Callable]:
+        """Lists the import categories, each run as one task."""
+        return [
+            self._import.attribute_import,
+            self._import.relationship_import,
+            self._import.transformation_import,
+            self._import.gov_identifier_import,
+            self._import.bhcf_import,
+        ]
+
+    def _schedule(
+        self, tasks: List[Callable], costs: Dict[str, float], workers: int
+    ) -> Tuple[List[Callable], float]:
+        """
+        Orders tasks longest predicted first and predicts the makespan of that order.
+
+        Each task is handed to the worker that frees up first, so the prediction replays the
+        order on that many workers.
+
+        Parameters:
+            tasks (List[Callable]): Tasks keyed in `costs` by their name.
+            costs (Dict[str, float]): Predicted seconds of each task.
+            workers (int): Tasks running at once.
+
+        Returns:
+            Tuple[List[Callable], float]: The ordered tasks and the predicted makespan in seconds.
+        """
+        ordered = sorted(tasks, key=lambda func: costs.get(func.__name__, 0.0), reverse=True)
+        loads = [0.0] * max(1, min(workers, len(tasks)))
+        for func in ordered:
+            heapq.heapreplace(loads, loads[0] + costs.get(func.__name__, 0.0))
+        return ordered, max(loads)
+
+    def import_workers(
+        self,
+        incremental: bool = False,
+        backend: str = executor.IMPORT_EXECUTOR,
+        workers: int | None = executor.IMPORT_WORKERS,
+    ) -> Tuple[Set[str], bool]:
+        """
+        Executes import-related tasks concurrently on the configured backend.
+
+        Categories are submitted longest first by their predicted load time, see
+        `import_costs`, so a large file does not start last and set the makespan. The
+        predicted and actual makespan are logged.
+
+        Parameters:
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+            backend (str): "thread", "process" or "asyncio", see `executor`.
+            workers (int | None): Import categories running at once.
+
+        Returns:
+            Tuple[Set[str], bool]: Names of the tables a file was loaded into, and whether
+                every file that was attempted loaded, so the stage can be checkpointed.
+        """
+        # defaults of the thread and process pools, the event loop runs every task at once,
+        # resolved here so the schedule and the executor assume the same pool size
+        cpus = os.cpu_count() or 1
+        running = workers or {
+            executor.THREAD: min(32, cpus + 4),
+            executor.PROCESS: cpus,
+        }.get(backend, len(self._import_tasks()))
+        costs = self._import.import_costs(engine=self._session.get_postgres_engine())
+        tasks, predicted = self._schedule(
+            tasks=self._import_tasks(), costs=costs, workers=running
+        )
+        logger.info(
+            f"service: import_workers  |  order: {[func.__name__ for func in tasks]}  |  predicted_s: {[round(costs[func.__name__], 3) for func in tasks]}"
+        )
+
+        start = time.perf_counter()
+        results = self.execute(
+            tasks=tasks,
+            backend=backend,
+            workers=running,
+            incremental=incremental,
+        )
+        logger.info(
+            f"service: import_workers  |  executor: {backend}  |  workers: {running}  |  predicted_s: {predicted:.3f}  |  elapsed_s: {time.perf_counter() - start:.3f}"
+        )
+        # a category that raised returns None, a file that failed is None in its category
+        tables = self._import.import_tables()
+        changed = {
+            tables[name]
+            for loads in results
+            if loads
+            for name, row_count in loads.items()
+            if row_count is not None
+        }
+        complete = all(
+            loads is not None and None not in loads.values() for loads in results
+        )
+        if not complete:
+            logger.warning(
+                "service: import_workers  |  message: Some imports failed, see the log above"
+            )
+        return changed, complete
+
+    def index_workers(self) -> bool:
+        """
+        Indexes and analyzes the loaded staging tables before the scripts read them.
+
+        Runs once every import has finished, on an engine of its own whose connections
+        build the indexes concurrently.
+
+        Returns:
+            bool: True when every index build and analyze succeeded.
+        """
+        start = time.perf_counter()
+        indexed = bool(self.safe_wrapper(self._import.index_imports))
+        logger.info(
+            f"service: index_workers  |  indexed: {indexed}  |  elapsed_s: {time.perf_counter() - start:.3f}"
+        )
+        return indexed
+
+    def script_workers(
+        self,
+        run_id: str | None = None,
+        resume: bool = False,
+        tables: Set[str] | None = None,
+    ) -> Set[str]:
+        """
+        Executes the script categories as a dependency graph of their declared tables.
+
+        Independent scripts run concurrently on sessions from the pooled singleton engine,
+        each starting as soon as the scripts it depends on have finished.
+
+        Parameters:
+            run_id (str | None): Run ID the completed scripts are recorded under.
+            resume (bool): Skips the scripts completed under the run ID.
+            tables (Set[str] | None): Imported tables that changed, only the scripts
+                downstream of them run, None runs every script.
+
+        Returns:
+            Set[str]: Names of the scripts that failed or were held back.
+        """
+        start = time.perf_counter()
+        failed = self._script.dag_scripts(
+            session_factory=self._session.get_postgres_session_factory(),
+            run_id=run_id,
+            resume=resume,
+            tables=tables,
+        )
+        logger.info(
+            f"service: script_workers  |  workers: {executor.SCRIPT_WORKERS}  |  failed: {sorted(failed)}  |  elapsed_s: {time.perf_counter() - start:.3f}"
+        )
+        return failed
+
+    def start_run(self, db: Session, resume: bool = False) -> str:
+        """
+        Returns the run ID of this pipeline run, the latest recorded one when resuming.
+
+        Parameters:
+            db (Session): The database session the run ledger is read with.
+            resume (bool): Reuses the run ID of the latest run.
+        """
+        return self._script.start_run(db=db, resume=resume)
+
+    def completed_stages(self, db: Session, run_id: str) -> Set[str]:
+        """
+        Returns the stages completed under a run ID.
+
+        Parameters:
+            db (Session): The database session the run ledger is read with.
+            run_id (str): Run ID of the pipeline run.
         """
-        Executes script-related tasks concurrently using process-based concurrency.
+        return set(self._script.checkpoints(db=db, run_id=run_id, stage=ledger.STAGE))
 
-        The following script methods are executed in parallel:
-            - attribute_scripts
-            - relationship_scripts
-            - transformation_scripts
-            - gov_identifier_scripts
-            - call_report_scripts
+    def complete_stage(self, db: Session, run_id: str, stage: str) -> None:
+        """
+        Records a stage as completed under a run ID.
+
+        Parameters:
+            db (Session): The database session the run ledger is written with.
+            run_id (str): Run ID of the pipeline run.
+            stage (str): Completed stage, see `ledger`.
+        """
+        self._script.record_checkpoint(db=db, run_id=run_id, stage=ledger.STAGE, item=stage)
+
+    def profile_workers(self, db: Session) -> str:
+        """
+        Profiles the script categories instead of executing them, every change is rolled back.
+
+        Parameters:
+            db (Session): The database session the scripts are profiled on.
+        """
+        return self._script.profile_scripts(db=db)
+
+    def script_metrics(self, db: Session, run_id: str) -> str:
+        """
+        Persists the per-statement metrics of every script executed so far.
+
+        Parameters:
+            db (Session): The database session used to store the metrics.
+            run_id (str): Run ID the metrics are recorded under.
+        """
+        return self._script.record_metrics(db=db, run_id=run_id)
+
+    def enqueue_run(self, db: Session, run_id: str, incremental: bool = False) -> int:
+        """
+        Enqueues the import, index and script tasks of a run.
+
+        Imports depend on nothing and are enqueued longest predicted first, since workers
+        claim the oldest task. The index task depends on every import, and each script on the
+        index task and the scripts it depends on in the dependency graph.
+
+        Parameters:
+            db (Session): The database session the tasks are enqueued with.
+            run_id (str): Run ID of the tasks.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+
+        Returns:
+            int: Number of tasks added.
+        """
+        costs = self._import.import_costs(engine=self._session.get_postgres_engine())
+        imports = sorted(costs, key=costs.get, reverse=True)
+        tasks = [
+            {"stage": ledger.IMPORTS, "task": name, "options": {"incremental": incremental}}
+            for name in imports
+        ]
+        tasks.append({"stage": ledger.INDEX, "task": ledger.INDEX, "depends_on": imports})
+        tasks.extend(
+            {"stage": ledger.SCRIPTS, "task": name, "depends_on": [*depends_on, ledger.INDEX]}
+            for name, depends_on in self._script.script_dag().items()
+        )
+        return self._queue.enqueue(db=db, run_id=run_id, tasks=tasks)
+
+    def run_task(self, task: dict) -> str | None:
+        """
+        Executes a claimed task on the pooled engine of this process.
+
+        Parameters:
+            task (dict): Claimed task with its stage, name and options.
+
+        Returns:
+            str | None: Error of a failed task, None when the task succeeded.
+        """
+        try:
+            if task["stage"] == ledger.IMPORTS:
+                func = {func.__name__: func for func in self._import_tasks()}[task["task"]]
+                loads = self.safe_wrapper(func, **task["options"])
+                if loads is None or None in loads.values():
+                    return f"{task['task']} failed, see the worker log"
+                return None
+            if task["stage"] == ledger.INDEX:
+                if not self.safe_wrapper(self._import.index_imports):
+                    return "index failed, see the worker log"
+                return None
+            if task["stage"] == ledger.SCRIPTS:
+                with self._session.get_postgres_session_factory()() as db:
+                    if not self._script.run_script(db=db, name=task["task"]):
+                        return f"{task['task']} failed, see the worker log"
+                return None
+            return f"Unknown task stage: {task['stage']}"
+        except Exception as e:
+            logger.error(f"Error in {task['task']}: {e}")
+            return str(e)
+
+    def heartbeat(self, task: dict, worker: str, stop: threading.Event) -> None:
+        """
+        Refreshes the claim of a task every `queue.HEARTBEAT_INTERVAL` seconds until stopped.
+
+        Runs on a thread of its own while the task runs, so a task that outlasts
+        `queue.TASK_TIMEOUT` is not claimed by a second worker. A refresh that fails is
+        retried at the next interval, a lost claim ends the heartbeat.
+
+        Parameters:
+            task (dict): Claimed task with its ID and the number of its claim.
+            worker (str): Name of the worker holding the claim.
+            stop (threading.Event): Set once the task has finished.
+        """
+        session_factory = self._session.get_postgres_session_factory()
+        while not stop.wait(queue.HEARTBEAT_INTERVAL):
+            try:
+                with session_factory() as db:
+                    claimed = self._queue.heartbeat(
+                        db=db, task_id=task["id"], worker=worker, attempts=task["attempts"]
+                    )
+            except Exception as e:
+                logger.warning(f"service: heartbeat  |  task: {task['task']}  |  error: {e}")
+                continue
+            if not claimed:
+                logger.warning(
+                    f"service: heartbeat  |  worker: {worker}  |  task: {task['task']}  |  message: Claim lost to another worker"
+                )
+                return
+
+    def work(self, run_id: str | None = None) -> Dict[str, int]:
+        """
+        Claims and executes queued tasks until stopped, or until a run has finished.
+
+        Workers without a run ID serve every run and persist the metrics of the scripts they
+        executed under the run the scripts belong to, whenever the queue runs dry or a script of
+        another run is claimed. With a run ID the worker returns once no task of the run is
+        pending or running, after holding the tasks that depend on a failed task, and leaves
+        the metrics to its caller. The claim of a task is refreshed while it runs, see
+        `heartbeat`.
 
         Parameters:
-            db (Session): The asynchronous database session used for script execution.
+            run_id (str | None): Only executes tasks of this run and returns when it finishes.
+
+        Returns:
+            Dict[str, int]: Number of tasks of the run per status.
+        """
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        session_factory = self._session.get_postgres_session_factory()
+        logger.info(f"service: work  |  worker: {worker}  |  run_id: {run_id}")
+        # run whose script metrics were collected but not yet recorded
+        executed = None
+        while True:
+            with session_factory() as db:
+                task = self._queue.claim(db=db, worker=worker, run_id=run_id)
+
+            if task is None:
+                with session_factory() as db:
+                    if run_id is not None:
+                        self._queue.hold_blocked(db=db, run_id=run_id)
+                        status = self._queue.run_status(db=db, run_id=run_id)
+                        if not status.get(queue.PENDING) and not status.get(queue.RUNNING):
+                            return status
+                    elif executed is not None:
+                        self._script.record_metrics(db=db, run_id=executed)
+                        executed = None
+                time.sleep(queue.POLL_INTERVAL)
+                continue
+
+            if run_id is None and executed not in (None, task["run_id"]):
+                with session_factory() as db:
+                    self._script.record_metrics(db=db, run_id=executed)
+                executed = None
+
+            start = time.perf_counter()
+            stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=self.heartbeat,
+                kwargs={"task": task, "worker": worker, "stop": stop},
+                daemon=True,
+            )
+            heartbeat.start()
+            try:
+                error = self.run_task(task=task)
+            finally:
+                stop.set()
+                heartbeat.join()
+            with session_factory() as db:
+                completed = self._queue.complete(
+                    db=db,
+                    task_id=task["id"],
+                    worker=worker,
+                    attempts=task["attempts"],
+                    error=error,
+                )
+            if not completed:
+                logger.warning(
+                    f"service: work  |  worker: {worker}  |  task: {task['task']}  |  message: Claim lost to another worker, its result is kept"
+                )
+            if task["stage"] == ledger.SCRIPTS:
+                executed = task["run_id"]
+            logger.info(
+                f"service: work  |  worker: {worker}  |  run_id: {task['run_id']}  |  task: {task['task']}  |  status: {queue.FAILED if error else queue.DONE}  |  elapsed_s: {time.perf_counter() - start:.3f}"
+            )
+
+    def queue_workers(
+        self, run_id: str, incremental: bool = False, resume: bool = False
+    ) -> Dict[str, Dict[str, int]]:
         """
+        Enqueues the tasks of a run and works on them until the run has finished.
+
+        Workers started with `--worker`, on this host or others, claim tasks of the run at
+        the same time, so adding workers adds throughput. A resumed run keeps the tasks it
+        completed and queues its failed and held tasks again.
 
-        with ProcessPoolExecutor() as exe:
-            futures = [
-                exe.submit(self._script.attribute_scripts(db=db)),
-                exe.submit(self._script.relationship_scripts(db=db)),
-                exe.submit(self._script.transformation_scripts(db=db)),
-                exe.submit(self._script.gov_identifier_scripts(db=db)),
-                exe.submit(self._script.call_report_scripts(db=db)),
-            ]
-            for future in futures:
-                future.result()
+        Parameters:
+            run_id (str): Run ID of the tasks.
+            incremental (bool): Skips tables whose files are unchanged since their last load.
+            resume (bool): Queues the failed and held tasks of the run again.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Number of tasks of the run per stage and status.
+        """
+        start = time.perf_counter()
+        session_factory = self._session.get_postgres_session_factory()
+        with session_factory() as db:
+            if resume:
+                self._queue.requeue(db=db, run_id=run_id)
+            self.enqueue_run(db=db, run_id=run_id, incremental=incremental)
+        status = self.work(run_id=run_id)
+        with session_factory() as db:
+            stages = self._queue.stage_status(db=db, run_id=run_id)
+        logger.info(
+            f"service: queue_workers  |  run_id: {run_id}  |  tasks: {status}  |  elapsed_s: {time.perf_counter() - start:.3f}"
+        )
+        return stages
@@ -1,4 +1,5 @@
 from .config import ConfigHandler
 from .importer import ImportHandler
+from .queue import QueueHandler
 from .schema import SchemaHandler
 from .script import ScriptHandler
@@ -4,8 +4,10 @@ handler
 
 import os
 import pprint
+import zipfile
 from typing import List
 
+from ..constants import archive
 from ..constants.objects import FFEICConfig, ScriptsConfig
 from ..logger import logger
 
@@ -19,15 +21,59 @@ class ConfigHandler:
         Key: filename
         value: absolute file path
 
+        Members of zip archives are listed as if they were files in the directory, their value
+        is the archive path and member name joined by `archive.MEMBER_SEP`. Gzip and Zstandard
+        files are keyed by the name before their first extension like any other file.
+
         Parameters:
         - directory: directory name
         """
         wk_dir = os.path.join(os.getcwd(), directory)
 
-        return {
-            file.lower().split(".")[0]: os.path.join(wk_dir, file)
-            for file in os.listdir(path=wk_dir)
-        }
+        file_dict = {}
+        for file in os.listdir(path=wk_dir):
+            file_path = os.path.join(wk_dir, file)
+            if file.lower().endswith(archive.ZIP):
+                file_dict.update(cls._archive_members(file_path=file_path))
+            else:
+                file_dict[file.lower().split(".")[0]] = file_path
+        return file_dict
+
+    @classmethod
+    def _archive_members(cls, file_path: str) -> dict[str, str]:
+        """
+        Lists the files of a zip archive keyed by their lowercase name without extension.
+
+        Parameters:
+        - file_path: zip archive path
+        """
+        with zipfile.ZipFile(file_path) as zf:
+            return {
+                os.path.basename(member).lower().split(".")[0]: f"{file_path}{archive.MEMBER_SEP}{member}"
+                for member in zf.namelist()
+                if not member.endswith("/")
+            }
+
+    @classmethod
+    def _backfill(
+        cls, config: FFEICConfig, file_dict: dict[str, str]
+    ) -> List[FFEICConfig]:
+        """
+        Expands a prefix configuration into one configuration per matching file, in period order.
+
+        Each copy is named after its file and staged in a child table named after the period
+        that follows the prefix, so the files share the target table and load concurrently.
+
+        Parameters:
+        - config: Import JSON entry with a "prefix" key_type
+        - file_dict: File paths keyed by lowercase file name
+        """
+        prefix = len(config["name"])
+        return [
+            {**config, "name": key, "partition": key[prefix:], "file_path": value}
+            for key, value in sorted(file_dict.items())
+            if key[:prefix] == config["name"] and key[prefix:]
+        ]
 
     @classmethod
     def _add_file_path(
@@ -36,7 +82,15 @@ class ConfigHandler:
         """Dynamically adds file paths to configs based on key_type and name."""
         # TODO: Remove logger
         logger.info("File Dictionary: %s", pprint.pformat(file_dict, indent=2))
+        resolved = []
         for config in configs:
+            if config.get("backfill") and config.get("key_type") == "prefix":
+                periods = cls._backfill(config=config, file_dict=file_dict)
+                logger.info(
+                    f"service: backfill  |  name: {config['name']}  |  periods: {[period['partition'] for period in periods]}"
+                )
+                resolved.extend(periods)
+                continue
 
             config["file_path"] = next(
                 (
@@ -51,10 +105,11 @@ class ConfigHandler:
                 ),
                 None,
             )
+            resolved.append(config)
 
         # TODO: Remove logger
-        logger.info("Configs: %s", pprint.pformat(configs, indent=2))
-        return configs
+        logger.info("Configs: %s", pprint.pformat(resolved, indent=2))
+        return resolved
 
     @classmethod
     def create_config(
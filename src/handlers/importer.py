@@ -1,23 +1,1340 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
 import pprint
-from typing import List, Literal
+import queue
+import shutil
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Literal, Tuple
 
 import pandas as pd
-from sqlalchemy import Engine
+import zstandard
+from pandas.io.sql import SQLTable
+from sqlalchemy import (
+    BigInteger,
+    Connection,
+    Date,
+    Engine,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    create_engine,
+    inspect,
+    text,
+)
+from sqlalchemy.types import TypeEngine
 
+from ..constants import archive, connection, directory
+from ..constants import dtypes as types
+from ..constants import loader as loaders
+from ..constants.objects import Cleansing, ColumnType, FFEICConfig
 from ..logger import logger
 
 
 class ImportHandler:
 
+    _process_engine: Engine | None = None
+    _process_engine_pid: int | None = None
+
+    @classmethod
+    def _header_processor(cls, headers: List[str]) -> List[str]:
+        """
+        Normalizes headers read from files to simplify sql statements.
+
+        Parameters:
+        - headers: list of column headers
+        """
+        return [header.replace("#", "").lower().strip() for header in headers]
+
+    @classmethod
+    def _copy_method(
+        cls,
+        table: SQLTable,
+        conn: Connection,
+        keys: List[str],
+        data_iter: Iterable[tuple],
+    ) -> int:
+        """
+        Insertion method for `DataFrame.to_sql` that streams rows with `COPY ... FROM STDIN`.
+
+        Table creation and the `if_exists` action are still performed by pandas, only the
+        row transfer is replaced, so the semantics of `fail`, `replace` and `append` are kept.
+        Every value but null is quoted, so empty strings load as `''` rather than as null,
+        as they do through `to_sql`.
+
+        Parameters:
+        - table: pandas table wrapper holding the target schema and name
+        - conn: SQLAlchemy connection wrapping the psycopg2 connection
+        - keys: column names in write order
+        - data_iter: iterable of row tuples
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows(data_iter)
+        buffer.seek(0)
+
+        columns = ", ".join(f'"{key}"' for key in keys)
+        target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+
+        with conn.connection.cursor() as cur:
+            cur.copy_expert(
+                sql=f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                file=buffer,
+            )
+            return cur.rowcount
+
+    @classmethod
+    def _source(cls, file: str) -> str:
+        """
+        Resolves the path on disk holding a file, the archive path for zip members.
+
+        Parameters:
+        - file: File path
+        """
+        return file.split(archive.MEMBER_SEP, 1)[0]
+
+    @classmethod
+    def _is_compressed(cls, file: str) -> bool:
+        """
+        Checks whether a file is read through decompression.
+
+        Parameters:
+        - file: File path
+        """
+        return cls._source(file=file).lower().endswith(archive.COMPRESSED)
+
+    @classmethod
+    def _open(cls, file: str) -> BinaryIO:
+        """
+        Opens a file as a binary stream, decompressing zip members, gzip and Zstandard files
+        as they are read.
+
+        Parameters:
+        - file: File path
+        """
+        source = cls._source(file=file)
+        extension = source.lower()
+        if archive.MEMBER_SEP in file:
+            # the member keeps the archive open until it is closed
+            with zipfile.ZipFile(source) as zf:
+                return zf.open(file.split(archive.MEMBER_SEP, 1)[1])
+        if extension.endswith(archive.GZIP):
+            return gzip.open(source, "rb")
+        if extension.endswith(archive.ZSTD):
+            return zstandard.ZstdDecompressor().stream_reader(
+                open(source, "rb"), closefd=True
+            )
+        return open(source, "rb")
+
+    @classmethod
+    def _chunk_rows(
+        cls,
+        file: str,
+        chunksize: int | None = None,
+        chunk_bytes: int | None = None,
+        sample_bytes: int = loaders.SAMPLE_BYTES,
+    ) -> int | None:
+        """
+        Resolves the number of rows read per chunk.
+
+        A row budget is used as is. A byte budget is converted to rows using the average
+        line length of a sample taken from the head of the file. None means the file is
+        read in a single pass.
+
+        Parameters:
+        - file: File path
+        - chunksize: Rows per chunk
+        - chunk_bytes: Raw file bytes per chunk
+        - sample_bytes: Number of bytes sampled to estimate the line length
+        """
+        if chunksize:
+            return chunksize
+        if not chunk_bytes:
+            return None
+
+        with cls._open(file=file) as f:
+            sample = f.read(sample_bytes)
+
+        lines = max(sample.count(b"\n"), 1)
+        return max(chunk_bytes // max(len(sample) // lines, 1), 1)
+
+    @classmethod
+    def _read_headers(cls, file: str, sep: str) -> List[str]:
+        """
+        Reads the raw header row of a file without parsing any data rows.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        """
+        with cls._open(file=file) as f:
+            return list(
+                pd.read_csv(
+                    filepath_or_buffer=f,
+                    engine=cls._read_engine(sep=sep, chunked=True),
+                    sep=sep,
+                    encoding="utf-8",
+                    nrows=0,
+                ).columns
+            )
+
+    @classmethod
+    def _usecols(cls, headers: List[str], cols: List[str]) -> List[str] | None:
+        """
+        Maps the configured columns onto the raw headers of a file.
+
+        Both sides are compared after normalization, so `#` prefixes, case and padding in
+        the file do not need to be repeated in the configuration.
+
+        Parameters:
+        - headers: raw column headers read from the file
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        """
+        if not cols:
+            return None
+
+        wanted = set(cls._header_processor(headers=cols))
+        usecols = [
+            header
+            for header, normalized in zip(headers, cls._header_processor(headers=headers))
+            if normalized in wanted
+        ]
+
+        missing = wanted - set(cls._header_processor(headers=usecols))
+        if missing:
+            raise KeyError(f"Columns not found in file: {sorted(missing)}")
+        return usecols
+
+    @classmethod
+    def _read_engine(cls, sep: str, chunked: bool = False) -> str:
+        """
+        Selects the fastest parser the separator and read mode allow.
+
+        pyarrow is multithreaded but reads the whole file at once, so chunked reads use the
+        C parser. Both require a single character separator, anything else falls back to the
+        python parser.
+
+        Parameters:
+        - sep: Seperator for reading files e.g., ",", "^"
+        - chunked: Whether the file is read in chunks
+        """
+        if len(sep) != 1:
+            return "python"
+        return "c" if chunked else "pyarrow"
+
+    @classmethod
+    def _parse_dtypes(
+        cls, headers: List[str], dtypes: Dict[str, ColumnType]
+    ) -> Dict[str, str]:
+        """
+        Maps declared column types onto the parser dtypes keyed by raw header.
+
+        Dates are read as strings and converted by `_apply_dtypes` with their declared format.
+
+        Parameters:
+        - headers: raw column headers read from the file
+        - dtypes: declared column types keyed by normalized column name
+        """
+        parsers = {
+            types.INTEGER: "Int64",
+            types.BIGINT: "Int64",
+            types.NUMERIC: "float64",
+            types.DATE: "string",
+            types.CATEGORY: "category",
+            types.STRING: "string",
+        }
+        return {
+            header: parsers[dtypes[normalized]["type"]]
+            for header, normalized in zip(headers, cls._header_processor(headers=headers))
+            if normalized in dtypes
+        }
+
+    @classmethod
+    def _apply_dtypes(
+        cls, df: pd.DataFrame, dtypes: Dict[str, ColumnType]
+    ) -> pd.DataFrame:
+        """
+        Converts declared date columns using their format, values that do not parse are set to null.
+
+        Parameters:
+        - df: dataframe with normalized headers
+        - dtypes: declared column types keyed by normalized column name
+        """
+        for col, dtype in dtypes.items():
+            if dtype["type"] == types.DATE and col in df.columns:
+                df[col] = pd.to_datetime(
+                    df[col], format=dtype.get("format"), errors="coerce"
+                ).dt.date
+        return df
+
+    @classmethod
+    def _sql_dtypes(cls, dtypes: Dict[str, ColumnType]) -> Dict[str, TypeEngine]:
+        """
+        Maps declared column types onto the SQL types used when the staging table is created.
+
+        Parameters:
+        - dtypes: declared column types keyed by normalized column name
+        """
+
+        def sql_type(dtype: ColumnType) -> TypeEngine:
+            if dtype["type"] in (types.CATEGORY, types.STRING):
+                return String(dtype["length"]) if "length" in dtype else Text()
+            return {
+                types.INTEGER: Integer(),
+                types.BIGINT: BigInteger(),
+                types.NUMERIC: Numeric(),
+                types.DATE: Date(),
+            }[dtype["type"]]
+
+        return {col: sql_type(dtype) for col, dtype in dtypes.items()}
+
+    @classmethod
+    def _cleanse(
+        cls, df: pd.DataFrame, cleansing: Cleansing, file: str | None = None
+    ) -> pd.DataFrame:
+        """
+        Applies the declared cleansing to a dataframe, one vectorized transform per column.
+
+        Text columns are trimmed first, then the listed values are set to null and finally
+        the padded columns are converted to text and left padded, so nulled values stay null.
+        Numeric columns are compared against the listed values as numbers and kept as
+        nullable integers, so a nulled integer column is not widened to float. Trimmed
+        whitespace-only values are kept as empty strings, list `""` under `nullify` to load
+        them as null.
+
+        Parameters:
+        - df: dataframe with normalized headers
+        - cleansing: declared cleansing keyed by normalized column name
+        - file: File path the dataframe was read from, named when a column is missing
+        """
+        declared = {
+            *cleansing.get("trim", []),
+            *cleansing.get("nullify", {}),
+            *cleansing.get("pad", {}),
+        }
+        missing = sorted(declared - set(df.columns))
+        if missing:
+            raise ValueError(f"Cleansing columns {missing} not found in {file}")
+
+        def integers(s: pd.Series) -> pd.Series:
+            return s.astype("Int64") if pd.api.types.is_integer_dtype(s) else s
+
+        for col in cleansing.get("trim", []):
+            if df[col].dtype == object or pd.api.types.is_string_dtype(df[col]):
+                df[col] = df[col].str.strip()
+
+        for col, values in cleansing.get("nullify", {}).items():
+            s = integers(df[col])
+            if pd.api.types.is_numeric_dtype(s):
+                hit = s.isin(pd.to_numeric(pd.Series(values), errors="coerce").dropna())
+            else:
+                hit = s.astype("string").isin([str(value) for value in values])
+            df[col] = s.mask(hit.fillna(False).astype(bool))
+
+        for col, padding in cleansing.get("pad", {}).items():
+            s = df[col]
+            if pd.api.types.is_numeric_dtype(s):
+                # a column holding nulls is parsed as float, padding must not see "630.0"
+                s = s.astype("Int64")
+            df[col] = (
+                s.astype("string")
+                .str.pad(width=padding["width"], side="left", fillchar=padding["fillchar"])
+            )
+        return df
+
+    @classmethod
+    def _read_frames(
+        cls,
+        file: str,
+        sep: str,
+        cols: List[str],
+        chunksize: int | None = None,
+        dtypes: Dict[str, ColumnType] | None = None,
+        byte_range: Tuple[int, int] | None = None,
+        cleansing: Cleansing | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads a file as a sequence of dataframes with normalized headers and projected columns.
+
+        The column projection is applied by the parser, so columns outside of `cols` are never
+        tokenized. Only one chunk is held in memory at a time when a chunksize is given,
+        otherwise the whole file is yielded as a single dataframe. Compressed files are
+        decompressed as the parser reads them. Each dataframe is cleansed before it is yielded.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - chunksize: Rows per chunk, None reads the whole file
+        - dtypes: declared column types keyed by normalized column name
+        - byte_range: Start and end offsets of a newline aligned slice of the data rows,
+          the header is taken from the first line of the file
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        dtypes = dtypes or {}
+        headers = cls._read_headers(file=file, sep=sep)
+        options = {
+            "engine": cls._read_engine(sep=sep, chunked=chunksize is not None),
+            "sep": sep,
+            "encoding": "utf-8",
+            "usecols": cls._usecols(headers=headers, cols=cols),
+            "dtype": cls._parse_dtypes(headers=headers, dtypes=dtypes) or None,
+        }
+
+        if byte_range is not None:
+            start, end = byte_range
+            with open(file, "rb") as f:
+                f.seek(start)
+                options["filepath_or_buffer"] = io.BytesIO(f.read(end - start))
+            # pyarrow cannot project columns of a headerless slice
+            options.update(
+                engine=cls._read_engine(sep=sep, chunked=True), header=None, names=headers
+            )
+        order = cls._header_processor(headers=cols)
+
+        def normalize(df: pd.DataFrame) -> pd.DataFrame:
+            df.columns = cls._header_processor(headers=df.columns)
+            df = cls._apply_dtypes(df=df[order] if order else df, dtypes=dtypes)
+            return cls._cleanse(df=df, cleansing=cleansing or {}, file=file)
+
+        if byte_range is not None:
+            yield normalize(pd.read_csv(**options))
+            return
+
+        with cls._open(file=file) as f:
+            if chunksize is None:
+                yield normalize(pd.read_csv(filepath_or_buffer=f, **options))
+                return
+
+            with pd.read_csv(filepath_or_buffer=f, **options, chunksize=chunksize) as reader:
+                for df in reader:
+                    yield normalize(df)
+
+    @classmethod
+    def _empty_frame(
+        cls,
+        file: str,
+        sep: str,
+        cols: List[str],
+        dtypes: Dict[str, ColumnType] | None = None,
+        cleansing: Cleansing | None = None,
+    ) -> pd.DataFrame:
+        """
+        Reads the first row of a file and returns a frame with its columns and no rows.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - dtypes: Declared column types keyed by normalized column name
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        frames = cls._read_frames(
+            file=file,
+            sep=sep,
+            cols=cols,
+            chunksize=1,
+            dtypes=dtypes,
+            cleansing=cleansing,
+        )
+        try:
+            return next(frames).head(0)
+        finally:
+            frames.close()
+
+    @classmethod
+    def _sample(
+        cls,
+        file: str,
+        sep: str,
+        cols: List[str],
+        dtypes: Dict[str, ColumnType] | None = None,
+        cleansing: Cleansing | None = None,
+    ) -> pd.DataFrame:
+        """
+        Reads the first `SAMPLE_ROWS` rows of a file.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - dtypes: Declared column types keyed by normalized column name
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        frames = cls._read_frames(
+            file=file,
+            sep=sep,
+            cols=cols,
+            chunksize=loaders.SAMPLE_ROWS,
+            dtypes=dtypes,
+            cleansing=cleansing,
+        )
+        try:
+            return next(frames)
+        finally:
+            frames.close()
+
+    @classmethod
+    def _file_hash(cls, file: str) -> str:
+        """
+        Computes the sha256 digest of a file's content.
+
+        The digest is memoized per size and modification time, so the cache and the manifest
+        hash each file once per process. Zip members are hashed by their decompressed content,
+        so a change to one member does not invalidate the others.
+
+        Parameters:
+        - file: File path
+        """
+        stat = os.stat(cls._source(file=file))
+        return cls._content_hash(file, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _content_hash(cls, file: str, size: int, mtime_ns: int) -> str:
+        """
+        Hashes a file's content, the size and modification time only key the memoization.
+
+        Parameters:
+        - file: File path
+        - size: File size in bytes
+        - mtime_ns: File modification time in nanoseconds
+        """
+        digest = hashlib.sha256()
+        members = archive.MEMBER_SEP in file
+        with cls._open(file=file) if members else open(file, "rb") as f:
+            for block in iter(lambda: f.read(loaders.HASH_BLOCK_BYTES), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @classmethod
+    def _fingerprint(cls, file: str) -> dict:
+        """
+        Describes a file as recorded in the import manifest.
+
+        Parameters:
+        - file: File path
+        """
+        stat = os.stat(cls._source(file=file))
+        return {
+            "file_path": file,
+            "file_size": stat.st_size,
+            "file_mtime": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            "content_hash": cls._file_hash(file=file),
+        }
+
+    @classmethod
+    def _is_loaded(
+        cls, conn: Connection, fingerprint: dict, table_schema: str, table_name: str
+    ) -> bool:
+        """
+        Checks whether the last successful load of a file into a table matches its fingerprint
+        and the table still exists.
+
+        Parameters:
+        - conn: Connection
+        - fingerprint: File description from `_fingerprint`
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        """
+        stmt = text(
+            """
+            select m.content_hash = :content_hash and m.file_size = :file_size
+            from transformations.import_manifest m
+            where m.file_path = :file_path
+                and m.table_schema = :table_schema
+                and m.table_name = :table_name
+                and to_regclass(quote_ident(m.table_schema) || '.' || quote_ident(m.table_name)) is not null
+            order by m.loaded_at desc
+            limit 1
+            """
+        )
+        return bool(
+            conn.execute(
+                stmt,
+                {
+                    **fingerprint,
+                    "table_schema": table_schema,
+                    "table_name": table_name,
+                },
+            ).scalar()
+        )
+
+    @classmethod
+    def _record_load(
+        cls,
+        conn: Connection,
+        fingerprint: dict,
+        table_schema: str,
+        table_name: str,
+        row_count: int,
+        elapsed_ms: float | None = None,
+    ) -> None:
+        """
+        Records a successful load in the import manifest.
+
+        Parameters:
+        - conn: Connection
+        - fingerprint: File description from `_fingerprint`
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - row_count: Rows loaded from the file
+        - elapsed_ms: The file's share of the wall time of its table's load
+        """
+        stmt = text(
+            """
+            insert into transformations.import_manifest
+                (file_path, file_size, file_mtime, content_hash, table_schema, table_name, row_count, elapsed_ms)
+            values
+                (:file_path, :file_size, :file_mtime, :content_hash, :table_schema, :table_name, :row_count, :elapsed_ms)
+            """
+        )
+        conn.execute(
+            stmt,
+            {
+                **fingerprint,
+                "table_schema": table_schema,
+                "table_name": table_name,
+                "row_count": row_count,
+                "elapsed_ms": elapsed_ms,
+            },
+        )
+
+    @classmethod
+    def estimate_cost(cls, engine: Engine, configs: List[FFEICConfig]) -> float:
+        """
+        Predicts the seconds a full load of the configurations takes.
+
+        Each file costs its size times the milliseconds per byte of its table over the latest
+        timed loads in the import manifest. Tables without timed loads use the rate of every
+        timed load, and `loader.DEFAULT_MS_PER_BYTE` applies before any load was timed.
+
+        Parameters:
+        - engine: Connection
+        - configs: Import JSON
+
+        Returns:
+        - Predicted seconds
+        """
+        with engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    with timed as (
+                        select
+                            table_schema,
+                            table_name,
+                            file_size,
+                            elapsed_ms,
+                            row_number() over (
+                                partition by file_path, table_schema, table_name
+                                order by loaded_at desc
+                            ) as load_number
+                        from transformations.import_manifest
+                        where elapsed_ms is not null
+                    )
+                    select
+                        table_schema,
+                        table_name,
+                        sum(elapsed_ms) / nullif(sum(file_size), 0) as ms_per_byte
+                    from timed
+                    where load_number <= :history
+                    group by grouping sets ((table_schema, table_name), ())
+                    """
+                ),
+                {"history": loaders.COST_HISTORY},
+            ).all()
+        rates = {
+            (table_schema, table_name): float(ms_per_byte)
+            for table_schema, table_name, ms_per_byte in rows
+            if ms_per_byte is not None
+        }
+        default = rates.get((None, None), loaders.DEFAULT_MS_PER_BYTE)
+
+        cost_ms = 0.0
+        for config in configs:
+            if not (config.get("allow_import", False) and config.get("file_path")):
+                continue
+            rate = rates.get((config.get("table_schema"), config.get("table_name")), default)
+            cost_ms += os.stat(cls._source(file=config["file_path"])).st_size * rate
+        return cost_ms / 1000
+
+    @classmethod
+    def _profile_table(cls, engine: Engine, table_schema: str, table_name: str) -> None:
+        """
+        Profiles every column of a loaded table in a single scan with `profile_columns`,
+        which records the results in `transformations.column_profiles`.
+
+        A failed profile is logged and does not fail the import.
+
+        Parameters:
+        - engine: Connection
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        """
+        try:
+            with engine.begin() as conn:
+                profiles = conn.execute(
+                    text("select * from transformations.profile_columns(:table)"),
+                    {"table": f"{table_schema}.{table_name}"},
+                ).mappings().all()
+        except Exception as e:
+            logger.warning(f"UnhandledError: {e}")
+            return
+
+        padded = [p["column_name"] for p in profiles if p["whitespace_count"]]
+        logger.info(
+            f"service: profile_import  |  table_name:  {table_name}  |  columns: {len(profiles)}  |  whitespace_padded: {padded}"
+        )
+
+    @classmethod
+    def _cache_path(
+        cls,
+        file: str,
+        sep: str,
+        cols: List[str],
+        dtypes: Dict[str, ColumnType] | None = None,
+        cleansing: Cleansing | None = None,
+    ) -> str:
+        """
+        Resolves the cache directory of a parsed file.
+
+        The key combines the file content with every setting that changes the parsed result,
+        so an edited file or configuration never reads a stale entry.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - dtypes: Declared column types keyed by normalized column name
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        settings = json.dumps(
+            {
+                "sep": sep,
+                "cols": cols,
+                "dtypes": dtypes or {},
+                "cleansing": cleansing or {},
+            },
+            sort_keys=True,
+        )
+        key = hashlib.sha256(
+            f"{cls._file_hash(file=file)}:{settings}".encode()
+        ).hexdigest()
+        return os.path.join(os.getcwd(), directory.CACHE, key)
+
+    @classmethod
+    def _read_cache(cls, path: str) -> Iterator[pd.DataFrame]:
+        """
+        Reads a cached file back one part at a time.
+
+        Parameters:
+        - path: Cache directory of the file
+        """
+        for part in sorted(os.listdir(path)):
+            yield pd.read_parquet(os.path.join(path, part))
+
+    @classmethod
+    def _write_cache(
+        cls, path: str, frames: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Passes frames through while writing each one to the cache as a Parquet part.
+
+        Parts are written to a temporary directory that is only published once every frame
+        has been consumed, so an interrupted load never leaves a partial entry behind.
+
+        Parameters:
+        - path: Cache directory of the file
+        - frames: Parsed frames of the file
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        try:
+            for part, df in enumerate(frames):
+                df.to_parquet(os.path.join(tmp, f"part-{part:05d}.parquet"), index=False)
+                yield df
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        cls._publish_cache(tmp=tmp, path=path)
+
+    @classmethod
+    def _publish_cache(cls, tmp: str, path: str) -> None:
+        """
+        Moves a completed temporary cache directory into place.
+
+        Parameters:
+        - tmp: Temporary directory holding every part
+        - path: Cache directory of the file
+        """
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # another worker published the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    @classmethod
+    def _frames(
+        cls,
+        file: str,
+        sep: str,
+        cols: List[str],
+        chunksize: int | None = None,
+        dtypes: Dict[str, ColumnType] | None = None,
+        cache: bool = False,
+        cleansing: Cleansing | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads a file through the cache when enabled, otherwise parses it.
+
+        Parameters:
+        - file: File path
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - chunksize: Rows per chunk, None reads the whole file
+        - dtypes: Declared column types keyed by normalized column name
+        - cache: Whether parsed frames are read from and written to the cache
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        frames = cls._read_frames(
+            file=file,
+            sep=sep,
+            cols=cols,
+            chunksize=chunksize,
+            dtypes=dtypes,
+            cleansing=cleansing,
+        )
+        if not cache:
+            return frames
+
+        path = cls._cache_path(
+            file=file, sep=sep, cols=cols, dtypes=dtypes, cleansing=cleansing
+        )
+        if os.path.isdir(path):
+            logger.info(f"service: load_import  |  file: {file}  |  cache: hit")
+            return cls._read_cache(path=path)
+
+        logger.info(f"service: load_import  |  file: {file}  |  cache: miss")
+        return cls._write_cache(path=path, frames=frames)
+
+    @classmethod
+    def _write_frame(
+        cls,
+        conn: Connection,
+        df: pd.DataFrame,
+        table_schema: str,
+        table_name: str,
+        if_exists: Literal["append", "fail", "replace"],
+        loader: Literal["copy", "to_sql"],
+        dtypes: Dict[str, ColumnType] | None = None,
+    ) -> int:
+        """
+        Writes a dataframe to the target table with the configured loader.
+
+        Parameters:
+        - conn: Connection
+        - df: dataframe with normalized headers
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - if_exists: Action for if table exists
+        - loader: Strategy for writing rows, "copy" streams with COPY and "to_sql" issues inserts
+        - dtypes: Declared column types used when the table is created
+        """
+        df.to_sql(
+            name=table_name,
+            con=conn,
+            if_exists=if_exists,
+            schema=table_schema,
+            index=False,
+            dtype=cls._sql_dtypes(dtypes=dtypes or {}),
+            method=cls._copy_method if loader == loaders.COPY else None,
+        )
+        return len(df)
+
+    @classmethod
+    def _put(cls, chunks: queue.Queue, item: object, stop: threading.Event) -> bool:
+        """
+        Puts an item on the pipeline queue, waiting while it is full.
+
+        Parameters:
+        - chunks: Bounded queue between the parser and the writers
+        - item: Dataframe, exception or None marking the end of the file
+        - stop: Set when the pipeline is stopped
+
+        Returns:
+        - False when the pipeline was stopped before the item was queued
+        """
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=loaders.QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
     @classmethod
-    def _header_processor(cls, headers: List[str]) -> List[str]:
+    def _take(cls, chunks: queue.Queue, stop: threading.Event) -> pd.DataFrame | None:
         """
-        Normalizes headers read from files to simplify sql statements.
+        Takes the next parsed chunk from the pipeline queue.
 
         Parameters:
-        - headers: list of column headers
+        - chunks: Bounded queue between the parser and the writers
+        - stop: Set when the pipeline is stopped
+
+        Returns:
+        - The next dataframe, None once the file is exhausted
+
+        Raises:
+        - The parser's exception, or RuntimeError when the pipeline was stopped
         """
-        return [header.replace("#", "").lower().strip() for header in headers]
+        while not stop.is_set():
+            try:
+                item = chunks.get(timeout=loaders.QUEUE_TIMEOUT)
+            except queue.Empty:
+                continue
+            if isinstance(item, BaseException):
+                raise item
+            return item
+        raise RuntimeError("Import pipeline stopped")
+
+    @classmethod
+    def _produce(
+        cls,
+        frames: Iterator[pd.DataFrame],
+        chunks: queue.Queue,
+        stop: threading.Event,
+        consumers: int,
+    ) -> None:
+        """
+        Parses a file into the pipeline queue, then marks its end once per writer.
+
+        Runs in the parser thread. Parsing waits while the queue is full, which bounds the
+        chunks held in memory.
+
+        Parameters:
+        - frames: Parsed chunks of the file
+        - chunks: Bounded queue between the parser and the writers
+        - stop: Set when the pipeline is stopped
+        - consumers: Number of writers
+        """
+        try:
+            for df in frames:
+                if not cls._put(chunks=chunks, item=df, stop=stop):
+                    return
+        except Exception as e:
+            cls._put(chunks=chunks, item=e, stop=stop)
+        finally:
+            frames.close()
+        for _ in range(consumers):
+            cls._put(chunks=chunks, item=None, stop=stop)
+
+    @classmethod
+    def _consume(
+        cls,
+        conn: Connection,
+        chunks: queue.Queue,
+        stop: threading.Event,
+        table_schema: str,
+        table_name: str,
+        if_exists: Literal["append", "fail", "replace"],
+        loader: Literal["copy", "to_sql"],
+        dtypes: Dict[str, ColumnType] | None = None,
+    ) -> int:
+        """
+        Writes chunks from the pipeline queue until the file is exhausted.
+
+        Parameters:
+        - conn: Connection
+        - chunks: Bounded queue between the parser and the writers
+        - stop: Set when the pipeline is stopped
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - if_exists: Action for if table exists, applied to the first chunk only
+        - loader: Strategy for writing rows
+        - dtypes: Declared column types used when the table is created
+        """
+        row_count = 0
+        while True:
+            df = cls._take(chunks=chunks, stop=stop)
+            if df is None:
+                return row_count
+            row_count += cls._write_frame(
+                conn=conn,
+                df=df,
+                table_schema=table_schema,
+                table_name=table_name,
+                if_exists=if_exists,
+                loader=loader,
+                dtypes=dtypes,
+            )
+            if_exists = "append"
+
+    @classmethod
+    def _write_chunks(cls, engine: Engine, **options) -> int:
+        """
+        Writes chunks from the pipeline queue in a transaction of its own.
+
+        Parameters:
+        - engine: Connection
+        - options: Keyword arguments of `_consume` other than the connection
+        """
+        with engine.begin() as conn:
+            return cls._consume(conn=conn, **options)
+
+    @classmethod
+    def _pipeline_handler(
+        cls,
+        engine: Engine,
+        frames: Iterator[pd.DataFrame],
+        table_schema: str,
+        table_name: str,
+        if_exists: Literal["append", "fail", "replace"],
+        loader: Literal["copy", "to_sql"],
+        dtypes: Dict[str, ColumnType] | None = None,
+        writers: int = 1,
+        empty: pd.DataFrame | None = None,
+    ) -> int:
+        """
+        Overlaps parsing and loading of a file through a bounded queue.
+
+        A parser thread fills the queue while writers drain it, so the next chunk is parsed
+        while the previous one is written and the file takes about as long as the slower of
+        the two. The queue holds at most `PIPELINE_DEPTH` chunks, so a slow database holds the
+        parser back instead of growing memory. A single writer loads the file in one
+        transaction. Additional writers append over their own connections once the first
+        chunk has created the table, or `empty` has when the file yields no chunk.
+
+        Parameters:
+        - engine: Connection
+        - frames: Parsed chunks of the file
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - if_exists: Action for if table exists
+        - loader: Strategy for writing rows
+        - dtypes: Declared column types used when the table is created
+        - writers: Number of writer threads
+        - empty: Frame with the columns and dtypes of the file and no rows
+        """
+        writers = max(writers, 1)
+        chunks: queue.Queue = queue.Queue(maxsize=loaders.PIPELINE_DEPTH)
+        stop = threading.Event()
+        options = {
+            "chunks": chunks,
+            "stop": stop,
+            "table_schema": table_schema,
+            "table_name": table_name,
+            "loader": loader,
+            "dtypes": dtypes,
+        }
+
+        with ThreadPoolExecutor(max_workers=writers + 1) as exe:
+            exe.submit(
+                cls._produce, frames=frames, chunks=chunks, stop=stop, consumers=writers
+            )
+            try:
+                if writers == 1:
+                    return cls._write_chunks(engine=engine, if_exists=if_exists, **options)
+
+                # the table is committed before the other writers append to it
+                with engine.begin() as conn:
+                    df = cls._take(chunks=chunks, stop=stop)
+                    if df is None and empty is None:
+                        return 0
+                    row_count = cls._write_frame(
+                        conn=conn,
+                        df=empty if df is None else df,
+                        table_schema=table_schema,
+                        table_name=table_name,
+                        if_exists=if_exists,
+                        loader=loader,
+                        dtypes=dtypes,
+                    )
+                if df is None:
+                    return row_count
+                futures = [
+                    exe.submit(
+                        cls._write_chunks, engine=engine, if_exists="append", **options
+                    )
+                    for _ in range(writers)
+                ]
+                return row_count + sum(future.result() for future in futures)
+            finally:
+                stop.set()
+
+    @classmethod
+    def _byte_ranges(cls, file: str, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits the data rows of a file into newline aligned byte ranges.
+
+        Each boundary is moved forward to the end of the line it falls in, so every range
+        holds whole rows. Fields with embedded newlines are not supported.
+
+        Parameters:
+        - file: File path
+        - parts: Number of ranges to split the file into
+        """
+        size = os.path.getsize(file)
+
+        with open(file, "rb") as f:
+            f.readline()  # header
+            start = f.tell()
+            step = max((size - start) // parts, 1)
+
+            bounds = [start]
+            for part in range(1, parts):
+                f.seek(start + part * step)
+                f.readline()
+                bounds.append(min(f.tell(), size))
+            bounds.append(size)
+
+        return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+    @classmethod
+    def _infer_dtypes(
+        cls, df: pd.DataFrame, dtypes: Dict[str, ColumnType]
+    ) -> Dict[str, ColumnType]:
+        """
+        Pins the column types inferred from a sample so every chunk or range is parsed the same way.
+
+        Without this a chunk with a missing value would parse an integer column as float and
+        write "4.0", and a column that is null throughout the sample would create a float
+        column that later text values cannot be written to. Integer columns are pinned as
+        nullable integers and columns without a value in the sample as text, declared
+        types take precedence.
+
+        Parameters:
+        - df: sample dataframe with normalized headers
+        - dtypes: declared column types keyed by normalized column name
+        """
+        inferred: Dict[str, ColumnType] = {}
+        for col in df.columns:
+            if pd.api.types.is_integer_dtype(df[col]):
+                inferred[col] = {"type": types.BIGINT}
+            elif df[col].isna().all():
+                inferred[col] = {"type": types.STRING}
+        return {**inferred, **dtypes}
+
+    @classmethod
+    def _worker_engine(cls) -> Engine:
+        """
+        Retrieves the engine a worker process keeps, created on the process's first task.
+
+        Every task the process runs afterwards reuses the pooled connections rather than paying
+        for a new connection. The engine is built from `connection` with the configured pool
+        settings, so credentials never travel in task arguments. An engine inherited from another
+        process through fork is replaced, its connections belong to that process.
+        """
+        pid = os.getpid()
+        if cls._process_engine_pid != pid:
+            if cls._process_engine is not None:
+                cls._process_engine.dispose(close=False)
+            cls._process_engine = create_engine(
+                url=connection.POSTGRES_CONNECTION,
+                pool_size=connection.POOL_SIZE,
+                max_overflow=connection.MAX_OVERFLOW,
+                pool_timeout=connection.POOL_TIMEOUT,
+                pool_recycle=connection.POOL_RECYCLE,
+                pool_pre_ping=connection.POOL_PRE_PING,
+            )
+            cls._process_engine_pid = pid
+        return cls._process_engine
+
+    @classmethod
+    def _load_range(
+        cls,
+        file: str,
+        table_schema: str,
+        table_name: str,
+        sep: str,
+        cols: List[str],
+        loader: Literal["copy", "to_sql"],
+        dtypes: Dict[str, ColumnType],
+        byte_range: Tuple[int, int] | None = None,
+        part: str | None = None,
+        cache_part: str | None = None,
+        cleansing: Cleansing | None = None,
+    ) -> int:
+        """
+        Parses and appends one byte range of a file, or one cached part, on its own connection.
+
+        Runs inside a worker process, on the engine the process keeps.
+
+        Parameters:
+        - file: File path
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - loader: Strategy for writing rows
+        - dtypes: Column types shared by every range
+        - byte_range: Start and end offsets of the rows to parse
+        - part: Cached Parquet part to load instead of parsing a byte range
+        - cache_part: Parquet file the parsed range is written to
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        if part is not None:
+            frames = iter([pd.read_parquet(part)])
+        else:
+            frames = cls._read_frames(
+                file=file,
+                sep=sep,
+                cols=cols,
+                dtypes=dtypes,
+                byte_range=byte_range,
+                cleansing=cleansing,
+            )
+
+        with cls._worker_engine().begin() as conn:
+            row_count = 0
+            for df in frames:
+                if cache_part is not None:
+                    df.to_parquet(cache_part, index=False)
+                row_count += cls._write_frame(
+                    conn=conn,
+                    df=df,
+                    table_schema=table_schema,
+                    table_name=table_name,
+                    if_exists="append",
+                    loader=loader,
+                )
+            return row_count
+
+    @classmethod
+    def _parallel_handler(
+        cls,
+        engine: Engine,
+        file: str,
+        table_schema: str,
+        table_name: str,
+        if_exists: Literal["append", "fail", "replace"],
+        sep: str,
+        cols: List[str],
+        loader: Literal["copy", "to_sql"],
+        parallel: int,
+        chunk_bytes: int | None = None,
+        dtypes: Dict[str, ColumnType] | None = None,
+        cache: bool = False,
+        cleansing: Cleansing | None = None,
+    ) -> int:
+        """
+        Loads a file by splitting it into byte ranges that are parsed and loaded concurrently.
+
+        The table is created from a sample of the file before any range is loaded, so the
+        `if_exists` action is applied once and every range appends. Ranges are sized by
+        `chunk_bytes` when given, which bounds the memory held by each worker. With the cache
+        enabled each range is written as one cached part, and a cached file is loaded part
+        by part without being parsed.
+
+        Parameters:
+        - engine: Connection
+        - file: File path
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+        - if_exists: Action for if table exists
+        - sep: Seperator for reading files e.g., ",", "^"
+        - cols: Specifices a list of columns for filtering import data, imports all data if empty
+        - loader: Strategy for writing rows
+        - parallel: Number of worker processes and connections
+        - chunk_bytes: Maximum raw file bytes per range
+        - dtypes: Declared column types used for parsing and for creating the table
+        - cache: Whether parsed ranges are read from and written to the cache
+        - cleansing: Declared cleansing keyed by normalized column name
+        """
+        dtypes = dtypes or {}
+        path = (
+            cls._cache_path(
+                file=file, sep=sep, cols=cols, dtypes=dtypes, cleansing=cleansing
+            )
+            if cache
+            else None
+        )
+        parts = (
+            [os.path.join(path, part) for part in sorted(os.listdir(path))]
+            if path and os.path.isdir(path)
+            else []
+        )
+
+        if parts:
+            logger.info(f"service: load_import  |  file: {file}  |  cache: hit")
+            sample = pd.read_parquet(parts[0])
+        else:
+            if path:
+                logger.info(f"service: load_import  |  file: {file}  |  cache: miss")
+            sample = cls._sample(
+                file=file, sep=sep, cols=cols, dtypes=dtypes, cleansing=cleansing
+            )
+
+        # the table is created with the types every range is parsed with
+        inferred = cls._infer_dtypes(df=sample, dtypes=dtypes)
+        with engine.begin() as conn:
+            cls._write_frame(
+                conn=conn,
+                df=sample.head(0),
+                table_schema=table_schema,
+                table_name=table_name,
+                if_exists=if_exists,
+                loader=loader,
+                dtypes=inferred,
+            )
+
+        if parts:
+            tasks = [{"part": part} for part in parts]
+        else:
+            size = os.path.getsize(file)
+            count = max(parallel, -(-size // chunk_bytes)) if chunk_bytes else parallel
+            tmp = f"{path}.{os.getpid()}.tmp" if path else None
+            if tmp:
+                os.makedirs(tmp, exist_ok=True)
+            tasks = [
+                {
+                    "byte_range": byte_range,
+                    "cache_part": (
+                        os.path.join(tmp, f"part-{index:05d}.parquet") if tmp else None
+                    ),
+                }
+                for index, byte_range in enumerate(
+                    cls._byte_ranges(file=file, parts=count)
+                )
+            ]
+
+        logger.info(
+            f"service: load_import  |  table_name:  {table_name}  |  ranges: {len(tasks)}  |  workers: {parallel}"
+        )
+        try:
+            with ProcessPoolExecutor(max_workers=parallel) as exe:
+                futures = [
+                    exe.submit(
+                        cls._load_range,
+                        file=file,
+                        table_schema=table_schema,
+                        table_name=table_name,
+                        sep=sep,
+                        cols=cols,
+                        loader=loader,
+                        dtypes=inferred,
+                        cleansing=cleansing,
+                        **task,
+                    )
+                    for task in tasks
+                ]
+                row_count = sum(future.result() for future in futures)
+        except BaseException:
+            if not parts and path:
+                shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        if not parts and path:
+            cls._publish_cache(tmp=tmp, path=path)
+        return row_count
 
     @classmethod
     def to_sql_handler(
@@ -30,7 +1347,15 @@ class ImportHandler:
         sep: Literal[",", "^"],
         cols: List[str],
         allow_import: bool = False,
-    ) -> None:
+        loader: Literal["copy", "to_sql"] = loaders.TO_SQL,
+        chunksize: int | None = None,
+        chunk_bytes: int | None = None,
+        dtypes: Dict[str, ColumnType] | None = None,
+        parallel: int | None = None,
+        cache: bool = False,
+        writers: int = 1,
+        cleansing: Cleansing | None = None,
+    ) -> int | None:
         """
 
         Parameters:
@@ -42,59 +1367,524 @@ class ImportHandler:
         - sep: Seperator for reading files e.g., ",", "^"
         - cols: Specifices a list of columns for filtering import data, imports all data if empty
         - allow_import: Boolean flag signaling if file is allowed to be imoprted
+        - loader: Strategy for writing rows, "copy" streams with COPY and "to_sql" issues inserts
+        - chunksize: Rows read and loaded per chunk, takes precedence over chunk_bytes
+        - chunk_bytes: Raw file bytes read and loaded per chunk
+        - dtypes: Declared column types used for parsing and for creating the table
+        - parallel: Number of processes loading byte ranges of the file concurrently, compressed
+          files cannot be split into byte ranges and are streamed by a single process
+        - cache: Whether parsed data is read from and written to the local Parquet cache
+        - writers: Number of threads writing chunks while the next chunk is parsed
+        - cleansing: Column cleansing applied to each chunk before it is written
+
+        Returns:
+        - Number of rows loaded, None when the file was not imported or the import failed
         """
         if not allow_import:
-            return
+            return None
         try:
-            with engine.begin() as conn:
+            if parallel and parallel > 1 and cls._is_compressed(file=file):
+                logger.info(
+                    f"service: load_import  |  file: {file}  |  message: Compressed input, streaming in a single process"
+                )
+            elif parallel and parallel > 1:
                 logger.info(
                     f"service: load_import  |  allow_import:  {allow_import}  |  Reading: file: {file}  |  table_schema:  {table_schema} | table_name:  {table_name}"
                 )
-                df = pd.read_csv(
-                    filepath_or_buffer=file, engine="python", sep=sep, encoding="utf-8"
+                row_count = cls._parallel_handler(
+                    engine=engine,
+                    file=file,
+                    table_schema=table_schema,
+                    table_name=table_name,
+                    if_exists=if_exists,
+                    sep=sep,
+                    cols=cols,
+                    loader=loader,
+                    parallel=parallel,
+                    chunk_bytes=chunk_bytes,
+                    dtypes=dtypes,
+                    cache=cache,
+                    cleansing=cleansing,
+                )
+                logger.info(
+                    f"service: load_import  |  table_name:  {table_name}  |  rows_loaded: {row_count}"
+                )
+                return row_count
+
+            logger.info(
+                f"service: load_import  |  allow_import:  {allow_import}  |  Reading: file: {file}  |  table_schema:  {table_schema} | table_name:  {table_name}"
+            )
+            rows = cls._chunk_rows(file=file, chunksize=chunksize, chunk_bytes=chunk_bytes)
+            if rows is not None:
+                # every chunk is parsed with the types of the first rows
+                dtypes = cls._infer_dtypes(
+                    df=cls._sample(
+                        file=file, sep=sep, cols=cols, dtypes=dtypes, cleansing=cleansing
+                    ),
+                    dtypes=dtypes or {},
                 )
 
-                df.columns = cls._header_processor(headers=df.columns)
+            logger.info(
+                f"service: load_import  |  loader: {loader}  |  chunk_rows: {rows}  |  writers: {writers}  |  message: Loading dataframe to the database, this may take serveral seconds for larger files..."
+            )
+            row_count = cls._pipeline_handler(
+                engine=engine,
+                frames=cls._frames(
+                    file=file,
+                    sep=sep,
+                    cols=cols,
+                    chunksize=rows,
+                    dtypes=dtypes,
+                    cache=cache,
+                    cleansing=cleansing,
+                ),
+                table_schema=table_schema,
+                table_name=table_name,
+                if_exists=if_exists,
+                loader=loader,
+                dtypes=dtypes,
+                writers=writers,
+                empty=(
+                    cls._empty_frame(
+                        file=file, sep=sep, cols=cols, dtypes=dtypes, cleansing=cleansing
+                    )
+                    if writers > 1
+                    else None
+                ),
+            )
+
+            logger.info(
+                f"service: load_import  |  table_name:  {table_name}  |  rows_loaded: {row_count}"
+            )
+            return row_count
+        except Exception as e:
+            logger.warning(f"UnhandledError: {e}")
+            return None
 
-                df = df[cols] if cols else df
+    @classmethod
+    def _handler_options(cls, config: FFEICConfig) -> dict:
+        """
+        Maps an import configuration to the keyword arguments of `to_sql_handler`.
 
-                print(df)
+        Parameters:
+        - config: Import JSON entry with its file path
+        """
+        return {
+            "file": config.get("file_path"),
+            "table_schema": config.get("table_schema"),
+            "table_name": config.get("table_name"),
+            "if_exists": config.get("if_exists"),
+            "sep": config.get("sep", ","),
+            "cols": config.get("cols"),
+            "allow_import": config.get("allow_import", False),
+            "loader": config.get("loader", loaders.TO_SQL),
+            "chunksize": config.get("chunksize"),
+            "chunk_bytes": config.get("chunk_bytes"),
+            "dtypes": config.get("dtypes"),
+            "parallel": config.get("parallel"),
+            "cache": config.get("cache", False),
+            "writers": config.get("writers", 1),
+            "cleansing": config.get("cleansing"),
+        }
 
-                logger.info(
-                    f"service: load_import  |  message: Loading dataframe to the database, this may take serveral seconds for larger files..."
+    @classmethod
+    def _partition_name(cls, table_name: str, config: FFEICConfig) -> str:
+        """
+        Names the child table a file is staged in, truncated to the Postgres identifier limit.
+
+        Parameters:
+        - table_name: Name of the logical target table
+        - config: Import JSON entry, its partition or else its name tags the child
+        """
+        return f"{table_name}_{config.get('partition', config['name'])}"[:63]
+
+    @classmethod
+    def _load_partition(
+        cls,
+        config: FFEICConfig,
+        table_name: str,
+        dtypes: Dict[str, ColumnType],
+    ) -> int | None:
+        """
+        Loads one file into its child table on its own connection.
+
+        Runs inside a worker process, on the engine the process keeps.
+
+        Parameters:
+        - config: Import JSON entry with its file path
+        - table_name: Name of the child table
+        - dtypes: Column types shared by every child table
+        """
+        return cls.to_sql_handler(
+            engine=cls._worker_engine(),
+            **{
+                **cls._handler_options(config=config),
+                "table_name": table_name,
+                "if_exists": "append",
+                "dtypes": dtypes,
+            },
+        )
+
+    @classmethod
+    def _partition_handler(
+        cls,
+        engine: Engine,
+        table_schema: str,
+        table_name: str,
+        configs: List[FFEICConfig],
+    ) -> Dict[str, int | None]:
+        """
+        Loads files that share a target table concurrently, each into its own child table.
+
+        The logical table is created empty from a sample of the first file, applying the first
+        file's `if_exists` action once, "fail" raising before any child is created when the
+        table exists, and every child is created like it. Once the files are
+        loaded the children are attached with `INHERIT`, which only changes catalog metadata,
+        so readers of the logical table see every file at once. A child whose file failed to
+        load is left detached.
+
+        At most one file per core loads at a time, and a file is split into byte ranges only
+        with the cores the other files leave free, so many periods of a backfill do not
+        oversubscribe the host.
+
+        Parameters:
+        - engine: Connection
+        - table_schema: Name of target table schema
+        - table_name: Name of the logical target table
+        - configs: Import JSON entries sharing the target table
+
+        Returns:
+        - Rows loaded keyed by configuration name, None for files that failed
+        """
+        first = configs[0]
+        sample = cls._sample(
+            file=first["file_path"],
+            sep=first.get("sep", ","),
+            cols=first.get("cols"),
+            dtypes=first.get("dtypes"),
+            cleansing=first.get("cleansing"),
+        )
+        # every child is created and parsed with the types of the first file's sample
+        dtypes = cls._infer_dtypes(df=sample, dtypes=first.get("dtypes") or {})
+
+        children = {
+            config["name"]: cls._partition_name(table_name=table_name, config=config)
+            for config in configs
+        }
+        with engine.begin() as conn:
+            if first.get("if_exists") == "replace":
+                conn.execute(
+                    text(f'drop table if exists "{table_schema}"."{table_name}" cascade')
                 )
-                df.to_sql(
-                    name=table_name,
-                    con=conn,
-                    if_exists=if_exists,
-                    schema=table_schema,
-                    index=False,
+            elif first.get("if_exists") == "fail" and inspect(conn).has_table(
+                table_name=table_name, schema=table_schema
+            ):
+                raise ValueError(f"Table '{table_schema}.{table_name}' already exists.")
+            cls._write_frame(
+                conn=conn,
+                df=sample.head(0),
+                table_schema=table_schema,
+                table_name=table_name,
+                if_exists="append",
+                loader=first.get("loader", loaders.TO_SQL),
+                dtypes=dtypes,
+            )
+            for child in children.values():
+                conn.execute(text(f'drop table if exists "{table_schema}"."{child}"'))
+                conn.execute(
+                    text(
+                        f'create table "{table_schema}"."{child}" (like "{table_schema}"."{table_name}")'
+                    )
                 )
-        except Exception as e:
-            logger.warning(f"UnhandledError: {e}")
+
+        # files beyond the core count queue for a worker, the cores left per file split it
+        cpus = os.cpu_count() or 1
+        workers = min(len(configs), cpus)
+        logger.info(
+            f"service: load_import  |  table_name:  {table_name}  |  partitions: {len(children)}  |  workers: {workers}"
+        )
+        with ProcessPoolExecutor(max_workers=workers) as exe:
+            futures = {
+                config["name"]: exe.submit(
+                    cls._load_partition,
+                    config={
+                        **config,
+                        "parallel": min(config.get("parallel") or 1, cpus // workers),
+                    },
+                    table_name=children[config["name"]],
+                    dtypes={**dtypes, **(config.get("dtypes") or {})},
+                )
+                for config in configs
+            }
+            row_counts = {name: future.result() for name, future in futures.items()}
+
+        with engine.begin() as conn:
+            for name, child in children.items():
+                if row_counts[name] is not None:
+                    conn.execute(
+                        text(
+                            f'alter table "{table_schema}"."{child}" inherit "{table_schema}"."{table_name}"'
+                        )
+                    )
+        return row_counts
+
+    @classmethod
+    def _table_groups(
+        cls, configs: List[FFEICConfig]
+    ) -> Dict[Tuple[str, str], List[FFEICConfig]]:
+        """
+        Groups configurations by target table, keeping their declared order.
+
+        Files that share a table are loaded together as child tables of the target, so they
+        are skipped or reloaded as a whole.
+
+        Parameters:
+        - configs: Import JSON
+        """
+        groups: Dict[Tuple[str, str], List[FFEICConfig]] = {}
+        for config in configs:
+            key = (config.get("table_schema"), config.get("table_name"))
+            groups.setdefault(key, []).append(config)
+        return groups
 
     @classmethod
     def import_handler(
         cls,
         engine: Engine,
         configs: List[dict],
-    ) -> None:
+        incremental: bool = False,
+    ) -> Dict[str, int | None]:
         """
         Facilitates import based on configurations
 
+        Every loaded file is recorded in the import manifest with its share of the load time.
+        In incremental mode a table is skipped when each of its files matches the fingerprint
+        of its last successful load, otherwise the table is dropped and all of its files are
+        reloaded. Tables loaded from several files are staged per file in parallel, see
+        `_partition_handler`. Every loaded table is profiled into `transformations.column_profiles`.
+
         Parameters:
         - engine: connection
         - config: Import JSON
+        - incremental: Skips tables whose files are unchanged since their last load
+
+        Returns:
+        - Rows loaded keyed by configuration name for every file whose table was loaded, None
+          for files that failed. Files of skipped tables are left out.
+        """
+        loaded: Dict[str, int | None] = {}
+        for (table_schema, table_name), group in cls._table_groups(configs).items():
+            fingerprints = {
+                config["name"]: cls._fingerprint(file=config["file_path"])
+                for config in group
+                if config.get("allow_import", False) and config.get("file_path")
+            }
+            if not fingerprints:
+                continue
+
+            if incremental:
+                with engine.begin() as conn:
+                    current = all(
+                        cls._is_loaded(
+                            conn=conn,
+                            fingerprint=fingerprint,
+                            table_schema=table_schema,
+                            table_name=table_name,
+                        )
+                        for fingerprint in fingerprints.values()
+                    )
+                    if current:
+                        logger.info(
+                            f"service: load_import  |  table_name:  {table_name}  |  message: Files unchanged since last load, skipping"
+                        )
+                        continue
+                    conn.execute(
+                        text(
+                            f'drop table if exists "{table_schema}"."{table_name}" cascade'
+                        )
+                    )
+
+            group = [config for config in group if config["name"] in fingerprints]
+            start = time.perf_counter()
+            if len(group) > 1:
+                try:
+                    row_counts = cls._partition_handler(
+                        engine=engine,
+                        table_schema=table_schema,
+                        table_name=table_name,
+                        configs=group,
+                    )
+                except Exception as e:
+                    logger.warning(f"UnhandledError: {e}")
+                    row_counts = {config["name"]: None for config in group}
+            else:
+                row_counts = {
+                    config["name"]: cls.to_sql_handler(
+                        engine=engine, **cls._handler_options(config=config)
+                    )
+                    for config in group
+                }
+
+            # files of a table load together, each is charged its share of the wall time by size
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            group_size = sum(fingerprint["file_size"] for fingerprint in fingerprints.values())
+            with engine.begin() as conn:
+                for name, row_count in row_counts.items():
+                    if row_count is not None:
+                        cls._record_load(
+                            conn=conn,
+                            fingerprint=fingerprints[name],
+                            table_schema=table_schema,
+                            table_name=table_name,
+                            row_count=row_count,
+                            elapsed_ms=round(
+                                elapsed_ms * fingerprints[name]["file_size"] / group_size, 3
+                            )
+                            if group_size
+                            else None,
+                        )
+            loaded.update(row_counts)
+            if any(row_count is not None for row_count in row_counts.values()):
+                cls._profile_table(
+                    engine=engine, table_schema=table_schema, table_name=table_name
+                )
+        logger.info("Configs: %s", pprint.pformat(configs, indent=2))
+        return loaded
+
+    @classmethod
+    def _index_name(cls, table_name: str, columns: List[str]) -> str:
+        """
+        Names a staging index, the prefix is kept when the name is truncated to the Postgres
+        identifier limit so the cleanup script can find it.
+
+        Parameters:
+        - table_name: Name of the indexed table
+        - columns: Indexed columns
+        """
+        return f"{loaders.INDEX_PREFIX}{table_name}_{'_'.join(columns)}"[:63]
+
+    @classmethod
+    def _stage_tables(
+        cls, conn: Connection, table_schema: str, table_name: str
+    ) -> List[str]:
+        """
+        Lists a loaded table followed by the child tables that inherit it.
+
+        Parameters:
+        - conn: Connection
+        - table_schema: Name of target table schema
+        - table_name: Name of target table
+
+        Returns:
+        - Table names, empty when the table does not exist
+        """
+        stmt = text(
+            """
+            select c.relname
+            from pg_class c
+            where c.oid = to_regclass(:table)
+            union all
+            select c.relname
+            from pg_inherits i
+            join pg_class c on c.oid = i.inhrelid
+            where i.inhparent = to_regclass(:table)
+            """
+        )
+        return list(
+            conn.execute(stmt, {"table": f'"{table_schema}"."{table_name}"'}).scalars()
+        )
+
+    @classmethod
+    def _maintain(cls, engine: Engine, statement: str, maintenance_work_mem: str) -> bool:
+        """
+        Runs an index build or analyze on its own connection with the given sort memory.
+
+        Parameters:
+        - engine: Connection
+        - statement: `create index` or `analyze` statement
+        - maintenance_work_mem: Postgres memory setting for the statement, e.g. "512MB"
+
+        Returns:
+        - False when the statement failed, the failure is logged
+        """
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text("select set_config('maintenance_work_mem', :value, true)"),
+                    {"value": maintenance_work_mem},
+                )
+                conn.execute(text(statement))
+        except Exception as e:
+            logger.warning(f"UnhandledError: {e}")
+            return False
+        logger.info(f"service: index_import  |  statement: {statement}")
+        return True
+
+    @classmethod
+    def index_handler(
+        cls,
+        engine: Engine,
+        configs: List[FFEICConfig],
+        workers: int = 4,
+        maintenance_work_mem: str = "512MB",
+    ) -> bool:
+        """
+        Builds the declared indexes of the loaded staging tables, then analyzes every one of them.
+
+        Tables loaded as child tables are indexed and analyzed per child, an index on the
+        logical table would not cover their rows. Builds run concurrently, followed by the
+        analyzes, so the scripts are planned with fresh statistics. A failed statement is
+        logged and does not stop the others.
+
+        Parameters:
+        - engine: connection
+        - configs: Import JSON
+        - workers: Statements running at once, each over its own connection
+        - maintenance_work_mem: Postgres memory setting for each statement, e.g. "512MB"
+
+        Returns:
+        - True when every build and analyze succeeded
         """
+        tables: Dict[Tuple[str, str], List[List[str]]] = {}
         for config in configs:
-            cls.to_sql_handler(
-                engine=engine,
-                file=config.get("file_path"),
-                table_schema=config.get("table_schema"),
-                table_name=config.get("table_name"),
-                if_exists=config.get("if_exists"),
-                sep=config.get("sep", ","),
-                cols=config.get("cols"),
-                allow_import=config.get("allow_import", False),
+            if not config.get("allow_import", False):
+                continue
+            key = (config.get("table_schema"), config.get("table_name"))
+            indexes = tables.setdefault(key, [])
+            indexes.extend(
+                columns for columns in config.get("indexes", []) if columns not in indexes
             )
-        logger.info("Configs: %s", pprint.pformat(configs, indent=2))
+
+        builds: List[str] = []
+        analyzes: List[str] = []
+        with engine.connect() as conn:
+            for (table_schema, table_name), indexes in tables.items():
+                for table in cls._stage_tables(
+                    conn=conn, table_schema=table_schema, table_name=table_name
+                ):
+                    for columns in indexes:
+                        name = cls._index_name(table_name=table, columns=columns)
+                        keys = ", ".join(f'"{column}"' for column in columns)
+                        builds.append(
+                            f'create index if not exists "{name}" on "{table_schema}"."{table}" ({keys})'
+                        )
+                    analyzes.append(f'analyze "{table_schema}"."{table}"')
+
+        logger.info(
+            f"service: index_import  |  indexes: {len(builds)}  |  tables: {len(analyzes)}  |  workers: {workers}"
+        )
+        succeeded = True
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as exe:
+            for statements in (builds, analyzes):
+                futures = [
+                    exe.submit(
+                        cls._maintain,
+                        engine=engine,
+                        statement=statement,
+                        maintenance_work_mem=maintenance_work_mem,
+                    )
+                    for statement in statements
+                ]
+                for future in futures:
+                    succeeded = future.result() and succeeded
+        return succeeded
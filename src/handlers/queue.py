@@ -0,0 +1,338 @@
+"""
+queue
+
+This module provides the Postgres backed task queue shared by the workers of a run. It defines
+the `QueueHandler` class, which enqueues the import, index and script tasks of a run with the
+tasks each one depends on, and lets any number of workers, on this host or others, claim the
+next task whose dependencies are done with `FOR UPDATE SKIP LOCKED`.
+"""
+
+import json
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..constants import queue
+from ..logger import logger
+
+
+class QueueHandler:
+    """
+    A handler for the tasks of `transformations.task_queue`.
+
+    A claimed task is marked running in the transaction that locks it, so concurrent workers
+    skip it instead of waiting for it. Its worker refreshes the claim while the task runs, a
+    running task whose worker was lost is claimed again once its claim is older than
+    `queue.TASK_TIMEOUT`. A claim is identified by the worker and the attempt that made it,
+    so a worker whose task was claimed again can neither refresh nor complete it.
+    """
+
+    @classmethod
+    def enqueue(cls, db: Session, run_id: str, tasks: List[dict]) -> int:
+        """
+        Adds the tasks of a run to the queue, tasks already queued for the run are kept.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID the tasks belong to.
+            tasks (List[dict]): Tasks, each with its "stage", "task" name, the names of the
+                tasks it depends on in "depends_on" and keyword arguments in "options".
+
+        Returns:
+            int: Number of tasks added.
+        """
+        with db.begin():
+            result = db.execute(
+                text(
+                    """
+                    insert into transformations.task_queue (run_id, stage, task, depends_on, options)
+                    values (:run_id, :stage, :task, :depends_on, cast(:options as jsonb))
+                    on conflict (run_id, task) do nothing
+                    """
+                ),
+                [
+                    {
+                        "run_id": run_id,
+                        "stage": task["stage"],
+                        "task": task["task"],
+                        "depends_on": sorted(task.get("depends_on", [])),
+                        "options": json.dumps(task.get("options", {})),
+                    }
+                    for task in tasks
+                ],
+            )
+        logger.info(
+            f"service: enqueue  |  run_id: {run_id}  |  tasks: {len(tasks)}  |  added: {result.rowcount}"
+        )
+        return result.rowcount
+
+    @classmethod
+    def claim(cls, db: Session, worker: str, run_id: str | None = None) -> dict | None:
+        """
+        Claims the oldest pending task whose dependencies are done.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            worker (str): Name of the claiming worker, recorded on the task.
+            run_id (str | None): Only claims tasks of this run, None claims tasks of any run.
+
+        Returns:
+            dict | None: The claimed task with its "id", "run_id", "stage", "task", "options"
+                and the number of the claim in "attempts", None when no task can be claimed.
+        """
+        with db.begin():
+            row = db.execute(
+                text(
+                    """
+                    update transformations.task_queue t
+                    set
+                        status = :running,
+                        worker = :worker,
+                        attempts = t.attempts + 1,
+                        claimed_at = now(),
+                        finished_at = null,
+                        error = null
+                    where t.id = (
+                        select q.id
+                        from transformations.task_queue q
+                        where
+                            (cast(:run_id as varchar) is null or q.run_id = :run_id)
+                            and (
+                                q.status = :pending
+                                or (
+                                    q.status = :running
+                                    and q.claimed_at < now() - make_interval(secs => :timeout)
+                                )
+                            )
+                            and not exists (
+                                select 1
+                                from transformations.task_queue d
+                                where
+                                    d.run_id = q.run_id
+                                    and d.task = any(q.depends_on)
+                                    and d.status <> :done
+                            )
+                        order by q.id
+                        limit 1
+                        for update skip locked
+                    )
+                    returning t.id, t.run_id, t.stage, t.task, t.options, t.attempts
+                    """
+                ),
+                {
+                    "run_id": run_id,
+                    "worker": worker,
+                    "pending": queue.PENDING,
+                    "running": queue.RUNNING,
+                    "done": queue.DONE,
+                    "timeout": queue.TASK_TIMEOUT,
+                },
+            ).mappings().first()
+        return dict(row) if row else None
+
+    @classmethod
+    def heartbeat(cls, db: Session, task_id: int, worker: str, attempts: int) -> bool:
+        """
+        Refreshes the claim of a running task, so it is not claimed again while it runs.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            task_id (int): ID of the claimed task.
+            worker (str): Name of the worker holding the claim.
+            attempts (int): Number of the claim, as returned by `claim`.
+
+        Returns:
+            bool: False when the claim was lost to another worker.
+        """
+        with db.begin():
+            return bool(
+                db.execute(
+                    text(
+                        """
+                        update transformations.task_queue
+                        set claimed_at = now()
+                        where id = :id and worker = :worker and attempts = :attempts and status = :running
+                        """
+                    ),
+                    {
+                        "id": task_id,
+                        "worker": worker,
+                        "attempts": attempts,
+                        "running": queue.RUNNING,
+                    },
+                ).rowcount
+            )
+
+    @classmethod
+    def complete(
+        cls,
+        db: Session,
+        task_id: int,
+        worker: str,
+        attempts: int,
+        error: str | None = None,
+    ) -> bool:
+        """
+        Marks a claimed task done, or failed with its error, unless its claim was lost.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            task_id (int): ID of the claimed task.
+            worker (str): Name of the worker holding the claim.
+            attempts (int): Number of the claim, as returned by `claim`.
+            error (str | None): Error of a failed task, None when the task succeeded.
+
+        Returns:
+            bool: False when the task was claimed again by another worker, its status is left
+                to that worker.
+        """
+        with db.begin():
+            return bool(
+                db.execute(
+                    text(
+                        """
+                        update transformations.task_queue
+                        set status = :status, error = :error, finished_at = now()
+                        where id = :id and worker = :worker and attempts = :attempts and status = :running
+                        """
+                    ),
+                    {
+                        "id": task_id,
+                        "worker": worker,
+                        "attempts": attempts,
+                        "running": queue.RUNNING,
+                        "status": queue.FAILED if error else queue.DONE,
+                        "error": error,
+                    },
+                ).rowcount
+            )
+
+    @classmethod
+    def requeue(cls, db: Session, run_id: str) -> int:
+        """
+        Returns the failed and held tasks of a run to the queue, done tasks are kept.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            int: Number of tasks requeued.
+        """
+        with db.begin():
+            return db.execute(
+                text(
+                    """
+                    update transformations.task_queue
+                    set status = :pending, error = null, finished_at = null
+                    where run_id = :run_id and status in (:failed, :held)
+                    """
+                ),
+                {
+                    "run_id": run_id,
+                    "pending": queue.PENDING,
+                    "failed": queue.FAILED,
+                    "held": queue.HELD,
+                },
+            ).rowcount
+
+    @classmethod
+    def hold_blocked(cls, db: Session, run_id: str) -> int:
+        """
+        Holds the pending tasks of a run that depend on a failed or held task, transitively.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            int: Number of tasks held.
+        """
+        held = 0
+        with db.begin():
+            while True:
+                rowcount = db.execute(
+                    text(
+                        """
+                        update transformations.task_queue q
+                        set status = :held, finished_at = now()
+                        where
+                            q.run_id = :run_id
+                            and q.status = :pending
+                            and exists (
+                                select 1
+                                from transformations.task_queue d
+                                where
+                                    d.run_id = q.run_id
+                                    and d.task = any(q.depends_on)
+                                    and d.status in (:failed, :held)
+                            )
+                        """
+                    ),
+                    {
+                        "run_id": run_id,
+                        "held": queue.HELD,
+                        "pending": queue.PENDING,
+                        "failed": queue.FAILED,
+                    },
+                ).rowcount
+                if not rowcount:
+                    return held
+                held += rowcount
+
+    @classmethod
+    def run_status(cls, db: Session, run_id: str) -> Dict[str, int]:
+        """
+        Counts the tasks of a run per status.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            Dict[str, int]: Number of tasks keyed by status, see `queue`.
+        """
+        with db.begin():
+            rows = db.execute(
+                text(
+                    """
+                    select status, count(*)
+                    from transformations.task_queue
+                    where run_id = :run_id
+                    group by status
+                    """
+                ),
+                {"run_id": run_id},
+            ).all()
+        return {status: count for status, count in rows}
+
+    @classmethod
+    def stage_status(cls, db: Session, run_id: str) -> Dict[str, Dict[str, int]]:
+        """
+        Counts the tasks of a run per stage and status.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID of the tasks.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Number of tasks keyed by stage, see `ledger`, and status,
+                see `queue`.
+        """
+        with db.begin():
+            rows = db.execute(
+                text(
+                    """
+                    select stage, status, count(*)
+                    from transformations.task_queue
+                    where run_id = :run_id
+                    group by stage, status
+                    """
+                ),
+                {"run_id": run_id},
+            ).all()
+        status: Dict[str, Dict[str, int]] = {}
+        for stage, state, count in rows:
+            status.setdefault(stage, {})[state] = count
+        return status
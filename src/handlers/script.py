@@ -3,15 +3,29 @@ script
 
 This module provides functionality for executing SQL scripts in a synchronous database session. 
 It defines the `ScriptHandler` class, which allows running individual SQL scripts as well as 
-batch execution of multiple scripts based on configurable parameters.
+batch execution of multiple scripts based on configurable parameters, either in order or as a
+dependency graph of the tables each script reads and writes. Scripts are executed statement by
+statement, and the wall time and rows affected of every statement are collected for the run. A
+profiling mode captures the query plan of every statement inside a transaction that is rolled back.
+Completed stages and scripts are recorded in a run ledger, so a failed run can be resumed.
 """
 
+import hashlib
+import json
 import logging
-from typing import List
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Mapping, Set
 
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from ..constants import directory
+from ..constants import profile as profiles
 from ..constants.objects import ScriptsConfig
 from ..logger import logger
 
@@ -25,28 +39,161 @@ class ScriptHandler:
 
     This class provides methods to run individual SQL scripts and execute multiple
     scripts based on configuration settings.
+
+    Attributes:
+        _metrics (List[dict]): Statement metrics collected since the last `record_metrics`.
+        _metrics_lock (threading.Lock): Guards `_metrics` across concurrently running scripts.
     """
 
+    _metrics: List[dict] = []
+    _metrics_lock: threading.Lock = threading.Lock()
+    _dollar_quote = re.compile(r"\$[A-Za-z_][A-Za-z_0-9]*\$|\$\$")
+
+    @classmethod
+    def split_statements(cls, sql: str) -> List[str]:
+        """
+        Splits an SQL script into its statements on semicolons outside of quotes and comments.
+
+        Single quoted strings, double quoted identifiers and dollar quoted bodies such as
+        `$$ ... $$` or `$body$ ... $body$` are kept intact. Comments outside of them are
+        dropped, and statements left empty are skipped.
+
+        Args:
+            sql (str): Content of an SQL script.
+
+        Returns:
+            List[str]: Statements without their terminating semicolon.
+        """
+        statements: List[str] = []
+        current: List[str] = []
+        i, length = 0, len(sql)
+        while i < length:
+            char = sql[i]
+            if sql.startswith("--", i):
+                end = sql.find("\n", i)
+                i = length if end == -1 else end
+            elif sql.startswith("/*", i):
+                end = sql.find("*/", i + 2)
+                current.append(" ")
+                i = length if end == -1 else end + 2
+            elif char in ("'", '"'):
+                end = i + 1
+                while end < length:
+                    if sql[end] == char and sql.startswith(char * 2, end):
+                        end += 2
+                    elif sql[end] == char:
+                        break
+                    else:
+                        end += 1
+                current.append(sql[i : end + 1])
+                i = end + 1
+            elif char == "$" and cls._dollar_quote.match(sql, i):
+                tag = cls._dollar_quote.match(sql, i).group()
+                end = sql.find(tag, i + len(tag))
+                end = length if end == -1 else end + len(tag)
+                current.append(sql[i:end])
+                i = end
+            elif char == ";":
+                statements.append("".join(current))
+                current = []
+                i += 1
+            else:
+                current.append(char)
+                i += 1
+        statements.append("".join(current))
+        return [statement.strip() for statement in statements if statement.strip()]
+
+    @classmethod
+    def _statement_hash(cls, statement: str) -> str:
+        """
+        Hashes a statement with its whitespace collapsed, so formatting changes keep the hash.
+
+        Args:
+            statement (str): SQL statement.
+        """
+        return hashlib.sha256(" ".join(statement.split()).encode("utf-8")).hexdigest()
+
     @classmethod
-    def _script_runner(cls, db: Session, script: str) -> None:
+    def _script_runner(cls, db: Session, script: str) -> bool:
         """
-        Executes an SQL script using the provided database session.
+        Executes an SQL script statement by statement using the provided database session.
+
+        The statements run in one transaction. The wall time and rows affected of each
+        statement are collected for `record_metrics`, including the statement that failed.
 
         Args:
             db (Session): SQLAlchemy database session for executing queries.
             script (str): Path to the SQL script file to be executed.
 
+        Returns:
+            bool: True when every statement was committed.
+
         Raises:
             Exception: Logs an error if the script execution fails.
         """
         try:
             with open(script, "r") as file:
-                sql_script = file.read()
+                statements = cls.split_statements(sql=file.read())
 
             with db.begin():
-                db.execute(text(sql_script))
+                for index, statement in enumerate(statements):
+                    metric = {
+                        "script": os.path.basename(script),
+                        "statement_index": index,
+                        "statement_hash": cls._statement_hash(statement=statement),
+                        "statement": statement,
+                        "started_at": datetime.now(timezone.utc).isoformat(),
+                        "elapsed_ms": None,
+                        "row_count": None,
+                        "error": None,
+                    }
+                    start = time.perf_counter()
+                    try:
+                        result = db.execute(text(statement))
+                        metric["row_count"] = result.rowcount
+                    except Exception as e:
+                        metric["error"] = str(e)
+                        raise
+                    finally:
+                        metric["elapsed_ms"] = round(
+                            (time.perf_counter() - start) * 1000, 3
+                        )
+                        with cls._metrics_lock:
+                            cls._metrics.append(metric)
+            return True
         except Exception as e:
             logger.error(f"Failed to execute {script}: {str(e)}")
+            return False
+
+    @classmethod
+    def load_codes(cls, db: Session, codes: Mapping[str, Mapping[int | str, str]]) -> None:
+        """
+        Loads the code dictionary into `transformations.tmp_codes`, replacing its content.
+
+        Scripts translate codes by joining this table once per code set while inserting into
+        their tmp tables.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            codes (Mapping[str, Mapping[int | str, str]]): Descriptions keyed by code, per code set.
+        """
+        rows = [
+            {"code_set": code_set, "cd": str(cd), "description": description}
+            for code_set, descriptions in codes.items()
+            for cd, description in descriptions.items()
+        ]
+        with db.begin():
+            db.execute(text("delete from transformations.tmp_codes"))
+            db.execute(
+                text(
+                    """
+                    insert into transformations.tmp_codes (code_set, cd, description)
+                    values (:code_set, :cd, :description)
+                    """
+                ),
+                rows,
+            )
+        logger.info(f"service: load_codes | code_sets: {len(codes)} | codes: {len(rows)}")
 
     @classmethod
     def execute_scripts(cls, db: Session, configs: List[ScriptsConfig]) -> None:
@@ -74,3 +221,520 @@ class ScriptHandler:
                     f"Skipping execution for {config.get('file_path')} due to 'allow_exe' being False"
                 )
         return True
+
+    @classmethod
+    def execute_script(cls, db: Session, config: ScriptsConfig) -> bool:
+        """
+        Executes a single SQL script based on its configuration.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            config (ScriptsConfig): Script configuration with its file path.
+
+        Returns:
+            bool: True when the script was committed.
+        """
+        logger.info(f"service: init_scripts | executing file: {config.get('file_path')}")
+        return cls._script_runner(db=db, script=config.get("file_path"))
+
+    @classmethod
+    def build_dag(cls, configs: List[ScriptsConfig]) -> Dict[str, Set[str]]:
+        """
+        Derives the scripts each script must wait for from their declared inputs and outputs.
+
+        The configuration order is the reference order. A script depends on every earlier
+        script that writes one of its inputs or outputs, and on every earlier script that
+        reads one of its outputs, so running the graph gives the same result as running the
+        list in order. A script without declarations depends on every earlier script and
+        every later script depends on it.
+
+        Args:
+            configs (List[ScriptsConfig]): Script configurations in reference order.
+
+        Returns:
+            Dict[str, Set[str]]: Names of the scripts each script depends on, keyed by name.
+        """
+
+        def declared(config: ScriptsConfig) -> bool:
+            return "inputs" in config or "outputs" in config
+
+        dag: Dict[str, Set[str]] = {}
+        for index, config in enumerate(configs):
+            reads = set(config.get("inputs", []))
+            writes = set(config.get("outputs", []))
+            dag[config["name"]] = {
+                prior["name"]
+                for prior in configs[:index]
+                if not declared(config)
+                or not declared(prior)
+                or set(prior.get("outputs", [])) & (reads | writes)
+                or set(prior.get("inputs", [])) & writes
+            }
+        return dag
+
+    @classmethod
+    def downstream(cls, configs: List[ScriptsConfig], tables: Iterable[str]) -> Set[str]:
+        """
+        Names the scripts that read one of the tables and every script depending on them.
+
+        A script without declarations may read any table, so it is always named.
+
+        Args:
+            configs (List[ScriptsConfig]): Script configurations in reference order, see `build_dag`.
+            tables (Iterable[str]): Names of the tables that changed.
+
+        Returns:
+            Set[str]: Names of the scripts to run again.
+        """
+        tables = set(tables)
+        dag = cls.build_dag(configs=configs)
+        selected: Set[str] = set()
+        # dependencies precede their dependents in reference order
+        for config in configs:
+            if (
+                ("inputs" not in config and "outputs" not in config)
+                or set(config.get("inputs", [])) & tables
+                or dag[config["name"]] & selected
+            ):
+                selected.add(config["name"])
+        return selected
+
+    @classmethod
+    def _session_runner(cls, session_factory: sessionmaker, script: str) -> bool:
+        """
+        Executes an SQL script on a session of its own.
+
+        Args:
+            session_factory (sessionmaker): Factory bound to a pooled engine.
+            script (str): Path to the SQL script file to be executed.
+
+        Returns:
+            bool: True when the script was committed.
+        """
+        with session_factory() as db:
+            return cls._script_runner(db=db, script=script)
+
+    @classmethod
+    def execute_dag(
+        cls,
+        session_factory: sessionmaker,
+        configs: List[ScriptsConfig],
+        workers: int,
+        completed: Iterable[str] = (),
+        on_complete: Callable[[str], None] | None = None,
+    ) -> Set[str]:
+        """
+        Executes scripts concurrently, starting each one as soon as its dependencies finish.
+
+        A script that fails holds back every script depending on it, so their inputs are left
+        as they were for a resumed run, while independent scripts keep running.
+
+        Args:
+            session_factory (sessionmaker): Factory bound to a pooled engine, each running
+                script holds one session.
+            configs (List[ScriptsConfig]): Script configurations in reference order, see `build_dag`.
+            workers (int): Maximum number of scripts running at once.
+            completed (Iterable[str]): Names of scripts completed by an earlier attempt of the
+                run, they are treated as finished without running.
+            on_complete (Callable[[str], None] | None): Called with the name of each script
+                that was committed.
+
+        Returns:
+            Set[str]: Names of the scripts that failed or were held back.
+
+        Logs:
+            - Info logs for scripts that are started, finished, resumed or skipped.
+            - Error logs if script execution fails, dependent scripts are held back.
+        """
+        for config in configs:
+            if not config.get("allow_exe"):
+                logger.info(
+                    f"Skipping execution for {config.get('file_path')} due to 'allow_exe' being False"
+                )
+        configs = [config for config in configs if config.get("allow_exe")]
+        dag = cls.build_dag(configs=configs)
+        pending = {config["name"]: config for config in configs}
+        done: Set[str] = set()
+        failed: Set[str] = set()
+        running: Dict[Future, str] = {}
+
+        for name in set(completed) & set(pending):
+            pending.pop(name)
+            done.add(name)
+            logger.info(f"service: init_scripts | resumed: {name}")
+
+        with ThreadPoolExecutor(max_workers=workers) as exe:
+            while pending or running:
+                for name, config in list(pending.items()):
+                    if dag[name] & failed:
+                        failed.add(pending.pop(name)["name"])
+                        logger.warning(
+                            f"service: init_scripts | held back: {name} | failed: {sorted(dag[name] & failed)}"
+                        )
+                    elif dag[name] <= done:
+                        logger.info(
+                            f"service: init_scripts | executing file: {config.get('file_path')}"
+                        )
+                        future = exe.submit(
+                            cls._session_runner,
+                            session_factory=session_factory,
+                            script=config.get("file_path"),
+                        )
+                        running[future] = pending.pop(name)["name"]
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if not future.result():
+                        failed.add(name)
+                        continue
+                    done.add(name)
+                    logger.info(f"service: init_scripts | finished: {name}")
+                    if on_complete:
+                        on_complete(name)
+        return failed
+
+    @classmethod
+    def latest_run(cls, db: Session) -> str | None:
+        """
+        Returns the run ID of the latest run recorded in `transformations.run_ledger`.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+
+        Returns:
+            str | None: Run ID, None when the ledger is empty or does not exist yet.
+        """
+        with db.begin():
+            if db.execute(
+                text("select to_regclass('transformations.run_ledger')")
+            ).scalar() is None:
+                return None
+            return db.execute(
+                text(
+                    "select run_id from transformations.run_ledger order by id desc limit 1"
+                )
+            ).scalar()
+
+    @classmethod
+    def checkpoints(cls, db: Session, run_id: str, stage: str) -> Dict[str, str | None]:
+        """
+        Returns the items of a stage completed under a run ID with their latest fingerprint.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID the items were recorded under.
+            stage (str): Stage of the items, see `ledger`.
+
+        Returns:
+            Dict[str, str | None]: Fingerprints keyed by item name.
+        """
+        with db.begin():
+            rows = db.execute(
+                text(
+                    """
+                    select distinct on (item) item, fingerprint
+                    from transformations.run_ledger
+                    where run_id = :run_id and stage = :stage
+                    order by item, id desc
+                    """
+                ),
+                {"run_id": run_id, "stage": stage},
+            )
+            return {row.item: row.fingerprint for row in rows}
+
+    @classmethod
+    def record_checkpoint(
+        cls,
+        db: Session,
+        run_id: str,
+        stage: str,
+        item: str,
+        fingerprint: str | None = None,
+    ) -> None:
+        """
+        Records an item of a stage as completed under a run ID.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID of the pipeline run.
+            stage (str): Stage of the item, see `ledger`.
+            item (str): Name of the completed stage or script.
+            fingerprint (str | None): Fingerprint the item was completed with.
+        """
+        with db.begin():
+            db.execute(
+                text(
+                    """
+                    insert into transformations.run_ledger (run_id, stage, item, fingerprint)
+                    values (:run_id, :stage, :item, :fingerprint)
+                    """
+                ),
+                {"run_id": run_id, "stage": stage, "item": item, "fingerprint": fingerprint},
+            )
+
+    @classmethod
+    def script_fingerprints(cls, db: Session, configs: List[ScriptsConfig]) -> Dict[str, str]:
+        """
+        Fingerprints each script by its content and the latest load of its imported inputs.
+
+        Inputs loaded from import files are identified by their latest entry in
+        `transformations.import_manifest`, so reloading a staging table changes the fingerprint
+        of every script reading it. Inputs written by other scripts are covered by the
+        fingerprints of those scripts.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            configs (List[ScriptsConfig]): Script configurations.
+
+        Returns:
+            Dict[str, str]: SHA-256 hex digests keyed by script name.
+        """
+        inputs = sorted({table for config in configs for table in config.get("inputs", [])})
+        with db.begin():
+            loads = dict(
+                db.execute(
+                    text(
+                        """
+                        select table_name, max(id)
+                        from transformations.import_manifest
+                        where table_schema = 'transformations' and table_name = any(:inputs)
+                        group by table_name
+                        """
+                    ),
+                    {"inputs": inputs},
+                ).all()
+            )
+
+        fingerprints: Dict[str, str] = {}
+        for config in configs:
+            digest = hashlib.sha256()
+            with open(config["file_path"], "rb") as file:
+                digest.update(file.read())
+            for table in sorted(config.get("inputs", [])):
+                digest.update(f"\0{table}:{loads.get(table)}".encode("utf-8"))
+            fingerprints[config["name"]] = digest.hexdigest()
+        return fingerprints
+
+    @classmethod
+    def record_metrics(
+        cls, db: Session, run_id: str, report_dir: str = directory.REPORTS
+    ) -> str:
+        """
+        Persists the statement metrics collected since the last call under a run ID.
+
+        Metrics are inserted into `transformations.script_metrics` and written to a JSON report
+        whose `hot_list` orders the statements by wall time, slowest first. Every worker of a
+        queued run records under the same run ID, each report is named after the time it was
+        written so reports of the same run do not overwrite each other.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            run_id (str): Run ID the metrics are recorded under.
+            report_dir (str): Directory the JSON report is written to, relative to the working
+                directory.
+
+        Returns:
+            str: Path of the JSON report.
+        """
+        with cls._metrics_lock:
+            metrics, cls._metrics = cls._metrics, []
+
+        if metrics:
+            with db.begin():
+                db.execute(
+                    text(
+                        """
+                        insert into transformations.script_metrics
+                            (run_id, script, statement_index, statement_hash, statement,
+                            started_at, elapsed_ms, row_count, error)
+                        values
+                            (:run_id, :script, :statement_index, :statement_hash, :statement,
+                            :started_at, :elapsed_ms, :row_count, :error)
+                        """
+                    ),
+                    [{**metric, "run_id": run_id} for metric in metrics],
+                )
+
+        written = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        path = os.path.join(
+            os.getcwd(), report_dir, f"script_metrics_{run_id}_{written}.json"
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "run_id": run_id,
+                    "statements": metrics,
+                    "hot_list": sorted(
+                        metrics, key=lambda metric: metric["elapsed_ms"], reverse=True
+                    ),
+                },
+                file,
+                indent=2,
+            )
+        logger.info(
+            f"service: script_metrics | run_id: {run_id} | statements: {len(metrics)} | report: {path}"
+        )
+        return path
+
+    @classmethod
+    def _keyword(cls, statement: str) -> str:
+        """
+        Returns the lowercase leading keyword of a statement.
+
+        Args:
+            statement (str): SQL statement.
+        """
+        return statement.split(None, 1)[0].lower() if statement else ""
+
+    @classmethod
+    def _plan_findings(cls, plan: dict) -> Dict[str, List[dict]]:
+        """
+        Walks a plan tree for sequential scans on large tables, hash and sort spills, and
+        mis-estimated row counts.
+
+        Args:
+            plan (dict): Top level node of an `EXPLAIN (ANALYZE, FORMAT JSON)` plan.
+
+        Returns:
+            Dict[str, List[dict]]: Findings keyed by "seq_scans", "spills" and "misestimates".
+        """
+        findings: Dict[str, List[dict]] = {"seq_scans": [], "spills": [], "misestimates": []}
+        nodes = [plan]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get("Plans", []))
+            node_type = node.get("Node Type")
+            loops = node.get("Actual Loops", 1) or 1
+            actual = node.get("Actual Rows", 0)
+            estimated = node.get("Plan Rows", 0)
+
+            if node_type == "Seq Scan" and actual * loops >= profiles.SEQ_SCAN_ROWS:
+                findings["seq_scans"].append(
+                    {
+                        "relation": node.get("Relation Name"),
+                        "rows": actual * loops,
+                        "filter": node.get("Filter"),
+                    }
+                )
+            if node.get("Hash Batches", 1) > 1 or node.get("Sort Space Type") == "Disk":
+                findings["spills"].append(
+                    {
+                        "node_type": node_type,
+                        "hash_batches": node.get("Hash Batches"),
+                        "sort_method": node.get("Sort Method"),
+                        "peak_memory_kb": node.get("Peak Memory Usage")
+                        or node.get("Sort Space Used"),
+                    }
+                )
+            if max(actual, estimated) >= profiles.MISESTIMATE_MIN_ROWS and max(
+                actual, estimated
+            ) >= profiles.MISESTIMATE_RATIO * max(min(actual, estimated), 1):
+                findings["misestimates"].append(
+                    {
+                        "node_type": node_type,
+                        "relation": node.get("Relation Name"),
+                        "estimated_rows": estimated,
+                        "actual_rows": actual,
+                    }
+                )
+        return findings
+
+    @classmethod
+    def profile_scripts(
+        cls,
+        db: Session,
+        configs: List[ScriptsConfig],
+        report_dir: str = directory.REPORTS,
+    ) -> str:
+        """
+        Captures the query plan of every statement of the configured scripts without keeping
+        any of their changes.
+
+        Scripts run in configuration order inside one transaction that is rolled back at the
+        end, so later scripts are profiled against the data earlier scripts produced.
+        Explainable statements are wrapped in `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`,
+        other statements are executed as is, and transaction control statements are skipped.
+        Each statement runs in a savepoint so a failure does not end the run. The plans and a
+        summary of sequential scans on large tables, spills and mis-estimated row counts are
+        written to a JSON report.
+
+        Args:
+            db (Session): SQLAlchemy database session for executing queries.
+            configs (List[ScriptsConfig]): Script configurations in execution order.
+            report_dir (str): Directory the JSON report is written to, relative to the working
+                directory.
+
+        Returns:
+            str: Path of the JSON report.
+        """
+        statements: List[dict] = []
+        summary: Dict[str, List[dict]] = {"seq_scans": [], "spills": [], "misestimates": []}
+        transaction = db.begin()
+        try:
+            for config in configs:
+                if not config.get("allow_exe"):
+                    continue
+                script = config.get("file_path")
+                logger.info(f"service: profile_scripts | profiling file: {script}")
+                with open(script, "r") as file:
+                    sql = file.read()
+
+                for index, statement in enumerate(cls.split_statements(sql=sql)):
+                    keyword = cls._keyword(statement=statement)
+                    if keyword in profiles.TRANSACTION_CONTROL:
+                        continue
+                    entry = {
+                        "script": os.path.basename(script),
+                        "statement_index": index,
+                        "statement_hash": cls._statement_hash(statement=statement),
+                        "statement": statement,
+                        "plan": None,
+                        "error": None,
+                    }
+                    savepoint = db.begin_nested()
+                    try:
+                        if keyword in profiles.EXPLAINABLE:
+                            plan = db.execute(
+                                text(f"{profiles.EXPLAIN} {statement}")
+                            ).scalar()
+                            entry["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+                        else:
+                            db.execute(text(statement))
+                        savepoint.commit()
+                    except Exception as e:
+                        savepoint.rollback()
+                        entry["error"] = str(e)
+                        logger.error(
+                            f"service: profile_scripts | file: {script} | statement: {index} | error: {e}"
+                        )
+
+                    if entry["plan"]:
+                        for key, findings in cls._plan_findings(
+                            plan=entry["plan"][0]["Plan"]
+                        ).items():
+                            summary[key].extend(
+                                {
+                                    "script": entry["script"],
+                                    "statement_index": index,
+                                    "statement_hash": entry["statement_hash"],
+                                    **finding,
+                                }
+                                for finding in findings
+                            )
+                    statements.append(entry)
+        finally:
+            transaction.rollback()
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = os.path.join(os.getcwd(), report_dir, f"script_plans_{stamp}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump({"summary": summary, "statements": statements}, file, indent=2)
+        logger.info(
+            f"service: profile_scripts | seq_scans: {len(summary['seq_scans'])} | spills: {len(summary['spills'])} | misestimates: {len(summary['misestimates'])} | report: {path}"
+        )
+        return path
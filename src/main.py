@@ -1,10 +1,51 @@
+import argparse
+
 from .containers import DependencyManager
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="FFIEC data transformation")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip import files that are unchanged since their last load",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="explain and analyze every script statement, then roll the scripts back",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the latest run, skipping the imports and scripts it completed",
+    )
+    parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="share the run's tasks through the database queue with workers on any host",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="pull tasks of queued runs from the database queue until stopped",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     registry = DependencyManager.registry()
     registry.create_schema()
-    registry.process()
+    if args.worker:
+        registry.work()
+        return
+    registry.process(
+        incremental=args.incremental,
+        profile=args.profile,
+        resume=args.resume,
+        queue=args.queue,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+"""
+conftest
+
+Supplies the database settings `config` requires, so the handlers and containers import
+without an `.env` file. The tests never open a database connection.
+"""
+
+import os
+
+for key, value in {
+    "DB_DRIVER": "postgresql+psycopg2",
+    "DB_USRNM": "postgres",
+    "DB_PWD": "postgres",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "ffiec",
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,90 @@
+"""
+test_backfill
+
+Tests the expansion of prefix configurations into one configuration per period file by
+`ConfigHandler._backfill` and `ConfigHandler.create_config`.
+"""
+
+from src.constants.objects import FFEICConfig
+from src.handlers import ConfigHandler, ImportHandler
+
+
+def bhcf(backfill: bool = True) -> FFEICConfig:
+    return {
+        "name": "bhcf",
+        "key_type": "prefix",
+        "backfill": backfill,
+        "table_schema": "transformations",
+        "table_name": "tmp_bhcf",
+        "if_exists": "fail",
+        "sep": "^",
+        "allow_import": True,
+        "cols": ["RSSD9001"],
+    }
+
+
+FILES = {
+    "bhcf20240630": "/data/BHCF20240630.txt",
+    "attributes_active": "/data/CSV_ATTRIBUTES_ACTIVE.CSV",
+    "bhcf20231231": "/data/BHCF20231231.txt",
+    "bhcf": "/data/BHCF.txt",
+}
+
+
+def test_backfill_yields_one_config_per_period_in_order():
+    periods = ConfigHandler._backfill(config=bhcf(), file_dict=FILES)
+
+    assert [period["name"] for period in periods] == ["bhcf20231231", "bhcf20240630"]
+    assert [period["partition"] for period in periods] == ["20231231", "20240630"]
+    assert [period["file_path"] for period in periods] == [
+        "/data/BHCF20231231.txt",
+        "/data/BHCF20240630.txt",
+    ]
+
+
+def test_backfill_copies_keep_the_shared_target_and_options():
+    config = bhcf()
+
+    periods = ConfigHandler._backfill(config=config, file_dict=FILES)
+
+    for period in periods:
+        assert period["table_name"] == "tmp_bhcf"
+        assert period["if_exists"] == "fail"
+        assert period["cols"] == ["RSSD9001"]
+    assert "file_path" not in config
+
+
+def test_backfill_without_matching_files_is_empty():
+    assert ConfigHandler._backfill(config=bhcf(), file_dict={"attributes": "/a.csv"}) == []
+
+
+def test_backfill_children_are_named_after_their_period():
+    periods = ConfigHandler._backfill(config=bhcf(), file_dict=FILES)
+
+    assert [
+        ImportHandler._partition_name(table_name="tmp_bhcf", config=period)
+        for period in periods
+    ] == ["tmp_bhcf_20231231", "tmp_bhcf_20240630"]
+
+
+def test_create_config_expands_only_backfilled_prefixes():
+    attributes: FFEICConfig = {"name": "attributes_active", "table_name": "tmp_attributes"}
+
+    configs = ConfigHandler.create_config(
+        configs=[bhcf(), attributes], file_dict=FILES
+    )
+
+    assert [config["name"] for config in configs] == [
+        "bhcf20231231",
+        "bhcf20240630",
+        "attributes_active",
+    ]
+    assert configs[-1]["file_path"] == "/data/CSV_ATTRIBUTES_ACTIVE.CSV"
+
+
+def test_create_config_without_backfill_keeps_a_single_file():
+    configs = ConfigHandler.create_config(configs=[bhcf(backfill=False)], file_dict=FILES)
+
+    assert len(configs) == 1
+    assert configs[0]["name"] == "bhcf"
+    assert configs[0]["file_path"] in FILES.values()
@@ -0,0 +1,70 @@
+"""
+test_byte_ranges
+
+Tests the newline aligned byte ranges `ImportHandler._byte_ranges` splits a file into.
+"""
+
+import pytest
+
+from src.handlers import ImportHandler
+
+
+def write(tmp_path, rows: int) -> str:
+    path = tmp_path / "data.csv"
+    lines = ["ID,NAME\n"] + [f"{i},name {'x' * (i % 7)}\n" for i in range(rows)]
+    path.write_text("".join(lines))
+    return str(path)
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 16])
+def test_ranges_cover_data_rows_exactly_once(tmp_path, parts):
+    file = write(tmp_path, rows=100)
+    content = open(file, "rb").read()
+    header = content.index(b"\n") + 1
+
+    ranges = ImportHandler._byte_ranges(file=file, parts=parts)
+
+    assert ranges[0][0] == header
+    assert ranges[-1][1] == len(content)
+    assert all(hi == lo for (_, hi), (lo, _) in zip(ranges, ranges[1:]))
+    assert b"".join(content[lo:hi] for lo, hi in ranges) == content[header:]
+
+
+@pytest.mark.parametrize("parts", [2, 3, 7])
+def test_ranges_hold_whole_rows(tmp_path, parts):
+    file = write(tmp_path, rows=100)
+    content = open(file, "rb").read()
+
+    ranges = ImportHandler._byte_ranges(file=file, parts=parts)
+
+    assert len(ranges) == parts
+    for lo, hi in ranges:
+        assert content[lo - 1 : lo] == b"\n"
+        assert content[hi - 1 : hi] == b"\n"
+    rows = [line for lo, hi in ranges for line in content[lo:hi].splitlines()]
+    assert rows == content.splitlines()[1:]
+
+
+def test_small_file_yields_fewer_ranges_than_parts(tmp_path):
+    file = write(tmp_path, rows=2)
+
+    ranges = ImportHandler._byte_ranges(file=file, parts=8)
+
+    assert 1 <= len(ranges) <= 2
+    assert all(hi > lo for lo, hi in ranges)
+
+
+def test_header_only_file_yields_no_ranges(tmp_path):
+    file = write(tmp_path, rows=0)
+
+    assert ImportHandler._byte_ranges(file=file, parts=4) == []
+
+
+def test_file_without_trailing_newline_keeps_last_row(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("ID\n1\n2\n3")
+    content = path.read_bytes()
+
+    ranges = ImportHandler._byte_ranges(file=str(path), parts=2)
+
+    assert b"".join(content[lo:hi] for lo, hi in ranges) == b"1\n2\n3"
@@ -0,0 +1,64 @@
+"""
+test_chunk_dtypes
+
+Tests that every chunk of a file streamed by `ImportHandler.to_sql_handler` is parsed with the
+column types of the first rows, whichever chunk a missing value falls in.
+"""
+
+from typing import List
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from src.constants import loader as loaders
+from src.handlers import ImportHandler
+
+
+@pytest.fixture
+def written(monkeypatch) -> List[dict]:
+    frames: List[dict] = []
+
+    def write_frame(cls, conn, df, dtypes=None, **options) -> int:
+        frames.append({"df": df, "dtypes": dtypes})
+        return len(df)
+
+    monkeypatch.setattr(loaders, "SAMPLE_ROWS", 2)
+    monkeypatch.setattr(ImportHandler, "_write_frame", classmethod(write_frame))
+    return frames
+
+
+@pytest.mark.parametrize("writers", [1, 2])
+def test_chunks_keep_the_types_of_the_first_rows(tmp_path, written, writers):
+    # ID is missing in the second chunk only, NOTE is empty throughout the first chunk
+    file = tmp_path / "data.csv"
+    file.write_text("ID,NOTE\n1,\n2,\n3,x\n,y\n5,\n")
+
+    row_count = ImportHandler.to_sql_handler(
+        engine=create_engine("sqlite://"),
+        file=str(file),
+        table_schema="main",
+        table_name="data",
+        if_exists="replace",
+        sep=",",
+        cols=[],
+        allow_import=True,
+        chunksize=2,
+        writers=writers,
+    )
+
+    assert row_count == 5
+    pinned = {"id": {"type": "bigint"}, "note": {"type": "string"}}
+    assert all(frame["dtypes"] == pinned for frame in written)
+    chunks = [frame["df"] for frame in written if len(frame["df"])]
+    assert [str(df["id"].dtype) for df in chunks] == ["Int64"] * 3
+    assert [str(df["note"].dtype) for df in chunks] == ["string"] * 3
+    assert pd.concat(chunks)["id"].astype("string").tolist() == ["1", "2", "3", pd.NA, "5"]
+
+
+def test_declared_types_take_precedence_over_the_sample():
+    sample = pd.DataFrame({"id": [1, 2], "note": [None, None], "amount": [1.5, None]})
+
+    inferred = ImportHandler._infer_dtypes(df=sample, dtypes={"id": {"type": "integer"}})
+
+    assert inferred == {"id": {"type": "integer"}, "note": {"type": "string"}}
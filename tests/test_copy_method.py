@@ -0,0 +1,75 @@
+"""
+test_copy_method
+
+Tests the rows `ImportHandler._copy_method` streams through `COPY ... FROM STDIN` for chunks
+of one file whose missing values fall in different columns.
+"""
+
+from types import SimpleNamespace
+from typing import List
+
+import pandas as pd
+from pandas.io.sql import SQLDatabase, SQLTable
+from sqlalchemy import create_engine
+
+from src.constants import loader as loaders
+from src.handlers import ImportHandler
+
+
+class Cursor:
+    """Captures the statement and CSV payload passed to `copy_expert`."""
+
+    def __init__(self, copies: List[tuple]):
+        self.copies = copies
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql: str, file) -> None:
+        payload = file.read()
+        self.copies.append((sql, payload))
+        self.rowcount = payload.count("\n")
+
+
+def copy(df: pd.DataFrame, copies: List[tuple]) -> int:
+    with create_engine("sqlite://").connect() as conn:
+        table = SQLTable("data", SQLDatabase(conn), frame=df, index=False, schema="ffiec")
+        keys, data = table.insert_data()
+    cursor = SimpleNamespace(cursor=lambda: Cursor(copies))
+    return ImportHandler._copy_method(
+        table=table,
+        conn=SimpleNamespace(connection=cursor),
+        keys=keys,
+        data_iter=zip(*data),
+    )
+
+
+def test_chunks_with_different_null_patterns(tmp_path, monkeypatch):
+    # the first chunk misses NOTE, the second misses ID and holds a blank NOTE
+    monkeypatch.setattr(loaders, "SAMPLE_ROWS", 2)
+    file = tmp_path / "data.csv"
+    file.write_text("ID,NOTE\n1,\n2,a\n,b\n4, \n")
+    sample = ImportHandler._sample(file=str(file), sep=",", cols=[])
+    frames = ImportHandler._read_frames(
+        file=str(file),
+        sep=",",
+        cols=[],
+        chunksize=2,
+        dtypes=ImportHandler._infer_dtypes(df=sample, dtypes={}),
+        cleansing={"trim": ["note"]},
+    )
+    copies: List[tuple] = []
+
+    assert [copy(df=df, copies=copies) for df in frames] == [2, 2]
+    assert [sql for sql, _ in copies] == [
+        'COPY "ffiec"."data" ("id", "note") FROM STDIN WITH (FORMAT csv)'
+    ] * 2
+    # integers keep their form, null is unquoted and a blank stays an empty string
+    assert [payload.splitlines() for _, payload in copies] == [
+        ['"1",', '"2","a"'],
+        [',"b"', '"4",""'],
+    ]
@@ -0,0 +1,100 @@
+"""
+test_heartbeat
+
+Tests that `WorkerContainer.work` refreshes the claim of a task while it runs and completes it
+only under the claim it made, with the queue replaced so no database is needed.
+"""
+
+import time
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.constants import queue
+from src.containers.worker import WorkerContainer
+
+TASK = {
+    "id": 7,
+    "run_id": "run",
+    "stage": "index",
+    "task": "index",
+    "options": {},
+    "attempts": 2,
+}
+
+
+class Queue:
+    """Hands out one task and records the heartbeats and completions it receives."""
+
+    def __init__(self, claimed: bool = True):
+        self.tasks = [TASK]
+        self.heartbeats: List[dict] = []
+        self.completed: List[dict] = []
+        self.claimed = claimed
+
+    def claim(self, db, worker, run_id=None):
+        return self.tasks.pop() if self.tasks else None
+
+    def heartbeat(self, db, **claim) -> bool:
+        self.heartbeats.append(claim)
+        return self.claimed
+
+    def complete(self, db, **claim) -> bool:
+        self.completed.append(claim)
+        return self.claimed
+
+    def hold_blocked(self, db, run_id):
+        return 0
+
+    def run_status(self, db, run_id):
+        return {queue.DONE: 1}
+
+
+@pytest.fixture(autouse=True)
+def interval(monkeypatch):
+    monkeypatch.setattr(queue, "HEARTBEAT_INTERVAL", 0.01)
+
+
+def work(queue_: Queue, seconds: float) -> WorkerContainer:
+    container = WorkerContainer(
+        import_=None,
+        script=None,
+        session=SimpleNamespace(get_postgres_session_factory=lambda: nullcontext),
+        queue_=queue_,
+    )
+    container.run_task = lambda task: time.sleep(seconds)
+    return container.work(run_id="run")
+
+
+def test_claim_is_refreshed_while_the_task_runs():
+    queue_ = Queue()
+
+    assert work(queue_, seconds=0.2) == {queue.DONE: 1}
+    assert len(queue_.heartbeats) > 2
+    worker = queue_.completed[0]["worker"]
+    assert all(
+        claim == {"task_id": 7, "worker": worker, "attempts": 2} for claim in queue_.heartbeats
+    )
+    assert queue_.completed == [
+        {"task_id": 7, "worker": worker, "attempts": 2, "error": None}
+    ]
+
+
+def test_heartbeat_stops_once_the_claim_is_lost():
+    queue_ = Queue(claimed=False)
+
+    work(queue_, seconds=0.2)
+
+    assert len(queue_.heartbeats) == 1
+    assert len(queue_.completed) == 1
+
+
+def test_heartbeat_stops_with_the_task():
+    queue_ = Queue()
+
+    work(queue_, seconds=0)
+    time.sleep(0.05)
+
+    assert len(queue_.heartbeats) <= 1
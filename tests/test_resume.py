@@ -0,0 +1,170 @@
+"""
+test_resume
+
+Tests how `ScriptContainer.dag_scripts` resumes the scripts of a run from its checkpoints and
+which scripts it runs when only some imported tables changed, with the database calls of the
+script handler replaced so no database is needed.
+"""
+
+from contextlib import nullcontext
+from typing import Dict, List
+
+import pytest
+
+from src.containers.script import ScriptContainer
+from src.handlers import ScriptHandler
+
+
+def script(name: str, inputs: List[str], outputs: List[str]) -> dict:
+    return {
+        "name": name,
+        "file_path": name,
+        "description": name,
+        "allow_exe": True,
+        "inputs": inputs,
+        "outputs": outputs,
+    }
+
+
+SCRIPTS = [
+    script("015_fips_load", ["tmp_county_codes"], ["county_cds"]),
+    script("016_naics", ["tmp_naics"], ["naics"]),
+]
+CLEANUP = [script("099_cleanup", [], ["tmp_codes"])]
+
+
+class Config:
+    """Script categories of the container, only the transformation scripts are declared."""
+
+    def __init__(self, cleanup: List[dict] | None = None):
+        self.cleanup = cleanup or []
+
+    def preflight_scripts(self):
+        return [{"name": "001_preflight"}]
+
+    def import_preflight_scripts(self):
+        return [{"name": "001_preflight_imports"}]
+
+    def dependency_scripts(self):
+        return [{"name": "002_functions"}, {"name": "004_tmp_tables"}]
+
+    def gov_identifier_scripts(self):
+        return SCRIPTS
+
+    def cleanup_scripts(self):
+        return self.cleanup
+
+    attribute_scripts = relationship_scripts = transformation_scripts = (
+        call_report_scripts
+    ) = lambda self: []
+
+
+class Handler:
+    """Records the calls the container makes instead of running them on a database."""
+
+    def __init__(self, checkpoints: Dict[str, str], fingerprints: Dict[str, str]):
+        self.calls: List[str] = []
+        self.recorded: Dict[str, str] = {}
+        self._checkpoints = checkpoints
+        self._fingerprints = fingerprints
+
+    def execute_scripts(self, db, configs):
+        self.calls.extend(config["name"] for config in configs)
+
+    def load_codes(self, db, codes):
+        self.calls.append("load_codes")
+
+    def script_fingerprints(self, db, configs):
+        return {config["name"]: self._fingerprints[config["name"]] for config in configs}
+
+    def checkpoints(self, db, run_id, stage):
+        return dict(self._checkpoints)
+
+    def record_checkpoint(self, db, run_id, stage, item, fingerprint=None):
+        self.recorded[item] = fingerprint
+
+    def downstream(self, **kwargs):
+        return ScriptHandler.downstream(**kwargs)
+
+    def execute_dag(self, **kwargs):
+        return ScriptHandler.execute_dag(**kwargs)
+
+
+@pytest.fixture
+def executed(monkeypatch) -> List[str]:
+    order: List[str] = []
+
+    def runner(cls, session_factory, script: str) -> bool:
+        order.append(script)
+        return True
+
+    monkeypatch.setattr(ScriptHandler, "_session_runner", classmethod(runner))
+    return order
+
+
+def dag_scripts(
+    handler: Handler, resume: bool = True, config: Config | None = None, **options
+):
+    container = ScriptContainer(config=config or Config(), script_handler=handler)
+    return container.dag_scripts(
+        session_factory=nullcontext, workers=2, run_id="run", resume=resume, **options
+    )
+
+
+def test_resume_skips_scripts_whose_fingerprint_matches(executed):
+    handler = Handler(
+        checkpoints={"015_fips_load": "a"},
+        fingerprints={"015_fips_load": "a", "016_naics": "b"},
+    )
+
+    assert dag_scripts(handler) == set()
+    assert executed == ["016_naics"]
+    assert handler.calls == []
+    assert handler.recorded == {"016_naics": "b"}
+
+
+def test_resume_with_stale_fingerprint_recreates_tmp_tables_and_reruns_every_script(executed):
+    # the county codes were reloaded after 015 completed, the staging tables are kept
+    handler = Handler(
+        checkpoints={"015_fips_load": "a", "016_naics": "b"},
+        fingerprints={"015_fips_load": "reloaded", "016_naics": "b"},
+    )
+
+    assert dag_scripts(handler) == set()
+    assert handler.calls == ["001_preflight", "002_functions", "004_tmp_tables", "load_codes"]
+    assert sorted(executed) == ["015_fips_load", "016_naics"]
+    assert handler.recorded == {"015_fips_load": "reloaded", "016_naics": "b"}
+
+
+def test_new_run_ignores_checkpoints(executed):
+    handler = Handler(
+        checkpoints={"015_fips_load": "a", "016_naics": "b"},
+        fingerprints={"015_fips_load": "a", "016_naics": "b"},
+    )
+
+    assert dag_scripts(handler, resume=False) == set()
+    assert sorted(executed) == ["015_fips_load", "016_naics"]
+    assert handler.calls == []
+
+
+def test_changed_tables_run_their_readers_and_the_cleanup(executed):
+    handler = Handler(checkpoints={}, fingerprints={"016_naics": "b", "099_cleanup": "c"})
+
+    failed = dag_scripts(
+        handler, resume=False, config=Config(cleanup=CLEANUP), tables={"tmp_naics"}
+    )
+
+    assert failed == set()
+    assert executed == ["016_naics", "099_cleanup"]
+    assert handler.recorded == {"016_naics": "b", "099_cleanup": "c"}
+
+
+def test_changed_tables_without_readers_run_no_script(executed):
+    handler = Handler(checkpoints={}, fingerprints={})
+
+    failed = dag_scripts(
+        handler, resume=False, config=Config(cleanup=CLEANUP), tables={"tmp_unread"}
+    )
+
+    assert failed == set()
+    assert executed == []
@@ -0,0 +1,86 @@
+"""
+test_schedule
+
+Tests the longest predicted first ordering of import categories by
+`WorkerContainer._schedule` and its predicted makespan.
+"""
+
+from typing import Callable, Dict, List
+
+import pytest
+
+from src.containers.worker import WorkerContainer
+
+
+def tasks(*names: str) -> List[Callable]:
+    def task(name: str) -> Callable:
+        def func():
+            return name
+
+        func.__name__ = name
+        return func
+
+    return [task(name) for name in names]
+
+
+def schedule(
+    names: List[str], costs: Dict[str, float], workers: int
+) -> tuple[List[str], float]:
+    container = WorkerContainer(import_=None, script=None, session=None, queue_=None)
+    ordered, predicted = container._schedule(tasks=tasks(*names), costs=costs, workers=workers)
+    return [func.__name__ for func in ordered], predicted
+
+
+def test_orders_longest_predicted_first():
+    order, predicted = schedule(
+        names=["a", "b", "c", "d", "e"],
+        costs={"a": 1.0, "b": 10.0, "c": 3.0, "d": 3.0, "e": 2.0},
+        workers=2,
+    )
+
+    assert order == ["b", "c", "d", "e", "a"]
+    assert predicted == pytest.approx(10.0)
+
+
+def test_predicts_the_makespan_of_greedy_assignment():
+    # b and c start, a follows c at 5, d follows b at 6 and e follows a at 9
+    order, predicted = schedule(
+        names=["a", "b", "c", "d", "e"],
+        costs={"a": 4.0, "b": 6.0, "c": 5.0, "d": 4.0, "e": 3.0},
+        workers=2,
+    )
+
+    assert order == ["b", "c", "a", "d", "e"]
+    assert predicted == pytest.approx(12.0)
+
+
+def test_single_worker_predicts_the_sum():
+    _, predicted = schedule(names=["a", "b", "c"], costs={"a": 1.0, "b": 2.0, "c": 3.0}, workers=1)
+
+    assert predicted == pytest.approx(6.0)
+
+
+def test_more_workers_than_tasks_predicts_the_longest():
+    _, predicted = schedule(names=["a", "b"], costs={"a": 1.5, "b": 2.5}, workers=8)
+
+    assert predicted == pytest.approx(2.5)
+
+
+def test_tasks_without_load_history_run_last():
+    order, predicted = schedule(
+        names=["new", "a", "other", "b"], costs={"a": 2.0, "b": 5.0}, workers=2
+    )
+
+    assert order[:2] == ["b", "a"]
+    assert sorted(order[2:]) == ["new", "other"]
+    assert predicted == pytest.approx(5.0)
+
+
+def test_ties_keep_the_category_order():
+    order, _ = schedule(names=["a", "b", "c"], costs={}, workers=2)
+
+    assert order == ["a", "b", "c"]
+
+
+def test_no_tasks_predicts_nothing():
+    assert schedule(names=[], costs={}, workers=4) == ([], 0.0)
@@ -0,0 +1,191 @@
+"""
+test_script_dag
+
+Tests the dependency graph derived by `ScriptHandler.build_dag`, the scripts
+`ScriptHandler.downstream` selects from it and its execution by `ScriptHandler.execute_dag`,
+with script execution replaced so no database is needed.
+"""
+
+import threading
+from typing import List
+
+import pytest
+
+from src.constants import script as scripts
+from src.constants.objects import ScriptsConfig
+from src.handlers import ScriptHandler
+
+
+def script(name: str, inputs=None, outputs=None, allow_exe: bool = True) -> ScriptsConfig:
+    config = {"name": name, "file_path": name, "description": name, "allow_exe": allow_exe}
+    if inputs is not None:
+        config["inputs"] = inputs
+    if outputs is not None:
+        config["outputs"] = outputs
+    return config
+
+
+@pytest.fixture
+def executed(monkeypatch) -> List[str]:
+    """Replaces script execution, a script named `fail*` fails and the rest succeed."""
+    order: List[str] = []
+    lock = threading.Lock()
+
+    def runner(cls, session_factory, script: str) -> bool:
+        with lock:
+            order.append(script)
+        return not script.startswith("fail")
+
+    monkeypatch.setattr(ScriptHandler, "_session_runner", classmethod(runner))
+    return order
+
+
+def test_build_dag_reader_depends_on_writer():
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("load", inputs=["tmp_raw"], outputs=["tmp_inst"]),
+            script("report", inputs=["tmp_inst"], outputs=["report"]),
+        ]
+    )
+
+    assert dag == {"load": set(), "report": {"load"}}
+
+
+def test_build_dag_independent_scripts_have_no_edges():
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("inst", inputs=["tmp_raw"], outputs=["tmp_inst"]),
+            script("codes", inputs=["tmp_raw"], outputs=["tmp_codes"]),
+        ]
+    )
+
+    assert dag == {"inst": set(), "codes": set()}
+
+
+def test_build_dag_orders_write_after_write():
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("create", outputs=["tmp_inst"]),
+            script("update", outputs=["tmp_inst"]),
+        ]
+    )
+
+    assert dag["update"] == {"create"}
+
+
+def test_build_dag_orders_write_after_read():
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("read", inputs=["tmp_inst"], outputs=["report"]),
+            script("drop", outputs=["tmp_inst"]),
+        ]
+    )
+
+    assert dag["drop"] == {"read"}
+
+
+def test_build_dag_undeclared_script_is_a_barrier():
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("first", outputs=["a"]),
+            script("barrier"),
+            script("last", outputs=["b"]),
+        ]
+    )
+
+    # the later script reaches the earlier one through the barrier
+    assert dag == {"first": set(), "barrier": {"first"}, "last": {"barrier"}}
+
+
+def test_build_dag_follows_reference_order_so_it_has_no_cycles():
+    # each script writes what the other reads, only the earlier one is a dependency
+    dag = ScriptHandler.build_dag(
+        configs=[
+            script("a", inputs=["y"], outputs=["x"]),
+            script("b", inputs=["x"], outputs=["y"]),
+        ]
+    )
+
+    assert dag == {"a": set(), "b": {"a"}}
+
+
+def test_downstream_follows_dependents_of_the_readers():
+    configs = [
+        script("a", inputs=["t1"], outputs=["x"]),
+        script("b", inputs=["x"], outputs=["y"]),
+        script("c", inputs=["t2"], outputs=["z"]),
+    ]
+
+    assert ScriptHandler.downstream(configs=configs, tables={"t1"}) == {"a", "b"}
+    assert ScriptHandler.downstream(configs=configs, tables={"t2"}) == {"c"}
+    assert ScriptHandler.downstream(configs=configs, tables=set()) == set()
+
+
+def test_downstream_names_undeclared_scripts():
+    configs = [script("a", inputs=["t1"], outputs=["x"]), script("barrier")]
+
+    assert ScriptHandler.downstream(configs=configs, tables={"t2"}) == {"barrier"}
+
+
+def test_downstream_of_the_declared_scripts():
+    configs = [
+        *scripts.ATTRIBUTES,
+        *scripts.RELATIONSHIPS,
+        *scripts.TRANSFORMATIONS,
+        *scripts.GOV_IDENTIFIERS,
+        *scripts.CALL_REPORTS,
+        *scripts.CLEANUP,
+    ]
+
+    assert ScriptHandler.downstream(configs=configs, tables={"tmp_naics"}) == {"016_naics"}
+    assert ScriptHandler.downstream(configs=configs, tables={"tmp_relationships"}) == {
+        "011_relationships",
+        "012_relationships_load",
+        "099_cleanup",
+    }
+
+
+def test_execute_dag_runs_dependencies_first(executed):
+    configs = [
+        script("load", outputs=["tmp_inst"]),
+        script("report", inputs=["tmp_inst"], outputs=["report"]),
+        script("export", inputs=["report"], outputs=["export"]),
+    ]
+
+    failed = ScriptHandler.execute_dag(session_factory=None, configs=configs, workers=4)
+
+    assert failed == set()
+    assert executed == ["load", "report", "export"]
+
+
+def test_execute_dag_holds_back_dependents_of_a_failure(executed):
+    configs = [
+        script("fail_load", outputs=["tmp_inst"]),
+        script("codes", outputs=["tmp_codes"]),
+        script("report", inputs=["tmp_inst"], outputs=["report"]),
+        script("export", inputs=["report"], outputs=["export"]),
+    ]
+    completed: List[str] = []
+
+    failed = ScriptHandler.execute_dag(
+        session_factory=None, configs=configs, workers=2, on_complete=completed.append
+    )
+
+    assert failed == {"fail_load", "report", "export"}
+    assert sorted(executed) == ["codes", "fail_load"]
+    assert completed == ["codes"]
+
+
+def test_execute_dag_skips_completed_and_disallowed_scripts(executed):
+    configs = [
+        script("load", outputs=["tmp_inst"]),
+        script("disabled", outputs=["tmp_other"], allow_exe=False),
+        script("report", inputs=["tmp_inst"], outputs=["report"]),
+    ]
+
+    failed = ScriptHandler.execute_dag(
+        session_factory=None, configs=configs, workers=2, completed=["load"]
+    )
+
+    assert failed == set()
+    assert executed == ["report"]
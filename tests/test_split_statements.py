@@ -0,0 +1,85 @@
+"""
+test_split_statements
+
+Tests how `ScriptHandler.split_statements` splits SQL scripts into statements.
+"""
+
+from src.handlers import ScriptHandler
+
+
+def test_splits_on_semicolons():
+    sql = "create table a (id int);\ninsert into a values (1);\n"
+
+    assert ScriptHandler.split_statements(sql=sql) == [
+        "create table a (id int)",
+        "insert into a values (1)",
+    ]
+
+
+def test_keeps_trailing_statement_without_semicolon():
+    sql = "select 1;\nselect 2"
+
+    assert ScriptHandler.split_statements(sql=sql) == ["select 1", "select 2"]
+
+
+def test_skips_empty_statements():
+    assert ScriptHandler.split_statements(sql=";;\n  ;select 1;;") == ["select 1"]
+
+
+def test_keeps_semicolons_in_single_quotes():
+    sql = "insert into a values ('x;y', 'it''s; fine');select 1;"
+
+    assert ScriptHandler.split_statements(sql=sql) == [
+        "insert into a values ('x;y', 'it''s; fine')",
+        "select 1",
+    ]
+
+
+def test_keeps_semicolons_in_double_quoted_identifiers():
+    sql = 'select "odd;name" from a;'
+
+    assert ScriptHandler.split_statements(sql=sql) == ['select "odd;name" from a']
+
+
+def test_keeps_dollar_quoted_bodies():
+    sql = (
+        "create function f() returns int as $$ begin return 1; end; $$ language plpgsql;\n"
+        "do $body$ begin perform 1; end $body$;\n"
+        "select $1"
+    )
+
+    assert ScriptHandler.split_statements(sql=sql) == [
+        "create function f() returns int as $$ begin return 1; end; $$ language plpgsql",
+        "do $body$ begin perform 1; end $body$",
+        "select $1",
+    ]
+
+
+def test_nested_dollar_tags_close_on_their_own_tag():
+    sql = "do $outer$ begin execute $$select 1; select 2$$; end $outer$; select 3;"
+
+    assert ScriptHandler.split_statements(sql=sql) == [
+        "do $outer$ begin execute $$select 1; select 2$$; end $outer$",
+        "select 3",
+    ]
+
+
+def test_drops_comments():
+    sql = (
+        "-- leading comment; not a statement\n"
+        "select 1; -- trailing; comment\n"
+        "/* block; comment */ select 2;\n"
+        "/* unterminated; block"
+    )
+
+    statements = ScriptHandler.split_statements(sql=sql)
+
+    assert [" ".join(statement.split()) for statement in statements] == ["select 1", "select 2"]
+
+
+def test_comment_markers_in_quotes_are_kept():
+    sql = "select '-- not a comment;', '/* nor; this */';"
+
+    assert ScriptHandler.split_statements(sql=sql) == [
+        "select '-- not a comment;', '/* nor; this */'"
+    ]
@@ -0,0 +1,85 @@
+"""
+test_staging_scripts
+
+Checks that the scripts of a run only read the imported staging tables. Incremental and resumed
+runs keep those tables and run the scripts against them again without reloading them, so a
+script that alters, updates or deletes from one fails or changes its result the second time.
+"""
+
+import os
+import re
+from typing import List
+
+import pytest
+
+from src.constants import imports, script
+from src.constants.objects import ScriptsConfig
+
+SCRIPTS: List[ScriptsConfig] = [
+    *script.PREFLIGHT,
+    *script.DEPENDENCIES,
+    *script.ATTRIBUTES,
+    *script.RELATIONSHIPS,
+    *script.TRANSFORMATIONS,
+    *script.GOV_IDENTIFIERS,
+    *script.CALL_REPORTS,
+    *script.CLEANUP,
+]
+
+STAGING = {
+    config["table_name"]
+    for config in [
+        *imports.BHCF,
+        *imports.ATTRIBUTES,
+        *imports.RELATIONSHIPS,
+        *imports.TRANSFORMATIONS,
+        *imports.GOV_IDENTIFIERS,
+    ]
+}
+
+DIRECTORY = os.path.join(os.path.dirname(__file__), os.pardir, "scripts")
+
+WRITES = re.compile(
+    r"\b(alter\s+table|update|delete\s+from|truncate(?:\s+table)?|drop\s+table|insert\s+into)"
+    r"\s+(?:if\s+exists\s+)?(?:only\s+)?(?:\"?transformations\"?\.)?\"?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def writes(config: ScriptsConfig, directory: str = DIRECTORY) -> List[str]:
+    with open(os.path.join(directory, f"{config['name']}.sql")) as file:
+        sql = file.read()
+    sql = re.sub(r"/\*.*?\*/", " ", sql, flags=re.DOTALL)
+    sql = re.sub(r"--[^\n]*", " ", sql)
+    return [
+        f"{match.group(1).lower()} {match.group(2)}"
+        for match in WRITES.finditer(sql)
+        if match.group(2).lower() in STAGING
+    ]
+
+
+@pytest.mark.parametrize("config", SCRIPTS, ids=[config["name"] for config in SCRIPTS])
+def test_scripts_only_read_imported_staging_tables(config):
+    assert writes(config) == []
+
+
+def test_check_detects_writes_to_staging_tables(tmp_path):
+    (tmp_path / "rewrite.sql").write_text(
+        "-- delete from tmp_naics\n"
+        'alter table tmp_county_codes add column "uuid" uuid;\n'
+        "update transformations.tmp_country_codes set country = trim(country);\n"
+        "insert into county_cds select * from tmp_county_codes;\n"
+    )
+
+    assert writes({"name": "rewrite"}, directory=str(tmp_path)) == [
+        "alter table tmp_county_codes",
+        "update tmp_country_codes",
+    ]
+
+
+def test_scripts_do_not_declare_imported_staging_tables_as_outputs():
+    declared = {
+        config["name"]: sorted(set(config.get("outputs", [])) & STAGING) for config in SCRIPTS
+    }
+
+    assert declared == {config["name"]: [] for config in SCRIPTS}